@@ -433,6 +433,7 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleSpawnBlueprintAct
     // Get transform parameters
     FVector Location(0.0f, 0.0f, 0.0f);
     FRotator Rotation(0.0f, 0.0f, 0.0f);
+    FVector Scale(1.0f, 1.0f, 1.0f);
 
     if (Params->HasField(TEXT("location")))
     {
@@ -444,6 +445,12 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleSpawnBlueprintAct
         Rotation = FEpicUnrealMCPCommonUtils::GetRotatorFromJson(Params, TEXT("rotation"));
         UE_LOG(LogTemp, Warning, TEXT("HandleSpawnBlueprintActor: Rotation set to (%f, %f, %f)"), Rotation.Pitch, Rotation.Yaw, Rotation.Roll);
     }
+    // Optional actor scale, applied at spawn so no follow-up set_actor_transform is needed
+    if (Params->HasField(TEXT("scale")))
+    {
+        Scale = FEpicUnrealMCPCommonUtils::GetVectorFromJson(Params, TEXT("scale"));
+        UE_LOG(LogTemp, Warning, TEXT("HandleSpawnBlueprintActor: Scale set to (%f, %f, %f)"), Scale.X, Scale.Y, Scale.Z);
+    }
 
     UE_LOG(LogTemp, Warning, TEXT("HandleSpawnBlueprintActor: Getting editor world"));
 
@@ -460,6 +467,7 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleSpawnBlueprintAct
     FTransform SpawnTransform;
     SpawnTransform.SetLocation(Location);
     SpawnTransform.SetRotation(FQuat(Rotation));
+    SpawnTransform.SetScale3D(Scale);
 
     // Add a small delay to allow the engine to process the newly compiled class
     FPlatformProcess::Sleep(0.2f);
@@ -632,6 +640,21 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleSetMeshMaterialCo
     FString ParameterName = TEXT("BaseColor");
     Params->TryGetStringField(TEXT("parameter_name"), ParameterName);
 
+    // Optional list of parameter names, all set on the same dynamic material instance
+    TArray<FString> ParameterNames;
+    const TArray<TSharedPtr<FJsonValue>>* ParameterNamesJsonArray;
+    if (Params->TryGetArrayField(TEXT("parameter_names"), ParameterNamesJsonArray))
+    {
+        for (const TSharedPtr<FJsonValue>& Value : *ParameterNamesJsonArray)
+        {
+            ParameterNames.Add(Value->AsString());
+        }
+    }
+    if (ParameterNames.Num() == 0)
+    {
+        ParameterNames.Add(ParameterName);
+    }
+
     // Get or create material
     UMaterialInterface* Material = nullptr;
     
@@ -667,8 +690,11 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleSetMeshMaterialCo
         return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Failed to create dynamic material instance"));
     }
 
-    // Set the color parameter
-    DynMaterial->SetVectorParameterValue(*ParameterName, Color);
+    // Set the color parameters
+    for (const FString& Name : ParameterNames)
+    {
+        DynMaterial->SetVectorParameterValue(*Name, Color);
+    }
 
     // Apply the material to the component
     PrimComponent->SetMaterial(MaterialSlot, DynMaterial);
@@ -684,6 +710,13 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPBlueprintCommands::HandleSetMeshMaterialCo
     ResultObj->SetStringField(TEXT("component"), ComponentName);
     ResultObj->SetNumberField(TEXT("material_slot"), MaterialSlot);
     ResultObj->SetStringField(TEXT("parameter_name"), ParameterName);
+
+    TArray<TSharedPtr<FJsonValue>> ParameterNamesResultArray;
+    for (const FString& Name : ParameterNames)
+    {
+        ParameterNamesResultArray.Add(MakeShared<FJsonValueString>(Name));
+    }
+    ResultObj->SetArrayField(TEXT("parameter_names"), ParameterNamesResultArray);
     
     TArray<TSharedPtr<FJsonValue>> ColorResultArray;
     ColorResultArray.Add(MakeShared<FJsonValueNumber>(Color.R));
@@ -16,6 +16,7 @@
 #include "Engine/SpotLight.h"
 #include "Camera/CameraActor.h"
 #include "Components/StaticMeshComponent.h"
+#include "Components/InstancedStaticMeshComponent.h"
 #include "EditorSubsystem.h"
 #include "Subsystems/EditorActorSubsystem.h"
 #include "Engine/Blueprint.h"
@@ -42,6 +43,18 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleCommand(const FStrin
     {
         return HandleSpawnActor(Params);
     }
+    else if (CommandType == TEXT("batch_spawn"))
+    {
+        return HandleBatchSpawn(Params);
+    }
+    else if (CommandType == TEXT("spawn_instanced_static_mesh"))
+    {
+        return HandleSpawnInstancedStaticMesh(Params);
+    }
+    else if (CommandType == TEXT("spawn_composite_actors"))
+    {
+        return HandleSpawnCompositeActors(Params);
+    }
     else if (CommandType == TEXT("delete_actor"))
     {
         return HandleDeleteActor(Params);
@@ -55,6 +68,11 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleCommand(const FStrin
     {
         return HandleSpawnBlueprintActor(Params);
     }
+    // Viewport commands
+    else if (CommandType == TEXT("set_viewport_realtime"))
+    {
+        return HandleSetViewportRealtime(Params);
+    }
     
     return FEpicUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Unknown editor command: %s"), *CommandType));
 }
@@ -107,13 +125,6 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleFindActorsByName(con
 
 TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleSpawnActor(const TSharedPtr<FJsonObject>& Params)
 {
-    // Get required parameters
-    FString ActorType;
-    if (!Params->TryGetStringField(TEXT("type"), ActorType))
-    {
-        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'type' parameter"));
-    }
-
     // Get actor name (required parameter)
     FString ActorName;
     if (!Params->TryGetStringField(TEXT("name"), ActorName))
@@ -121,44 +132,508 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleSpawnActor(const TSh
         return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'name' parameter"));
     }
 
-    // Get optional transform parameters
-    FVector Location(0.0f, 0.0f, 0.0f);
-    FRotator Rotation(0.0f, 0.0f, 0.0f);
-    FVector Scale(1.0f, 1.0f, 1.0f);
-
-    if (Params->HasField(TEXT("location")))
+    UWorld* World = GEditor->GetEditorWorldContext().World();
+    if (!World)
     {
-        Location = FEpicUnrealMCPCommonUtils::GetVectorFromJson(Params, TEXT("location"));
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Failed to get editor world"));
     }
-    if (Params->HasField(TEXT("rotation")))
+
+    // Check if an actor with this name already exists
+    TArray<AActor*> AllActors;
+    UGameplayStatics::GetAllActorsOfClass(World, AActor::StaticClass(), AllActors);
+    for (AActor* Actor : AllActors)
     {
-        Rotation = FEpicUnrealMCPCommonUtils::GetRotatorFromJson(Params, TEXT("rotation"));
+        if (Actor && Actor->GetName() == ActorName)
+        {
+            return FEpicUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Actor with name '%s' already exists"), *ActorName));
+        }
     }
-    if (Params->HasField(TEXT("scale")))
+
+    return SpawnActorInWorld(World, Params, ActorName);
+}
+
+TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleBatchSpawn(const TSharedPtr<FJsonObject>& Params)
+{
+    const TArray<TSharedPtr<FJsonValue>>* ActorSpecs = nullptr;
+    if (!Params->TryGetArrayField(TEXT("actors"), ActorSpecs))
     {
-        Scale = FEpicUnrealMCPCommonUtils::GetVectorFromJson(Params, TEXT("scale"));
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'actors' parameter"));
     }
 
-    // Create the actor based on type
-    AActor* NewActor = nullptr;
     UWorld* World = GEditor->GetEditorWorldContext().World();
+    if (!World)
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Failed to get editor world"));
+    }
+
+    bool bAutoUniqueName = true;
+    Params->TryGetBoolField(TEXT("auto_unique_name"), bAutoUniqueName);
+
+    // Optional lookup tables so specs can reference shared scales/meshes by index
+    const TArray<TSharedPtr<FJsonValue>>* ScaleTable = nullptr;
+    const TArray<TSharedPtr<FJsonValue>>* MeshTable = nullptr;
+    Params->TryGetArrayField(TEXT("scales"), ScaleTable);
+    Params->TryGetArrayField(TEXT("meshes"), MeshTable);
+
+    // Optional fields shared by every spec; per-actor fields take precedence
+    const TSharedPtr<FJsonObject>* Defaults = nullptr;
+    Params->TryGetObjectField(TEXT("defaults"), Defaults);
+
+    // Collect existing names once instead of scanning the level for every actor
+    TSet<FString> ExistingNames;
+    TArray<AActor*> AllActors;
+    UGameplayStatics::GetAllActorsOfClass(World, AActor::StaticClass(), AllActors);
+    ExistingNames.Reserve(AllActors.Num() + ActorSpecs->Num());
+    for (AActor* Actor : AllActors)
+    {
+        if (Actor)
+        {
+            ExistingNames.Add(Actor->GetName());
+        }
+    }
+
+    TArray<TSharedPtr<FJsonValue>> Results;
+    Results.Reserve(ActorSpecs->Num());
+    int32 SpawnedCount = 0;
+
+    for (const TSharedPtr<FJsonValue>& SpecValue : *ActorSpecs)
+    {
+        TSharedPtr<FJsonObject> Entry = MakeShared<FJsonObject>();
+        const TSharedPtr<FJsonObject>* SpecObject = nullptr;
+        FString OriginalName;
+
+        if (!SpecValue.IsValid() || !SpecValue->TryGetObject(SpecObject) || !(*SpecObject)->TryGetStringField(TEXT("name"), OriginalName))
+        {
+            Entry->SetStringField(TEXT("status"), TEXT("error"));
+            Entry->SetStringField(TEXT("error"), TEXT("Missing 'name' parameter"));
+            Results.Add(MakeShared<FJsonValueObject>(Entry));
+            continue;
+        }
+
+        FString ActorName = OriginalName;
+        if (ExistingNames.Contains(ActorName))
+        {
+            if (!bAutoUniqueName)
+            {
+                Entry->SetStringField(TEXT("status"), TEXT("error"));
+                Entry->SetStringField(TEXT("error"), FString::Printf(TEXT("Actor with name '%s' already exists"), *ActorName));
+                Results.Add(MakeShared<FJsonValueObject>(Entry));
+                continue;
+            }
 
+            int32 Suffix = 1;
+            do
+            {
+                ActorName = FString::Printf(TEXT("%s_%d"), *OriginalName, Suffix++);
+            } while (ExistingNames.Contains(ActorName));
+        }
+
+        TSharedPtr<FJsonObject> SpawnSpec = *SpecObject;
+        if (Defaults)
+        {
+            SpawnSpec = MakeShared<FJsonObject>(**Defaults);
+            for (const TPair<FString, TSharedPtr<FJsonValue>>& Field : (*SpecObject)->Values)
+            {
+                SpawnSpec->SetField(Field.Key, Field.Value);
+            }
+        }
+
+        int32 ScaleId = INDEX_NONE;
+        int32 MeshId = INDEX_NONE;
+        bool bHasScaleId = SpawnSpec->TryGetNumberField(TEXT("scale_id"), ScaleId);
+        bool bHasMeshId = SpawnSpec->TryGetNumberField(TEXT("static_mesh_id"), MeshId);
+        if (bHasScaleId || bHasMeshId)
+        {
+            if (!Defaults)
+            {
+                SpawnSpec = MakeShared<FJsonObject>(**SpecObject);
+            }
+            if (bHasScaleId)
+            {
+                if (!ScaleTable || !ScaleTable->IsValidIndex(ScaleId))
+                {
+                    Entry->SetStringField(TEXT("status"), TEXT("error"));
+                    Entry->SetStringField(TEXT("error"), FString::Printf(TEXT("Invalid 'scale_id': %d"), ScaleId));
+                    Results.Add(MakeShared<FJsonValueObject>(Entry));
+                    continue;
+                }
+                SpawnSpec->SetField(TEXT("scale"), (*ScaleTable)[ScaleId]);
+            }
+            if (bHasMeshId)
+            {
+                if (!MeshTable || !MeshTable->IsValidIndex(MeshId))
+                {
+                    Entry->SetStringField(TEXT("status"), TEXT("error"));
+                    Entry->SetStringField(TEXT("error"), FString::Printf(TEXT("Invalid 'static_mesh_id': %d"), MeshId));
+                    Results.Add(MakeShared<FJsonValueObject>(Entry));
+                    continue;
+                }
+                SpawnSpec->SetField(TEXT("static_mesh"), (*MeshTable)[MeshId]);
+            }
+        }
+
+        TSharedPtr<FJsonObject> SpawnResult = SpawnActorInWorld(World, SpawnSpec, ActorName);
+        if (SpawnResult.IsValid() && !SpawnResult->HasField(TEXT("success")))
+        {
+            ExistingNames.Add(ActorName);
+            SpawnResult->SetStringField(TEXT("final_name"), ActorName);
+            SpawnResult->SetStringField(TEXT("original_name"), OriginalName);
+            Entry->SetStringField(TEXT("status"), TEXT("success"));
+            Entry->SetObjectField(TEXT("result"), SpawnResult);
+            SpawnedCount++;
+        }
+        else
+        {
+            FString ErrorMessage = TEXT("Failed to create actor");
+            if (SpawnResult.IsValid())
+            {
+                SpawnResult->TryGetStringField(TEXT("error"), ErrorMessage);
+            }
+            Entry->SetStringField(TEXT("status"), TEXT("error"));
+            Entry->SetStringField(TEXT("error"), ErrorMessage);
+        }
+        Results.Add(MakeShared<FJsonValueObject>(Entry));
+    }
+
+    TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
+    ResultObj->SetArrayField(TEXT("results"), Results);
+    ResultObj->SetNumberField(TEXT("spawned"), SpawnedCount);
+    ResultObj->SetNumberField(TEXT("failed"), Results.Num() - SpawnedCount);
+    return ResultObj;
+}
+
+TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleSpawnInstancedStaticMesh(const TSharedPtr<FJsonObject>& Params)
+{
+    FString OriginalName;
+    if (!Params->TryGetStringField(TEXT("name"), OriginalName))
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'name' parameter"));
+    }
+
+    FString MeshPath;
+    if (!Params->TryGetStringField(TEXT("static_mesh"), MeshPath))
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'static_mesh' parameter"));
+    }
+
+    const TArray<TSharedPtr<FJsonValue>>* InstanceSpecs = nullptr;
+    if (!Params->TryGetArrayField(TEXT("instances"), InstanceSpecs))
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'instances' parameter"));
+    }
+
+    UWorld* World = GEditor->GetEditorWorldContext().World();
     if (!World)
     {
         return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Failed to get editor world"));
     }
 
-    // Check if an actor with this name already exists
+    UStaticMesh* Mesh = Cast<UStaticMesh>(UEditorAssetLibrary::LoadAsset(MeshPath));
+    if (!Mesh)
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Could not find static mesh at path: %s"), *MeshPath));
+    }
+
+    bool bAutoUniqueName = true;
+    Params->TryGetBoolField(TEXT("auto_unique_name"), bAutoUniqueName);
+
+    TSet<FString> ExistingNames;
     TArray<AActor*> AllActors;
     UGameplayStatics::GetAllActorsOfClass(World, AActor::StaticClass(), AllActors);
     for (AActor* Actor : AllActors)
     {
-        if (Actor && Actor->GetName() == ActorName)
+        if (Actor)
+        {
+            ExistingNames.Add(Actor->GetName());
+        }
+    }
+
+    FString ActorName = OriginalName;
+    if (ExistingNames.Contains(ActorName))
+    {
+        if (!bAutoUniqueName)
         {
             return FEpicUnrealMCPCommonUtils::CreateErrorResponse(FString::Printf(TEXT("Actor with name '%s' already exists"), *ActorName));
         }
+
+        int32 Suffix = 1;
+        do
+        {
+            ActorName = FString::Printf(TEXT("%s_%d"), *OriginalName, Suffix++);
+        } while (ExistingNames.Contains(ActorName));
+    }
+
+    // Instance transforms are given in world space
+    TArray<FTransform> InstanceTransforms;
+    InstanceTransforms.Reserve(InstanceSpecs->Num());
+    for (const TSharedPtr<FJsonValue>& InstanceValue : *InstanceSpecs)
+    {
+        const TSharedPtr<FJsonObject>* InstanceObject = nullptr;
+        if (!InstanceValue.IsValid() || !InstanceValue->TryGetObject(InstanceObject))
+        {
+            return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Each instance must be an object"));
+        }
+
+        FVector Location(0.0f, 0.0f, 0.0f);
+        FRotator Rotation(0.0f, 0.0f, 0.0f);
+        FVector Scale(1.0f, 1.0f, 1.0f);
+        if ((*InstanceObject)->HasField(TEXT("location")))
+        {
+            Location = FEpicUnrealMCPCommonUtils::GetVectorFromJson(*InstanceObject, TEXT("location"));
+        }
+        if ((*InstanceObject)->HasField(TEXT("rotation")))
+        {
+            Rotation = FEpicUnrealMCPCommonUtils::GetRotatorFromJson(*InstanceObject, TEXT("rotation"));
+        }
+        if ((*InstanceObject)->HasField(TEXT("scale")))
+        {
+            Scale = FEpicUnrealMCPCommonUtils::GetVectorFromJson(*InstanceObject, TEXT("scale"));
+        }
+        InstanceTransforms.Add(FTransform(Rotation, Location, Scale));
+    }
+
+    FVector ActorLocation(0.0f, 0.0f, 0.0f);
+    if (Params->HasField(TEXT("location")))
+    {
+        ActorLocation = FEpicUnrealMCPCommonUtils::GetVectorFromJson(Params, TEXT("location"));
     }
 
+    FActorSpawnParameters SpawnParams;
+    SpawnParams.Name = *ActorName;
+    AActor* NewActor = World->SpawnActor<AActor>(AActor::StaticClass(), ActorLocation, FRotator::ZeroRotator, SpawnParams);
+    if (!NewActor)
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Failed to create actor"));
+    }
+
+    // One component holds every instance: a single scene proxy instead of one actor per piece
+    UInstancedStaticMeshComponent* InstancedMesh = NewObject<UInstancedStaticMeshComponent>(NewActor, TEXT("InstancedStaticMesh"));
+    InstancedMesh->SetMobility(EComponentMobility::Static);
+    InstancedMesh->SetStaticMesh(Mesh);
+    NewActor->SetRootComponent(InstancedMesh);
+    NewActor->AddInstanceComponent(InstancedMesh);
+    InstancedMesh->RegisterComponent();
+    NewActor->SetActorLocation(ActorLocation);
+    InstancedMesh->AddInstances(InstanceTransforms, false, true);
+
+    TSharedPtr<FJsonObject> ResultObj = FEpicUnrealMCPCommonUtils::ActorToJsonObject(NewActor, true);
+    ResultObj->SetStringField(TEXT("final_name"), ActorName);
+    ResultObj->SetStringField(TEXT("original_name"), OriginalName);
+    ResultObj->SetNumberField(TEXT("instance_count"), InstancedMesh->GetInstanceCount());
+    return ResultObj;
+}
+
+TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleSpawnCompositeActors(const TSharedPtr<FJsonObject>& Params)
+{
+    const TArray<TSharedPtr<FJsonValue>>* ActorSpecs = nullptr;
+    if (!Params->TryGetArrayField(TEXT("actors"), ActorSpecs))
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'actors' parameter"));
+    }
+
+    UWorld* World = GEditor->GetEditorWorldContext().World();
+    if (!World)
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Failed to get editor world"));
+    }
+
+    bool bAutoUniqueName = true;
+    Params->TryGetBoolField(TEXT("auto_unique_name"), bAutoUniqueName);
+
+    TSet<FString> ExistingNames;
+    TArray<AActor*> AllActors;
+    UGameplayStatics::GetAllActorsOfClass(World, AActor::StaticClass(), AllActors);
+    ExistingNames.Reserve(AllActors.Num() + ActorSpecs->Num());
+    for (AActor* Actor : AllActors)
+    {
+        if (Actor)
+        {
+            ExistingNames.Add(Actor->GetName());
+        }
+    }
+
+    // Composites usually repeat a couple of meshes, so each path is loaded once
+    TMap<FString, UStaticMesh*> LoadedMeshes;
+    TArray<TSharedPtr<FJsonValue>> Results;
+    Results.Reserve(ActorSpecs->Num());
+    int32 SpawnedCount = 0;
+
+    for (const TSharedPtr<FJsonValue>& SpecValue : *ActorSpecs)
+    {
+        TSharedPtr<FJsonObject> Entry = MakeShared<FJsonObject>();
+        auto AddError = [&Entry, &Results](const FString& Error)
+        {
+            Entry->SetStringField(TEXT("status"), TEXT("error"));
+            Entry->SetStringField(TEXT("error"), Error);
+            Results.Add(MakeShared<FJsonValueObject>(Entry));
+        };
+
+        const TSharedPtr<FJsonObject>* SpecObject = nullptr;
+        FString OriginalName;
+        if (!SpecValue.IsValid() || !SpecValue->TryGetObject(SpecObject) || !(*SpecObject)->TryGetStringField(TEXT("name"), OriginalName))
+        {
+            AddError(TEXT("Missing 'name' parameter"));
+            continue;
+        }
+
+        const TArray<TSharedPtr<FJsonValue>>* PartSpecs = nullptr;
+        if (!(*SpecObject)->TryGetArrayField(TEXT("parts"), PartSpecs) || PartSpecs->Num() == 0)
+        {
+            AddError(TEXT("Missing 'parts' parameter"));
+            continue;
+        }
+
+        FString ActorName = OriginalName;
+        if (ExistingNames.Contains(ActorName))
+        {
+            if (!bAutoUniqueName)
+            {
+                AddError(FString::Printf(TEXT("Actor with name '%s' already exists"), *ActorName));
+                continue;
+            }
+
+            int32 Suffix = 1;
+            do
+            {
+                ActorName = FString::Printf(TEXT("%s_%d"), *OriginalName, Suffix++);
+            } while (ExistingNames.Contains(ActorName));
+        }
+
+        // Resolve every part before spawning so a bad mesh path leaves nothing behind
+        TArray<TPair<UStaticMesh*, FTransform>> Parts;
+        Parts.Reserve(PartSpecs->Num());
+        FString PartError;
+        for (const TSharedPtr<FJsonValue>& PartValue : *PartSpecs)
+        {
+            const TSharedPtr<FJsonObject>* PartObject = nullptr;
+            FString MeshPath;
+            if (!PartValue.IsValid() || !PartValue->TryGetObject(PartObject) || !(*PartObject)->TryGetStringField(TEXT("static_mesh"), MeshPath))
+            {
+                PartError = TEXT("Each part needs a 'static_mesh'");
+                break;
+            }
+
+            UStaticMesh*& Mesh = LoadedMeshes.FindOrAdd(MeshPath);
+            if (!Mesh)
+            {
+                Mesh = Cast<UStaticMesh>(UEditorAssetLibrary::LoadAsset(MeshPath));
+            }
+            if (!Mesh)
+            {
+                PartError = FString::Printf(TEXT("Could not find static mesh at path: %s"), *MeshPath);
+                break;
+            }
+
+            // Part transforms are relative to the composite actor
+            FVector Location(0.0f, 0.0f, 0.0f);
+            FRotator Rotation(0.0f, 0.0f, 0.0f);
+            FVector Scale(1.0f, 1.0f, 1.0f);
+            if ((*PartObject)->HasField(TEXT("location")))
+            {
+                Location = FEpicUnrealMCPCommonUtils::GetVectorFromJson(*PartObject, TEXT("location"));
+            }
+            if ((*PartObject)->HasField(TEXT("rotation")))
+            {
+                Rotation = FEpicUnrealMCPCommonUtils::GetRotatorFromJson(*PartObject, TEXT("rotation"));
+            }
+            if ((*PartObject)->HasField(TEXT("scale")))
+            {
+                Scale = FEpicUnrealMCPCommonUtils::GetVectorFromJson(*PartObject, TEXT("scale"));
+            }
+            Parts.Emplace(Mesh, FTransform(Rotation, Location, Scale));
+        }
+        if (!PartError.IsEmpty())
+        {
+            AddError(PartError);
+            continue;
+        }
+
+        FVector ActorLocation(0.0f, 0.0f, 0.0f);
+        FRotator ActorRotation(0.0f, 0.0f, 0.0f);
+        if ((*SpecObject)->HasField(TEXT("location")))
+        {
+            ActorLocation = FEpicUnrealMCPCommonUtils::GetVectorFromJson(*SpecObject, TEXT("location"));
+        }
+        if ((*SpecObject)->HasField(TEXT("rotation")))
+        {
+            ActorRotation = FEpicUnrealMCPCommonUtils::GetRotatorFromJson(*SpecObject, TEXT("rotation"));
+        }
+
+        FActorSpawnParameters SpawnParams;
+        SpawnParams.Name = *ActorName;
+        AActor* NewActor = World->SpawnActor<AActor>(AActor::StaticClass(), ActorLocation, ActorRotation, SpawnParams);
+        if (!NewActor)
+        {
+            AddError(TEXT("Failed to create actor"));
+            continue;
+        }
+
+        // One actor owns every part as a static mesh component at its fixed relative transform
+        USceneComponent* Root = NewObject<USceneComponent>(NewActor, TEXT("Root"));
+        Root->SetMobility(EComponentMobility::Static);
+        NewActor->SetRootComponent(Root);
+        NewActor->AddInstanceComponent(Root);
+        Root->RegisterComponent();
+        for (int32 PartIndex = 0; PartIndex < Parts.Num(); ++PartIndex)
+        {
+            UStaticMeshComponent* PartMesh = NewObject<UStaticMeshComponent>(NewActor, *FString::Printf(TEXT("Part_%d"), PartIndex));
+            PartMesh->SetMobility(EComponentMobility::Static);
+            PartMesh->SetStaticMesh(Parts[PartIndex].Key);
+            PartMesh->SetupAttachment(Root);
+            PartMesh->SetRelativeTransform(Parts[PartIndex].Value);
+            NewActor->AddInstanceComponent(PartMesh);
+            PartMesh->RegisterComponent();
+        }
+        NewActor->SetActorLocationAndRotation(ActorLocation, ActorRotation);
+
+        ExistingNames.Add(ActorName);
+        TSharedPtr<FJsonObject> SpawnResult = FEpicUnrealMCPCommonUtils::ActorToJsonObject(NewActor, true);
+        SpawnResult->SetStringField(TEXT("final_name"), ActorName);
+        SpawnResult->SetStringField(TEXT("original_name"), OriginalName);
+        SpawnResult->SetNumberField(TEXT("part_count"), Parts.Num());
+        Entry->SetStringField(TEXT("status"), TEXT("success"));
+        Entry->SetObjectField(TEXT("result"), SpawnResult);
+        Results.Add(MakeShared<FJsonValueObject>(Entry));
+        SpawnedCount++;
+    }
+
+    TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
+    ResultObj->SetArrayField(TEXT("results"), Results);
+    ResultObj->SetNumberField(TEXT("spawned"), SpawnedCount);
+    ResultObj->SetNumberField(TEXT("failed"), Results.Num() - SpawnedCount);
+    return ResultObj;
+}
+
+TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::SpawnActorInWorld(UWorld* World, const TSharedPtr<FJsonObject>& Params, const FString& ActorName)
+{
+    // Get required parameters
+    FString ActorType;
+    if (!Params->TryGetStringField(TEXT("type"), ActorType))
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'type' parameter"));
+    }
+
+    // Get optional transform parameters
+    FVector Location(0.0f, 0.0f, 0.0f);
+    FRotator Rotation(0.0f, 0.0f, 0.0f);
+    FVector Scale(1.0f, 1.0f, 1.0f);
+
+    if (Params->HasField(TEXT("location")))
+    {
+        Location = FEpicUnrealMCPCommonUtils::GetVectorFromJson(Params, TEXT("location"));
+    }
+    if (Params->HasField(TEXT("rotation")))
+    {
+        Rotation = FEpicUnrealMCPCommonUtils::GetRotatorFromJson(Params, TEXT("rotation"));
+    }
+    if (Params->HasField(TEXT("scale")))
+    {
+        Scale = FEpicUnrealMCPCommonUtils::GetVectorFromJson(Params, TEXT("scale"));
+    }
+
+    // Create the actor based on type
+    AActor* NewActor = nullptr;
+
     FActorSpawnParameters SpawnParams;
     SpawnParams.Name = *ActorName;
 
@@ -306,3 +781,46 @@ TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleSpawnBlueprintActor(
     FEpicUnrealMCPBlueprintCommands BlueprintCommands;
     return BlueprintCommands.HandleCommand(TEXT("spawn_blueprint_actor"), Params);
 }
+
+TSharedPtr<FJsonObject> FEpicUnrealMCPEditorCommands::HandleSetViewportRealtime(const TSharedPtr<FJsonObject>& Params)
+{
+    bool bEnabled = true;
+    if (!Params->TryGetBoolField(TEXT("enabled"), bEnabled))
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Missing 'enabled' parameter"));
+    }
+
+    if (!GEditor)
+    {
+        return FEpicUnrealMCPCommonUtils::CreateErrorResponse(TEXT("Editor is not available"));
+    }
+
+    // Disabling pushes a named realtime override instead of changing each viewport's own
+    // setting, so re-enabling just removes it and restores whatever the user had before
+    const FText OverrideName = FText::FromString(TEXT("UnrealMCP bulk build"));
+    int32 ViewportCount = 0;
+    for (FLevelEditorViewportClient* ViewportClient : GEditor->GetLevelViewportClients())
+    {
+        if (!ViewportClient)
+        {
+            continue;
+        }
+
+        const bool bHasOverride = ViewportClient->HasRealtimeOverride(OverrideName);
+        if (!bEnabled && !bHasOverride)
+        {
+            ViewportClient->AddRealtimeOverride(false, OverrideName);
+        }
+        else if (bEnabled && bHasOverride)
+        {
+            ViewportClient->RemoveRealtimeOverride(OverrideName);
+            ViewportClient->Invalidate();
+        }
+        ++ViewportCount;
+    }
+
+    TSharedPtr<FJsonObject> ResultObj = MakeShared<FJsonObject>();
+    ResultObj->SetBoolField(TEXT("enabled"), bEnabled);
+    ResultObj->SetNumberField(TEXT("viewport_count"), ViewportCount);
+    return ResultObj;
+}
@@ -221,9 +221,13 @@ FString UEpicUnrealMCPBridge::ExecuteCommand(const FString& CommandType, const T
             else if (CommandType == TEXT("get_actors_in_level") || 
                      CommandType == TEXT("find_actors_by_name") ||
                      CommandType == TEXT("spawn_actor") ||
+                     CommandType == TEXT("batch_spawn") ||
+                     CommandType == TEXT("spawn_instanced_static_mesh") ||
+                     CommandType == TEXT("spawn_composite_actors") ||
                      CommandType == TEXT("delete_actor") || 
                      CommandType == TEXT("set_actor_transform") ||
-                     CommandType == TEXT("spawn_blueprint_actor"))
+                     CommandType == TEXT("spawn_blueprint_actor") ||
+                     CommandType == TEXT("set_viewport_realtime"))
             {
                 ResultJson = EditorCommands->HandleCommand(CommandType, Params);
             }
@@ -6,9 +6,10 @@ Prevents duplicate name errors by automatically generating unique names and trac
 """
 
 import logging
+import struct
 import time
 import uuid
-from typing import Dict, Any, Set, Optional
+from typing import Dict, Any, List, Set, Optional
 
 # Configure logging
 logger = logging.getLogger("ActorNameManager")
@@ -66,7 +67,7 @@ class ActorNameManager:
         unique_suffix = str(uuid.uuid4())[:8]
         final_name = f"{base_name}_{self._session_id}_{self._actor_counters[counter_key]}_{unique_suffix}"
         
-        logger.info(f"Generated unique name: {base_name} -> {final_name}")
+        logger.debug("Generated unique name: %s -> %s", base_name, final_name)
         return final_name
     
     def _actor_exists(self, name: str, unreal_connection=None) -> bool:
@@ -150,7 +151,7 @@ def safe_spawn_actor(unreal_connection, params: Dict[str, Any], auto_unique_name
         
         # Log name change if it occurred
         if unique_name != original_name:
-            logger.debug(f"Actor name changed: '{original_name}' -> '{unique_name}'")
+            logger.debug("Actor name changed: '%s' -> '%s'", original_name, unique_name)
     
     try:
         # Attempt to spawn the actor
@@ -186,6 +187,355 @@ def safe_spawn_actor(unreal_connection, params: Dict[str, Any], auto_unique_name
         logger.error(f"Error in safe_spawn_actor: {e}")
         return {"success": False, "status": "error", "error": str(e)}
 
+def _compress_batch_specs(actor_specs: List[Dict[str, Any]]):
+    """
+    Replace repeated scale triples and mesh paths with indices into per-batch tables.
+    
+    Builders reuse a handful of scales and meshes across thousands of actors, so the
+    batch header carries each distinct value once and specs reference it by
+    "scale_id" / "static_mesh_id".
+    
+    Fields that end up identical on every spec (typically "type", "scale_id" and
+    "static_mesh_id") are moved into a batch-wide "defaults" object, so most
+    specs shrink to just a name and location.
+    
+    Returns:
+        Tuple of (compact_specs, scales, meshes, defaults)
+    """
+    scale_ids: Dict[tuple, int] = {}
+    mesh_ids: Dict[str, int] = {}
+    compact_specs = []
+    
+    for spec in actor_specs:
+        compact = dict(spec)
+        scale = compact.pop("scale", None)
+        if scale is not None:
+            compact["scale_id"] = scale_ids.setdefault(tuple(scale), len(scale_ids))
+        mesh = compact.pop("static_mesh", None)
+        if mesh is not None:
+            compact["static_mesh_id"] = mesh_ids.setdefault(mesh, len(mesh_ids))
+        compact_specs.append(compact)
+    
+    defaults = {}
+    if len(compact_specs) > 1:
+        first = compact_specs[0]
+        for key, value in first.items():
+            if key != "name" and all(key in spec and spec[key] == value for spec in compact_specs):
+                defaults[key] = value
+        if defaults:
+            for spec in compact_specs:
+                for key in defaults:
+                    del spec[key]
+    
+    return compact_specs, [list(scale) for scale in scale_ids], list(mesh_ids), defaults
+
+# Binary batch_spawn frame (see FMCPServerRunnable::DecodeBinaryBatchSpawn). The opcode
+# byte can never start a JSON frame, and plugins without binary support answer with a
+# JSON parse error, after which batches fall back to JSON for the rest of the session.
+_BINARY_BATCH_SPAWN_OPCODE = 0x01
+_BINARY_BATCH_SPAWN_VERSION = 1
+_BINARY_BATCH_SPAWN_FLOAT32_VERSION = 2  # same layout with float32 transforms
+_BINARY_NO_MESH = 0xFFFF
+_BINARY_HEADER = struct.Struct("<BBBH")  # opcode, version, flags, mesh count
+_BINARY_U16 = struct.Struct("<H")
+_BINARY_U32 = struct.Struct("<I")
+_BINARY_RECORD = struct.Struct("<6dH")  # location xyz, scale xyz, mesh id
+_BINARY_RECORD_FLOAT32 = struct.Struct("<6fH")
+_BINARY_FLOAT32_MAX_ERROR = 0.01  # cm a float32 location may be rounded by before float64 is used
+_BINARY_SPEC_KEYS = frozenset(("name", "type", "location", "scale", "static_mesh"))
+_binary_batch_spawn_supported = True
+_binary_float32_supported = True
+
+# Large batches are sent as consecutive batch_spawn frames of at most this many actors,
+# so only one chunk is ever encoded at a time and no single frame grows unbounded
+_BATCH_SPAWN_CHUNK_SIZE = 256
+
+def _encode_binary_batch_spawn(actor_specs: List[Dict[str, Any]], auto_unique_name: bool,
+                               float32: bool = False) -> Optional[bytes]:
+    """
+    Encode StaticMeshActor specs as a compact binary batch_spawn frame body.
+    
+    With float32=True transforms are sent as float32, which nearly halves the record
+    size. Scales stay within float32's relative precision, and locations are accepted
+    while rounding moves them by at most _BINARY_FLOAT32_MAX_ERROR cm, which holds for
+    anything within about 2.6 km of the origin.
+    
+    Returns:
+        The encoded bytes, or None when a spec carries anything the binary layout
+        cannot (rotation, other actor types, or with float32 a location too far out
+        to round safely), in which case a wider encoding must be used
+    """
+    mesh_ids: Dict[str, int] = {}
+    records = []
+    pack_u16 = _BINARY_U16.pack
+    record = _BINARY_RECORD_FLOAT32 if float32 else _BINARY_RECORD
+    pack_record = record.pack
+    unpack_record = record.unpack
+    
+    for spec in actor_specs:
+        if spec.get("type") != "StaticMeshActor" or "name" not in spec or not _BINARY_SPEC_KEYS.issuperset(spec):
+            return None
+        name = spec["name"].encode("utf-8")
+        location = spec.get("location", (0.0, 0.0, 0.0))
+        scale = spec.get("scale", (1.0, 1.0, 1.0))
+        if len(name) > 0xFFFF or len(location) != 3 or len(scale) != 3:
+            return None
+        mesh = spec.get("static_mesh")
+        mesh_id = _BINARY_NO_MESH if mesh is None else mesh_ids.setdefault(mesh, len(mesh_ids))
+        packed = pack_record(*location, *scale, mesh_id)
+        if float32:
+            x, y, z = unpack_record(packed)[:3]
+            if (abs(x - location[0]) > _BINARY_FLOAT32_MAX_ERROR or abs(y - location[1]) > _BINARY_FLOAT32_MAX_ERROR
+                    or abs(z - location[2]) > _BINARY_FLOAT32_MAX_ERROR):
+                return None
+        records.append(pack_u16(len(name)))
+        records.append(name)
+        records.append(packed)
+    
+    if len(mesh_ids) >= _BINARY_NO_MESH:
+        return None
+    
+    version = _BINARY_BATCH_SPAWN_FLOAT32_VERSION if float32 else _BINARY_BATCH_SPAWN_VERSION
+    parts = [_BINARY_HEADER.pack(_BINARY_BATCH_SPAWN_OPCODE, version, 1 if auto_unique_name else 0, len(mesh_ids))]
+    for mesh in mesh_ids:
+        encoded = mesh.encode("utf-8")
+        if len(encoded) > 0xFFFF:
+            return None
+        parts.append(pack_u16(len(encoded)))
+        parts.append(encoded)
+    parts.append(_BINARY_U32.pack(len(actor_specs)))
+    parts.extend(records)
+    return b"".join(parts)
+
+def _send_batch_spawn(unreal_connection, actor_specs: List[Dict[str, Any]], auto_unique_name: bool) -> Optional[Dict[str, Any]]:
+    """
+    Send one batch_spawn, preferring the binary frame (float32 transforms when they round
+    safely, float64 otherwise) and falling back to compacted JSON.
+    """
+    global _binary_batch_spawn_supported, _binary_float32_supported
+    
+    if _binary_batch_spawn_supported and _binary_float32_supported:
+        payload = _encode_binary_batch_spawn(actor_specs, auto_unique_name, float32=True)
+        if payload is not None:
+            response = unreal_connection.send_command("batch_spawn", payload=payload)
+            error = str((response or {}).get("error", ""))
+            if "Unsupported binary batch_spawn version" in error:
+                logger.info("Unreal plugin does not support float32 batch_spawn frames, using float64")
+                _binary_float32_supported = False
+            elif "Failed to parse JSON message" in error:
+                logger.info("Unreal plugin does not support binary batch_spawn frames, using JSON")
+                _binary_batch_spawn_supported = False
+            else:
+                return response
+    
+    if _binary_batch_spawn_supported:
+        payload = _encode_binary_batch_spawn(actor_specs, auto_unique_name)
+        if payload is not None:
+            response = unreal_connection.send_command("batch_spawn", payload=payload)
+            if not (response and "Failed to parse JSON message" in str(response.get("error", ""))):
+                return response
+            logger.info("Unreal plugin does not support binary batch_spawn frames, using JSON")
+            _binary_batch_spawn_supported = False
+    
+    compact_specs, scales, meshes, defaults = _compress_batch_specs(actor_specs)
+    return unreal_connection.send_command("batch_spawn", {
+        "scales": scales,
+        "meshes": meshes,
+        "defaults": defaults,
+        "actors": compact_specs,
+        "auto_unique_name": auto_unique_name
+    })
+
+def safe_batch_spawn_actors(unreal_connection, actor_specs: List[Dict[str, Any]], auto_unique_name: bool = True) -> Dict[str, Any]:
+    """
+    Spawn many actors with batch_spawn round trips of up to _BATCH_SPAWN_CHUNK_SIZE actors.
+    
+    Unlike safe_spawn_actor, name uniqueness is resolved by Unreal in one pass
+    over the level instead of one find_actors_by_name query per actor.
+    
+    Args:
+        unreal_connection: The Unreal connection to use
+        actor_specs: List of spawn_actor parameter dictionaries
+        auto_unique_name: Whether Unreal should suffix names that already exist (default True)
+    
+    Returns:
+        Dictionary with status and a per-actor "results" list, each entry shaped like a
+        spawn_actor response ({"status": "success", "result": {...}} or {"status": "error", "error": ...})
+    """
+    if not unreal_connection:
+        return {"success": False, "status": "error", "error": "No Unreal connection available", "results": []}
+    
+    if not actor_specs:
+        return {"status": "success", "results": []}
+    
+    try:
+        results = []
+        for start in range(0, len(actor_specs), _BATCH_SPAWN_CHUNK_SIZE):
+            chunk = actor_specs[start:start + _BATCH_SPAWN_CHUNK_SIZE]
+            response = _send_batch_spawn(unreal_connection, chunk, auto_unique_name)
+            
+            if not response or response.get("status") != "success":
+                error = (response or {}).get("error", "No response from Unreal")
+                logger.error(f"batch_spawn of {len(chunk)} actors failed ({start} of {len(actor_specs)} already sent): {error}")
+                # Earlier chunks are already in the level, so keep their results
+                return {"success": False, "status": "error", "error": error, "results": results}
+            
+            chunk_results = response.get("result", {}).get("results", [])
+            for entry in chunk_results:
+                if entry.get("status") == "success":
+                    _global_actor_name_manager.mark_actor_created(entry["result"].get("final_name", entry["result"].get("name")))
+            results.extend(chunk_results)
+        
+        return {"status": "success", "results": results}
+        
+    except Exception as e:
+        logger.error(f"Error in safe_batch_spawn_actors: {e}")
+        return {"success": False, "status": "error", "error": str(e), "results": []}
+
+def safe_spawn_instanced_meshes(unreal_connection, actor_specs: List[Dict[str, Any]], name_prefix: str, auto_unique_name: bool = True) -> Dict[str, Any]:
+    """
+    Spawn static mesh specs as one instanced static mesh actor per distinct mesh.
+    
+    Pieces that only need to render share a single component and scene proxy instead
+    of becoming one actor each; the per-spec names are dropped, and each mesh group is
+    named "{name_prefix}_{mesh asset name}". Groups are sent as pipelined commands.
+    
+    Args:
+        unreal_connection: The Unreal connection to use
+        actor_specs: List of spawn_actor parameter dictionaries (location, rotation, scale, static_mesh)
+        name_prefix: Prefix for the instanced actor names
+        auto_unique_name: Whether Unreal should suffix names that already exist (default True)
+    
+    Returns:
+        Dictionary with status and one "results" entry per mesh group, shaped like a
+        batch_spawn result entry; successful results carry an "instance_count"
+    """
+    if not unreal_connection:
+        return {"success": False, "status": "error", "error": "No Unreal connection available", "results": []}
+    
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for spec in actor_specs:
+        instance = {"location": spec.get("location", [0.0, 0.0, 0.0])}
+        if "rotation" in spec:
+            instance["rotation"] = spec["rotation"]
+        if "scale" in spec:
+            instance["scale"] = spec["scale"]
+        groups.setdefault(spec.get("static_mesh", "/Engine/BasicShapes/Cube.Cube"), []).append(instance)
+    
+    try:
+        results = unreal_connection.send_commands([
+            ("spawn_instanced_static_mesh", {
+                "name": f"{name_prefix}_{mesh.rsplit('.', 1)[-1]}",
+                "static_mesh": mesh,
+                "instances": instances,
+                "auto_unique_name": auto_unique_name
+            })
+            for mesh, instances in groups.items()
+        ])
+        for entry in results:
+            if entry.get("status") == "success":
+                _global_actor_name_manager.mark_actor_created(entry["result"].get("final_name", entry["result"].get("name")))
+        return {"status": "success", "results": results}
+    
+    except Exception as e:
+        logger.error(f"Error in safe_spawn_instanced_meshes: {e}")
+        return {"success": False, "status": "error", "error": str(e), "results": []}
+
+def flatten_composite_specs(composites: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Turn unrotated composite specs into one StaticMeshActor spec per part.
+    
+    Part locations are offset by the composite location; each part is named by its
+    own "name", or "{composite name}_{part index}" when it has none.
+    """
+    specs = []
+    for composite in composites:
+        cx, cy, cz = composite.get("location", (0.0, 0.0, 0.0))
+        for index, part in enumerate(composite["parts"]):
+            px, py, pz = part.get("location", (0.0, 0.0, 0.0))
+            spec = {
+                "name": part.get("name") or f"{composite['name']}_{index}",
+                "type": "StaticMeshActor",
+                "location": (cx + px, cy + py, cz + pz),
+            }
+            if "rotation" in part:
+                spec["rotation"] = part["rotation"]
+            if "scale" in part:
+                spec["scale"] = part["scale"]
+            spec["static_mesh"] = part["static_mesh"]
+            specs.append(spec)
+    return specs
+
+_composite_actors_supported = True
+
+def safe_spawn_composite_actors(unreal_connection, composites: List[Dict[str, Any]], auto_unique_name: bool = True) -> Dict[str, Any]:
+    """
+    Spawn rigid groups of static meshes as one actor each, using a single spawn_composite_actors round trip.
+    
+    Each composite is {"name", "location", "parts": [...]}, where every part has a
+    "static_mesh" and an optional "location", "rotation" and "scale" relative to the
+    composite. Plugins without spawn_composite_actors get the parts as individual
+    actors through safe_batch_spawn_actors instead (see flatten_composite_specs).
+    
+    Returns:
+        Dictionary with status and one "results" entry per spawned actor, shaped like a
+        batch_spawn result entry; composite results carry a "part_count"
+    """
+    global _composite_actors_supported
+    
+    if not unreal_connection:
+        return {"success": False, "status": "error", "error": "No Unreal connection available", "results": []}
+    
+    if not composites:
+        return {"status": "success", "results": []}
+    
+    if not _composite_actors_supported:
+        return safe_batch_spawn_actors(unreal_connection, flatten_composite_specs(composites), auto_unique_name)
+    
+    try:
+        response = unreal_connection.send_command("spawn_composite_actors", {
+            "actors": composites,
+            "auto_unique_name": auto_unique_name
+        })
+        
+        if response and "Unknown command" in str(response.get("error", "")):
+            logger.info("Unreal plugin does not support spawn_composite_actors, spawning parts individually")
+            _composite_actors_supported = False
+            return safe_batch_spawn_actors(unreal_connection, flatten_composite_specs(composites), auto_unique_name)
+        
+        if not response or response.get("status") != "success":
+            error = (response or {}).get("error", "No response from Unreal")
+            logger.error(f"spawn_composite_actors of {len(composites)} actors failed: {error}")
+            return {"success": False, "status": "error", "error": error, "results": []}
+        
+        results = response.get("result", {}).get("results", [])
+        for entry in results:
+            if entry.get("status") == "success":
+                _global_actor_name_manager.mark_actor_created(entry["result"].get("final_name", entry["result"].get("name")))
+        return {"status": "success", "results": results}
+    
+    except Exception as e:
+        logger.error(f"Error in safe_spawn_composite_actors: {e}")
+        return {"success": False, "status": "error", "error": str(e), "results": []}
+
+def collect_batch_successes(batch_result: Dict[str, Any], actors: List[Dict[str, Any]], label: str) -> List[Dict[str, Any]]:
+    """
+    Append successful batch_spawn results to actors and log failures in aggregate.
+    
+    Returns:
+        The same actors list, for convenience
+    """
+    results = batch_result.get("results", ())
+    before = len(actors)
+    actors.extend(r["result"] for r in results if r.get("status") == "success")
+    failed = len(results) - (len(actors) - before)
+    if failed:
+        errors = {r.get("error", "Unknown error") for r in results if r.get("status") != "success"}
+        logger.warning(f"{label}: {failed}/{len(results)} actors failed to spawn: {'; '.join(sorted(errors))}")
+    elif batch_result.get("status") == "error":
+        logger.warning(f"{label}: batch spawn failed: {batch_result.get('error')}")
+    return actors
+
 def safe_delete_actor(unreal_connection, actor_name: str) -> Dict[str, Any]:
     """
     Safely delete an actor and update the name tracking.
@@ -24,7 +24,8 @@ def spawn_blueprint_actor(
     actor_name: str,
     location: List[float] = [0, 0, 0],
     rotation: List[float] = [0, 0, 0],
-    auto_unique_name: bool = True
+    auto_unique_name: bool = True,
+    scale: List[float] = None
 ) -> Dict[str, Any]:
     """
     Spawn an actor from a Blueprint using the provided Unreal connection.
@@ -36,6 +37,7 @@ def spawn_blueprint_actor(
         location: [x, y, z] position to spawn at
         rotation: [roll, pitch, yaw] rotation to apply
         auto_unique_name: Whether to automatically generate unique names (default True)
+        scale: Optional [x, y, z] actor scale, applied as part of the spawn
         
     Returns:
         Dict containing success status and result data
@@ -59,6 +61,8 @@ def spawn_blueprint_actor(
             "location": location,
             "rotation": rotation
         }
+        if scale is not None:
+            params["scale"] = scale
         
         response = unreal_connection.send_command("spawn_blueprint_actor", params)
         
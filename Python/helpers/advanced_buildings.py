@@ -2,54 +2,61 @@
 Advanced building creation helper functions for complex structures.
 Includes skyscrapers, office towers, apartment complexes, shopping malls, and parking garages.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import logging
+import random
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
+from .random_utilities import get_rng
+
 logger = logging.getLogger(__name__)
 
 # Import safe spawning functions
 try:
-    from .actor_name_manager import safe_spawn_actor
+    from .actor_name_manager import safe_batch_spawn_actors
 except ImportError:
     logger.warning("Could not import actor_name_manager, using fallback spawning")
-    def safe_spawn_actor(unreal_connection, params, auto_unique_name=True):
-        return unreal_connection.send_command("spawn_actor", params)
+    def safe_batch_spawn_actors(unreal_connection, actor_specs, auto_unique_name=True):
+        # The spawns are independent, so pipeline them instead of waiting on each round trip
+        return {"status": "success", "results": unreal_connection.send_commands([("spawn_actor", spec) for spec in actor_specs])}
 
-def _safe_spawn_building_actor(unreal, params):
-    """Helper function to safely spawn building actors and track results."""
-    resp = safe_spawn_actor(unreal, params, auto_unique_name=True)
-    return resp
+def _spawn_building_actors(unreal, specs: List[Dict[str, Any]], name_prefix: str) -> List[Dict[str, Any]]:
+    """Spawn every piece of one building in a single batch and return the spawned actors."""
+    batch_result = safe_batch_spawn_actors(unreal, specs, auto_unique_name=True)
+    results = batch_result.get("results", ())
+    actors = [r.get("result") for r in results if r.get("status") == "success"]
+    if len(actors) < len(specs):
+        logger.warning("%s: %d/%d building spawns failed", name_prefix, len(specs) - len(actors), len(specs))
+    return actors
 
 
-def _create_skyscraper(height: int, base_width: float, base_depth: float, location: List[float], name_prefix: str) -> Dict[str, Any]:
+def _create_skyscraper(height: int, base_width: float, base_depth: float, location: List[float], name_prefix: str, rng: Optional[random.Random] = None) -> Dict[str, Any]:
     """Create an impressive skyscraper with multiple sections and details."""
     try:
-        import random
         # Import here to avoid circular imports
         import unreal_mcp_server_advanced as server
         get_unreal_connection = server.get_unreal_connection
         
+        rng = get_rng(rng, name_prefix)
+        
         unreal = get_unreal_connection()
         if not unreal:
             return {"success": False, "actors": []}
             
-        actors = []
+        specs = []
         floor_height = 150.0  # Standard floor height
         
         # Create foundation
-        foundation_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Foundation",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] - 30],
             "scale": [(base_width + 200)/100.0, (base_depth + 200)/100.0, 0.6],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if foundation_result and foundation_result.get("status") == "success":
-            actors.append(foundation_result.get("result"))
         
         # Create main tower in sections for tapering effect
         sections = min(5, height // 5)
@@ -69,57 +76,49 @@ def _create_skyscraper(height: int, base_width: float, base_depth: float, locati
             
             # Create main structure for this section
             section_height = section_floors * floor_height
-            section_result = _safe_spawn_building_actor(unreal, {
+            specs.append({
                 "name": f"{name_prefix}_Section_{section}",
                 "type": "StaticMeshActor",
                 "location": [location[0], location[1], current_height + section_height/2],
                 "scale": [current_width/100.0, current_depth/100.0, section_height/100.0],
                 "static_mesh": "/Engine/BasicShapes/Cube.Cube"
             })
-            if section_result and section_result.get("status") == "success":
-                actors.append(section_result.get("result"))
             
             # Add setback/balcony every few floors
             if section < sections - 1:
-                balcony_result = _safe_spawn_building_actor(unreal, {
+                specs.append({
                     "name": f"{name_prefix}_Balcony_{section}",
                     "type": "StaticMeshActor",
                     "location": [location[0], location[1], current_height + section_height - 25],
                     "scale": [(current_width + 100)/100.0, (current_depth + 100)/100.0, 0.5],
                     "static_mesh": "/Engine/BasicShapes/Cube.Cube"
                 })
-                if balcony_result and balcony_result.get("status") == "success":
-                    actors.append(balcony_result.get("result"))
             
             current_height += section_height
         
         # Add rooftop features
         # Antenna/spire
-        spire_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Spire",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], current_height + 300],
             "scale": [0.2, 0.2, 6.0],
             "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
         })
-        if spire_result and spire_result.get("status") == "success":
-            actors.append(spire_result.get("result"))
         
         # Rooftop equipment
         for i in range(3):
-            equipment_x = location[0] + random.uniform(-current_width/4, current_width/4)
-            equipment_y = location[1] + random.uniform(-current_depth/4, current_depth/4)
-            equipment_result = _safe_spawn_building_actor(unreal, {
+            equipment_x = location[0] + rng.uniform(-current_width/4, current_width/4)
+            equipment_y = location[1] + rng.uniform(-current_depth/4, current_depth/4)
+            specs.append({
                 "name": f"{name_prefix}_RoofEquipment_{i}",
                 "type": "StaticMeshActor",
                 "location": [equipment_x, equipment_y, current_height + 50],
                 "scale": [1.0, 1.0, 1.0],
                 "static_mesh": "/Engine/BasicShapes/Cube.Cube"
             })
-            if equipment_result and equipment_result.get("status") == "success":
-                actors.append(equipment_result.get("result"))
         
-        return {"success": True, "actors": actors}
+        return {"success": True, "actors": _spawn_building_actors(unreal, specs, name_prefix)}
         
     except Exception as e:
         logger.error(f"_create_skyscraper error: {e}")
@@ -137,70 +136,60 @@ def _create_office_tower(floors: int, width: float, depth: float, location: List
         if not unreal:
             return {"success": False, "actors": []}
             
-        actors = []
+        specs = []
         floor_height = 140.0
         
         # Foundation
-        foundation_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Foundation",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] - 15],
             "scale": [(width + 100)/100.0, (depth + 100)/100.0, 0.3],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if foundation_result and foundation_result.get("status") == "success":
-            actors.append(foundation_result.get("result"))
         
         # Lobby (taller first floor)
         lobby_height = floor_height * 1.5
-        lobby_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Lobby",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] + lobby_height/2],
             "scale": [width/100.0, depth/100.0, lobby_height/100.0],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if lobby_result and lobby_result.get("status") == "success":
-            actors.append(lobby_result.get("result"))
         
         # Main tower
         tower_height = (floors - 1) * floor_height
-        tower_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Tower",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] + lobby_height + tower_height/2],
             "scale": [width/100.0, depth/100.0, tower_height/100.0],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if tower_result and tower_result.get("status") == "success":
-            actors.append(tower_result.get("result"))
         
         # Add window bands every few floors for glass facade effect
         for floor in range(2, floors, 3):
             band_height = location[2] + lobby_height + (floor - 1) * floor_height
-            band_result = _safe_spawn_building_actor(unreal, {
+            specs.append({
                 "name": f"{name_prefix}_WindowBand_{floor}",
                 "type": "StaticMeshActor",
                 "location": [location[0], location[1], band_height],
                 "scale": [(width + 20)/100.0, (depth + 20)/100.0, 0.2],
                 "static_mesh": "/Engine/BasicShapes/Cube.Cube"
             })
-            if band_result and band_result.get("status") == "success":
-                actors.append(band_result.get("result"))
         
         # Rooftop
         rooftop_height = location[2] + lobby_height + tower_height
-        rooftop_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Rooftop",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], rooftop_height + 30],
             "scale": [(width - 100)/100.0, (depth - 100)/100.0, 0.6],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if rooftop_result and rooftop_result.get("status") == "success":
-            actors.append(rooftop_result.get("result"))
         
-        return {"success": True, "actors": actors}
+        return {"success": True, "actors": _spawn_building_actors(unreal, specs, name_prefix)}
         
     except Exception as e:
         logger.error(f"_create_office_tower error: {e}")
@@ -218,72 +207,62 @@ def _create_apartment_complex(floors: int, units_per_floor: int, location: List[
         if not unreal:
             return {"success": False, "actors": []}
             
-        actors = []
+        specs = []
         floor_height = 120.0
         width = 200 * units_per_floor // 2
         depth = 800
         
         # Foundation
-        foundation_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Foundation",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] - 15],
             "scale": [(width + 100)/100.0, (depth + 100)/100.0, 0.3],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if foundation_result and foundation_result.get("status") == "success":
-            actors.append(foundation_result.get("result"))
         
         # Main building
         building_height = floors * floor_height
-        building_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Building",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] + building_height/2],
             "scale": [width/100.0, depth/100.0, building_height/100.0],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if building_result and building_result.get("status") == "success":
-            actors.append(building_result.get("result"))
         
         # Add balconies on front and back
         for floor in range(1, floors):
             balcony_height = location[2] + floor * floor_height - 20
             
             # Front balconies
-            front_balcony_result = _safe_spawn_building_actor(unreal, {
+            specs.append({
                 "name": f"{name_prefix}_FrontBalcony_{floor}",
                 "type": "StaticMeshActor",
                 "location": [location[0], location[1] - depth/2 - 50, balcony_height],
                 "scale": [width/100.0, 1.0, 0.2],
                 "static_mesh": "/Engine/BasicShapes/Cube.Cube"
             })
-            if front_balcony_result and front_balcony_result.get("status") == "success":
-                actors.append(front_balcony_result.get("result"))
             
             # Back balconies
-            back_balcony_result = _safe_spawn_building_actor(unreal, {
+            specs.append({
                 "name": f"{name_prefix}_BackBalcony_{floor}",
                 "type": "StaticMeshActor",
                 "location": [location[0], location[1] + depth/2 + 50, balcony_height],
                 "scale": [width/100.0, 1.0, 0.2],
                 "static_mesh": "/Engine/BasicShapes/Cube.Cube"
             })
-            if back_balcony_result and back_balcony_result.get("status") == "success":
-                actors.append(back_balcony_result.get("result"))
         
         # Rooftop
-        rooftop_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Rooftop",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] + building_height + 15],
             "scale": [(width + 50)/100.0, (depth + 50)/100.0, 0.3],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if rooftop_result and rooftop_result.get("status") == "success":
-            actors.append(rooftop_result.get("result"))
         
-        return {"success": True, "actors": actors}
+        return {"success": True, "actors": _spawn_building_actors(unreal, specs, name_prefix)}
         
     except Exception as e:
         logger.error(f"_create_apartment_complex error: {e}")
@@ -301,67 +280,57 @@ def _create_shopping_mall(width: float, depth: float, floors: int, location: Lis
         if not unreal:
             return {"success": False, "actors": []}
             
-        actors = []
+        specs = []
         floor_height = 200.0  # Tall ceilings for retail
         
         # Foundation
-        foundation_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Foundation",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] - 20],
             "scale": [(width + 200)/100.0, (depth + 200)/100.0, 0.4],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if foundation_result and foundation_result.get("status") == "success":
-            actors.append(foundation_result.get("result"))
         
         # Main structure
         mall_height = floors * floor_height
-        main_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Main",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] + mall_height/2],
             "scale": [width/100.0, depth/100.0, mall_height/100.0],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if main_result and main_result.get("status") == "success":
-            actors.append(main_result.get("result"))
         
         # Entrance canopy
-        canopy_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Canopy",
             "type": "StaticMeshActor",
             "location": [location[0], location[1] - depth/2 - 150, location[2] + floor_height],
             "scale": [width/100.0 * 0.8, 3.0, 0.3],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if canopy_result and canopy_result.get("status") == "success":
-            actors.append(canopy_result.get("result"))
         
         # Entrance pillars
         for i, x_offset in enumerate([-width/3, 0, width/3]):
-            pillar_result = _safe_spawn_building_actor(unreal, {
+            specs.append({
                 "name": f"{name_prefix}_Pillar_{i}",
                 "type": "StaticMeshActor",
                 "location": [location[0] + x_offset, location[1] - depth/2 - 100, location[2] + floor_height/2],
                 "scale": [0.5, 0.5, floor_height/100.0],
                 "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
             })
-            if pillar_result and pillar_result.get("status") == "success":
-                actors.append(pillar_result.get("result"))
         
         # Rooftop parking deck indicator
-        parking_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_RoofParking",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] + mall_height + 15],
             "scale": [width/100.0 * 0.9, depth/100.0 * 0.9, 0.2],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if parking_result and parking_result.get("status") == "success":
-            actors.append(parking_result.get("result"))
         
-        return {"success": True, "actors": actors}
+        return {"success": True, "actors": _spawn_building_actors(unreal, specs, name_prefix)}
         
     except Exception as e:
         logger.error(f"_create_shopping_mall error: {e}")
@@ -379,86 +348,75 @@ def _create_parking_garage(levels: int, width: float, depth: float, location: Li
         if not unreal:
             return {"success": False, "actors": []}
             
-        actors = []
+        specs = []
         level_height = 120.0  # Low ceiling height for parking
         
         # Foundation
-        foundation_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Foundation",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] - 15],
             "scale": [(width + 50)/100.0, (depth + 50)/100.0, 0.3],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if foundation_result and foundation_result.get("status") == "success":
-            actors.append(foundation_result.get("result"))
+        
+        # Pillar grid and side barriers are the same on every level; only their height changes
+        pillars = [(x, y, location[0] + x, location[1] + y)
+                   for x in [-width/3, 0, width/3] for y in [-depth/3, 0, depth/3]]
+        pillar_scale = [0.4, 0.4, level_height/100.0]
+        barriers = (
+            ("left", location[0] - width/2, location[1], [0.1, depth/100.0, 0.8]),
+            ("right", location[0] + width/2, location[1], [0.1, depth/100.0, 0.8]),
+            ("front", location[0], location[1] - depth/2, [width/100.0, 0.1, 0.8]),
+            ("back", location[0], location[1] + depth/2, [width/100.0, 0.1, 0.8]),
+        )
+        floor_scale = [width/100.0, depth/100.0, 0.2]
         
         # Create each level with open sides
         for level in range(levels):
             level_z = location[2] + level * level_height
             
             # Floor slab
-            floor_result = _safe_spawn_building_actor(unreal, {
+            specs.append({
                 "name": f"{name_prefix}_Floor_{level}",
                 "type": "StaticMeshActor",
                 "location": [location[0], location[1], level_z],
-                "scale": [width/100.0, depth/100.0, 0.2],
+                "scale": list(floor_scale),
                 "static_mesh": "/Engine/BasicShapes/Cube.Cube"
             })
-            if floor_result and floor_result.get("status") == "success":
-                actors.append(floor_result.get("result"))
             
             # Support pillars
-            for x in [-width/3, 0, width/3]:
-                for y in [-depth/3, 0, depth/3]:
-                    pillar_result = _safe_spawn_building_actor(unreal, {
-                        "name": f"{name_prefix}_Pillar_{level}_{x}_{y}",
-                        "type": "StaticMeshActor",
-                        "location": [location[0] + x, location[1] + y, level_z + level_height/2],
-                        "scale": [0.4, 0.4, level_height/100.0],
-                        "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-                    })
-                    if pillar_result and pillar_result.get("status") == "success":
-                        actors.append(pillar_result.get("result"))
+            pillar_z = level_z + level_height/2
+            for x, y, pillar_x, pillar_y in pillars:
+                specs.append({
+                    "name": f"{name_prefix}_Pillar_{level}_{x}_{y}",
+                    "type": "StaticMeshActor",
+                    "location": [pillar_x, pillar_y, pillar_z],
+                    "scale": list(pillar_scale),
+                    "static_mesh": "/Engine/BasicShapes/Cube.Cube"
+                })
             
             # Side barriers (partial walls)
             if level > 0:  # Not on ground level
-                for side in ["left", "right", "front", "back"]:
-                    if side == "left":
-                        barrier_loc = [location[0] - width/2, location[1], level_z + 40]
-                        barrier_scale = [0.1, depth/100.0, 0.8]
-                    elif side == "right":
-                        barrier_loc = [location[0] + width/2, location[1], level_z + 40]
-                        barrier_scale = [0.1, depth/100.0, 0.8]
-                    elif side == "front":
-                        barrier_loc = [location[0], location[1] - depth/2, level_z + 40]
-                        barrier_scale = [width/100.0, 0.1, 0.8]
-                    else:  # back
-                        barrier_loc = [location[0], location[1] + depth/2, level_z + 40]
-                        barrier_scale = [width/100.0, 0.1, 0.8]
-                    
-                    barrier_result = _safe_spawn_building_actor(unreal, {
+                for side, barrier_x, barrier_y, barrier_scale in barriers:
+                    specs.append({
                         "name": f"{name_prefix}_Barrier_{level}_{side}",
                         "type": "StaticMeshActor",
-                        "location": barrier_loc,
-                        "scale": barrier_scale,
+                        "location": [barrier_x, barrier_y, level_z + 40],
+                        "scale": list(barrier_scale),
                         "static_mesh": "/Engine/BasicShapes/Cube.Cube"
                     })
-                    if barrier_result and barrier_result.get("status") == "success":
-                        actors.append(barrier_result.get("result"))
         
         # Ramp structure (simplified)
-        ramp_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Ramp",
             "type": "StaticMeshActor",
             "location": [location[0] + width/2 + 100, location[1], location[2] + (levels * level_height)/2],
             "scale": [1.5, 2.0, levels * level_height/100.0],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if ramp_result and ramp_result.get("status") == "success":
-            actors.append(ramp_result.get("result"))
         
-        return {"success": True, "actors": actors}
+        return {"success": True, "actors": _spawn_building_actors(unreal, specs, name_prefix)}
         
     except Exception as e:
         logger.error(f"_create_parking_garage error: {e}")
@@ -476,79 +434,67 @@ def _create_hotel(floors: int, width: float, depth: float, location: List[float]
         if not unreal:
             return {"success": False, "actors": []}
             
-        actors = []
+        specs = []
         floor_height = 130.0
         
         # Grand foundation
-        foundation_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Foundation",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] - 20],
             "scale": [(width + 150)/100.0, (depth + 150)/100.0, 0.4],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if foundation_result and foundation_result.get("status") == "success":
-            actors.append(foundation_result.get("result"))
         
         # Lobby (extra tall)
         lobby_height = floor_height * 2
-        lobby_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Lobby",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] + lobby_height/2],
             "scale": [width/100.0, depth/100.0, lobby_height/100.0],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if lobby_result and lobby_result.get("status") == "success":
-            actors.append(lobby_result.get("result"))
         
         # Main tower
         tower_height = (floors - 2) * floor_height
-        tower_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Tower",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] + lobby_height + tower_height/2],
             "scale": [width/100.0 * 0.9, depth/100.0 * 0.9, tower_height/100.0],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if tower_result and tower_result.get("status") == "success":
-            actors.append(tower_result.get("result"))
         
         # Penthouse (top floor wider)
         penthouse_height = location[2] + lobby_height + tower_height
-        penthouse_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Penthouse",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], penthouse_height + floor_height/2],
             "scale": [width/100.0, depth/100.0, floor_height/100.0],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if penthouse_result and penthouse_result.get("status") == "success":
-            actors.append(penthouse_result.get("result"))
         
         # Rooftop pool area
-        pool_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Pool",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], penthouse_height + floor_height + 20],
             "scale": [width/100.0 * 0.5, depth/100.0 * 0.3, 0.2],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if pool_result and pool_result.get("status") == "success":
-            actors.append(pool_result.get("result"))
         
         # Entrance canopy
-        canopy_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Canopy",
             "type": "StaticMeshActor",
             "location": [location[0], location[1] - depth/2 - 100, location[2] + 150],
             "scale": [width/100.0 * 0.6, 2.0, 0.2],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if canopy_result and canopy_result.get("status") == "success":
-            actors.append(canopy_result.get("result"))
         
-        return {"success": True, "actors": actors}
+        return {"success": True, "actors": _spawn_building_actors(unreal, specs, name_prefix)}
         
     except Exception as e:
         logger.error(f"_create_hotel error: {e}")
@@ -566,54 +512,46 @@ def _create_restaurant(width: float, depth: float, location: List[float], name_p
         if not unreal:
             return {"success": False, "actors": []}
             
-        actors = []
+        specs = []
         height = 150.0
         
         # Foundation
-        foundation_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Foundation",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] - 10],
             "scale": [(width + 50)/100.0, (depth + 50)/100.0, 0.2],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if foundation_result and foundation_result.get("status") == "success":
-            actors.append(foundation_result.get("result"))
         
         # Main building
-        main_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Main",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] + height/2],
             "scale": [width/100.0, depth/100.0, height/100.0],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if main_result and main_result.get("status") == "success":
-            actors.append(main_result.get("result"))
         
         # Outdoor seating area (patio)
-        patio_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Patio",
             "type": "StaticMeshActor",
             "location": [location[0], location[1] - depth/2 - 75, location[2]],
             "scale": [width/100.0, 1.5, 0.1],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if patio_result and patio_result.get("status") == "success":
-            actors.append(patio_result.get("result"))
         
         # Awning
-        awning_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Awning",
             "type": "StaticMeshActor",
             "location": [location[0], location[1] - depth/2 - 50, location[2] + height - 20],
             "scale": [width/100.0 * 1.2, 1.0, 0.1],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if awning_result and awning_result.get("status") == "success":
-            actors.append(awning_result.get("result"))
         
-        return {"success": True, "actors": actors}
+        return {"success": True, "actors": _spawn_building_actors(unreal, specs, name_prefix)}
         
     except Exception as e:
         logger.error(f"_create_restaurant error: {e}")
@@ -631,43 +569,37 @@ def _create_store(width: float, depth: float, location: List[float], name_prefix
         if not unreal:
             return {"success": False, "actors": []}
             
-        actors = []
+        specs = []
         height = 140.0
         
         # Foundation
-        foundation_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Foundation",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] - 10],
             "scale": [(width + 30)/100.0, (depth + 30)/100.0, 0.2],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if foundation_result and foundation_result.get("status") == "success":
-            actors.append(foundation_result.get("result"))
         
         # Main building
-        main_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Main",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] + height/2],
             "scale": [width/100.0, depth/100.0, height/100.0],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if main_result and main_result.get("status") == "success":
-            actors.append(main_result.get("result"))
         
         # Storefront sign
-        sign_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Sign",
             "type": "StaticMeshActor",
             "location": [location[0], location[1] - depth/2 - 10, location[2] + height + 20],
             "scale": [width/100.0 * 0.8, 0.1, 0.4],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if sign_result and sign_result.get("status") == "success":
-            actors.append(sign_result.get("result"))
         
-        return {"success": True, "actors": actors}
+        return {"success": True, "actors": _spawn_building_actors(unreal, specs, name_prefix)}
         
     except Exception as e:
         logger.error(f"_create_store error: {e}")
@@ -685,55 +617,47 @@ def _create_apartment_building(floors: int, width: float, depth: float, location
         if not unreal:
             return {"success": False, "actors": []}
             
-        actors = []
+        specs = []
         floor_height = 110.0
         
         # Foundation
-        foundation_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Foundation",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] - 15],
             "scale": [(width + 50)/100.0, (depth + 50)/100.0, 0.3],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if foundation_result and foundation_result.get("status") == "success":
-            actors.append(foundation_result.get("result"))
         
         # Main building
         building_height = floors * floor_height
-        building_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Building",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] + building_height/2],
             "scale": [width/100.0, depth/100.0, building_height/100.0],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if building_result and building_result.get("status") == "success":
-            actors.append(building_result.get("result"))
         
         # Entry steps
-        steps_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Steps",
             "type": "StaticMeshActor",
             "location": [location[0], location[1] - depth/2 - 30, location[2] + 10],
             "scale": [width/100.0 * 0.3, 0.6, 0.2],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if steps_result and steps_result.get("status") == "success":
-            actors.append(steps_result.get("result"))
         
         # Simple roof
-        roof_result = _safe_spawn_building_actor(unreal, {
+        specs.append({
             "name": f"{name_prefix}_Roof",
             "type": "StaticMeshActor",
             "location": [location[0], location[1], location[2] + building_height + 15],
             "scale": [(width + 20)/100.0, (depth + 20)/100.0, 0.3],
             "static_mesh": "/Engine/BasicShapes/Cube.Cube"
         })
-        if roof_result and roof_result.get("status") == "success":
-            actors.append(roof_result.get("result"))
         
-        return {"success": True, "actors": actors}
+        return {"success": True, "actors": _spawn_building_actors(unreal, specs, name_prefix)}
         
     except Exception as e:
         logger.error(f"_create_apartment_building error: {e}")
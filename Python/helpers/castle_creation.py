@@ -3,314 +3,373 @@ Castle creation helper functions for Unreal MCP Server.
 Contains logic for building complex castle fortresses with walls, towers, and villages.
 """
 
+import functools
 import math
-from typing import List, Dict, Any, Tuple
+import sys
+from typing import List, Dict, Any, NamedTuple, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 # Import safe spawning functions
 try:
-    from .actor_name_manager import safe_spawn_actor
+    from .actor_name_manager import (
+        safe_batch_spawn_actors, safe_spawn_instanced_meshes, safe_spawn_composite_actors,
+        flatten_composite_specs, collect_batch_successes
+    )
 except ImportError:
     logger.warning("Could not import actor_name_manager, using fallback spawning")
-    def safe_spawn_actor(unreal_connection, params, auto_unique_name=True):
-        return unreal_connection.send_command("spawn_actor", params)
-
-def _safe_spawn_castle_actor(unreal, params):
-    """Helper function to safely spawn castle actors and track results."""
-    resp = safe_spawn_actor(unreal, params, auto_unique_name=True)
-    return resp
+    def safe_batch_spawn_actors(unreal_connection, actor_specs, auto_unique_name=True):
+        # The spawns are independent, so pipeline them instead of waiting on each round trip
+        return {"status": "success", "results": unreal_connection.send_commands([("spawn_actor", spec) for spec in actor_specs])}
+    
+    def safe_spawn_instanced_meshes(unreal_connection, actor_specs, name_prefix, auto_unique_name=True):
+        return safe_batch_spawn_actors(unreal_connection, actor_specs, auto_unique_name)
+    
+    def flatten_composite_specs(composites):
+        return [
+            {"name": part["name"], "type": "StaticMeshActor",
+             "location": tuple(c + p for c, p in zip(composite["location"], part["location"])),
+             **{key: part[key] for key in ("rotation", "scale", "static_mesh") if key in part}}
+            for composite in composites for part in composite["parts"]
+        ]
+    
+    def safe_spawn_composite_actors(unreal_connection, composites, auto_unique_name=True):
+        return safe_batch_spawn_actors(unreal_connection, flatten_composite_specs(composites), auto_unique_name)
+    
+    def collect_batch_successes(batch_result, actors, label):
+        actors.extend(r["result"] for r in batch_result.get("results", ()) if r and r.get("status") == "success")
+        return actors
+
+# Interned like the server's CUBE_MESH / CYLINDER_MESH, so castle specs and the server's
+# own specs share one object per path and mesh table lookups take the identity fast path
+_CUBE_MESH = sys.intern("/Engine/BasicShapes/Cube.Cube")
+_CYLINDER_MESH = sys.intern("/Engine/BasicShapes/Cylinder.Cylinder")
+_CONE_MESH = sys.intern("/Engine/BasicShapes/Cone.Cone")
+_SPHERE_MESH = sys.intern("/Engine/BasicShapes/Sphere.Sphere")
+
+def _static_mesh_spec(name: str, location, scale, static_mesh: str, rotation=None) -> Dict[str, Any]:
+    """Build the batch_spawn spec for one castle piece."""
+    if rotation is None:
+        return {"name": name, "type": "StaticMeshActor", "location": location, "scale": scale,
+                "static_mesh": static_mesh}
+    return {"name": name, "type": "StaticMeshActor", "location": location, "rotation": rotation,
+            "scale": scale, "static_mesh": static_mesh}
+
+def _batch_spawn_castle_actors(unreal, specs: List[Dict[str, Any]], all_actors: List, group_name: str,
+                               instanced: bool = False) -> List:
+    """
+    Spawn all castle actor specs in one batch and collect the successful results.
+    
+    With instanced=True the specs become one instanced static mesh actor per mesh,
+    named "{group_name}_{mesh asset name}", instead of one actor per piece.
+    """
+    if instanced:
+        batch_result = safe_spawn_instanced_meshes(unreal, specs, group_name, auto_unique_name=True)
+    else:
+        batch_result = safe_batch_spawn_actors(unreal, specs, auto_unique_name=True)
+    return collect_batch_successes(batch_result, all_actors, group_name)
+
+
+def _spawn_castle_composites(unreal, composites: List[Dict[str, Any]], all_actors: List, group_name: str,
+                             instanced: bool = False) -> List:
+    """
+    Spawn rigid multi-part pieces (catapults, flags) as one actor each and collect the results.
+    
+    With instanced=True the parts join the group's instanced meshes like any other spec.
+    """
+    if instanced:
+        return _batch_spawn_castle_actors(unreal, flatten_composite_specs(composites), all_actors, group_name, True)
+    batch_result = safe_spawn_composite_actors(unreal, composites, auto_unique_name=True)
+    return collect_batch_successes(batch_result, all_actors, group_name)
+
+
+def _mesh_part(name: str, location, scale, static_mesh: str, rotation=None) -> Dict[str, Any]:
+    """Build one part of a composite piece; the location is relative to the composite."""
+    part = {"name": name, "location": location}
+    if rotation is not None:
+        part["rotation"] = rotation
+    part["scale"] = scale
+    part["static_mesh"] = static_mesh
+    return part
+
+
+# Unscaled castle measurements per size preset
+_CASTLE_SIZE_PARAMS = {
+    "small": {
+        "outer_width": 6000, "outer_depth": 6000, 
+        "inner_width": 3000, "inner_depth": 3000, 
+        "wall_height": 800, "tower_count": 8, "tower_height": 1200
+    },
+    "medium": {
+        "outer_width": 8000, "outer_depth": 8000, 
+        "inner_width": 4000, "inner_depth": 4000, 
+        "wall_height": 1000, "tower_count": 12, "tower_height": 1600
+    },
+    "large": {
+        "outer_width": 12000, "outer_depth": 12000, 
+        "inner_width": 6000, "inner_depth": 6000, 
+        "wall_height": 1200, "tower_count": 16, "tower_height": 2000
+    },
+    "epic": {
+        "outer_width": 16000, "outer_depth": 16000, 
+        "inner_width": 8000, "inner_depth": 8000, 
+        "wall_height": 1600, "tower_count": 24, "tower_height": 2800
+    }
+}
 
 
 def get_castle_size_params(castle_size: str) -> Dict[str, int]:
     """Get size parameters for different castle sizes."""
-    size_params = {
-        "small": {
-            "outer_width": 6000, "outer_depth": 6000, 
-            "inner_width": 3000, "inner_depth": 3000, 
-            "wall_height": 800, "tower_count": 8, "tower_height": 1200
-        },
-        "medium": {
-            "outer_width": 8000, "outer_depth": 8000, 
-            "inner_width": 4000, "inner_depth": 4000, 
-            "wall_height": 1000, "tower_count": 12, "tower_height": 1600
-        },
-        "large": {
-            "outer_width": 12000, "outer_depth": 12000, 
-            "inner_width": 6000, "inner_depth": 6000, 
-            "wall_height": 1200, "tower_count": 16, "tower_height": 2000
-        },
-        "epic": {
-            "outer_width": 16000, "outer_depth": 16000, 
-            "inner_width": 8000, "inner_depth": 8000, 
-            "wall_height": 1600, "tower_count": 24, "tower_height": 2800
-        }
-    }
-    return size_params.get(castle_size, size_params["large"])
-
-
-def calculate_scaled_dimensions(params: Dict[str, int], scale_factor: float = 2.0) -> Dict[str, int]:
+    return _CASTLE_SIZE_PARAMS.get(castle_size, _CASTLE_SIZE_PARAMS["large"])
+
+
+class CastleDimensions(NamedTuple):
+    """Scaled castle measurements shared by every builder."""
+    outer_width: int
+    outer_depth: int
+    inner_width: int
+    inner_depth: int
+    wall_height: int
+    tower_count: int
+    tower_height: int
+    complexity_multiplier: int
+    gate_tower_offset: int
+    barbican_offset: int
+    drawbridge_offset: int
+    wall_thickness: int
+
+
+def calculate_scaled_dimensions(params: Dict[str, int], scale_factor: float = 2.0) -> CastleDimensions:
     """Calculate scaled dimensions based on size parameters and scale factor."""
     complexity_multiplier = max(1, int(round(scale_factor)))
     
-    return {
-        "outer_width": int(params["outer_width"] * scale_factor),
-        "outer_depth": int(params["outer_depth"] * scale_factor),
-        "inner_width": int(params["inner_width"] * scale_factor),
-        "inner_depth": int(params["inner_depth"] * scale_factor),
-        "wall_height": int(params["wall_height"] * scale_factor),
-        "tower_count": int(params["tower_count"] * complexity_multiplier),
-        "tower_height": int(params["tower_height"] * scale_factor),
-        "complexity_multiplier": complexity_multiplier,
-        "gate_tower_offset": int(700 * scale_factor),
-        "barbican_offset": int(400 * scale_factor),
-        "drawbridge_offset": int(600 * scale_factor),
-        "wall_thickness": int(300 * max(1.0, scale_factor * 0.75))
-    }
+    return CastleDimensions(
+        outer_width=int(params["outer_width"] * scale_factor),
+        outer_depth=int(params["outer_depth"] * scale_factor),
+        inner_width=int(params["inner_width"] * scale_factor),
+        inner_depth=int(params["inner_depth"] * scale_factor),
+        wall_height=int(params["wall_height"] * scale_factor),
+        tower_count=int(params["tower_count"] * complexity_multiplier),
+        tower_height=int(params["tower_height"] * scale_factor),
+        complexity_multiplier=complexity_multiplier,
+        gate_tower_offset=int(700 * scale_factor),
+        barbican_offset=int(400 * scale_factor),
+        drawbridge_offset=int(600 * scale_factor),
+        wall_thickness=int(300 * max(1.0, scale_factor * 0.75))
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def get_castle_dimensions(castle_size: str, scale_factor: float = 2.0) -> CastleDimensions:
+    """Scaled dimensions for a castle size preset, computed once per (size, scale)."""
+    return calculate_scaled_dimensions(get_castle_size_params(castle_size), scale_factor)
+
+
+@functools.lru_cache(maxsize=32)
+def _wall_segment_offsets(length: int, segment: int = 200) -> Tuple[float, ...]:
+    """
+    Offsets from the wall center of the whole segments tiling a wall, starting at its low end.
+    
+    Wall lengths only come from the castle size presets, so the offsets are worked out
+    once per length and reused by every later castle.
+    """
+    start = segment/2 - length/2
+    return tuple(start + i * segment for i in range(length // segment))
+
+
+def _wall_segment_centers(center: float, length: int, segment: int = 200) -> List[float]:
+    """Centers of the whole segments tiling a wall of the given length, starting at its low end."""
+    return [center + offset for offset in _wall_segment_offsets(length, segment)]
+
+
+@functools.lru_cache(maxsize=32)
+def _ring_unit(count: int) -> Tuple[Tuple[float, float, float], ...]:
+    """
+    (angle, cos, sin) of count evenly spaced points on a unit circle, starting at angle 0.
+    
+    Ring sizes only depend on the castle size, so moat and village rings reuse the
+    same table across castles.
+    """
+    angles = ((2 * math.pi * i) / count for i in range(count))
+    return tuple((angle, math.cos(angle), math.sin(angle)) for angle in angles)
+
+
+# Wall runs as (wall name, battlement name, axis the run is laid along, side, gate gap).
+# The side is -1/+1 for the north/west or south/east face; battlements top every other
+# segment, and runs with a gate gap leave the segments around the center out.
+_OUTER_WALL_RUNS = (
+    ("WallNorth", "BattlementNorth", "x", -1, False),
+    ("WallSouth", "BattlementSouth", "x", 1, False),
+    ("WallEast", None, "y", 1, False),
+    ("WallWest", None, "y", -1, True),  # main gate
+)
+_INNER_WALL_RUNS = (
+    ("InnerWallNorth", None, "x", -1, False),
+    ("InnerWallSouth", None, "x", 1, False),
+    ("InnerWallEast", None, "y", 1, False),
+    ("InnerWallWest", None, "y", -1, False),
+)
+_GATE_GAP = 700
+
+
+def _append_wall_runs(specs: List[Dict[str, Any]], name_prefix: str, location: List[float], runs: tuple,
+                      width: int, depth: int, height: float, thickness: float) -> None:
+    """Append the wall segment specs (and battlements) for each run in a wall run table."""
+    # Segment centers and scales are shared by opposite walls, so compute them once
+    segment_centers = {"x": _wall_segment_centers(location[0], width),
+                       "y": _wall_segment_centers(location[1], depth)}
+    scales = {"x": (2.0, thickness/100, height/100), "y": (thickness/100, 2.0, height/100)}
+    battlement_scale = (1.0, thickness/100, 1.0)
+    wall_z = location[2] + height/2
+    battlement_z = location[2] + height + 50
+    
+    for wall_name, battlement_name, axis, side, gate_gap in runs:
+        if axis == "x":
+            face = location[1] + side * depth/2
+            positions = [(c, face) for c in segment_centers["x"]]
+        else:
+            face = location[0] + side * width/2
+            positions = [(face, c) for c in segment_centers["y"]]
+        # Name prefixes are formatted once per wall; segments only append their index
+        wall_prefix = f"{name_prefix}_{wall_name}_"
+        battlement_prefix = f"{name_prefix}_{battlement_name}_" if battlement_name else None
+        scale = scales[axis]
+        
+        for i, (x, y) in enumerate(positions):
+            if gate_gap and abs(y - location[1]) <= _GATE_GAP:
+                continue
+            specs.append(_static_mesh_spec(wall_prefix + str(i), (x, y, wall_z), scale, _CUBE_MESH))
+            if battlement_prefix and i % 2 == 0:
+                specs.append(_static_mesh_spec(battlement_prefix + str(i), (x, y, battlement_z),
+                                               battlement_scale, _CUBE_MESH))
+
+
+def _wall_actor_count(runs: tuple, width: int, depth: int) -> int:
+    """Number of wall and battlement actors _append_wall_runs adds for a wall run table."""
+    count = 0
+    for _, battlement_name, axis, _, gate_gap in runs:
+        offsets = _wall_segment_offsets(width if axis == "x" else depth)
+        if gate_gap:
+            # Gate gaps only sit on walls laid along y, whose offsets are those of the depth
+            segments = [i for i, offset in enumerate(offsets) if abs(offset) > _GATE_GAP]
+        else:
+            segments = range(len(offsets))
+        count += len(segments)
+        if battlement_name:
+            count += sum(1 for i in segments if i % 2 == 0)
+    return count
+
+
+def estimate_castle_actor_count(dimensions: CastleDimensions, castle_size: str,
+                                include_siege_weapons: bool, include_village: bool) -> int:
+    """
+    Projected number of actors a non-instanced castle spawns, worked out before anything is spawned.
+    
+    Walls, walkways, annexes and the village grow with the castle's dimensions and are
+    counted from the same formulas the builders use; the remaining sections are small
+    fixed groups. The result is an upper bound (a few village houses give way to the gate).
+    """
+    outer_width = dimensions.outer_width
+    outer_depth = dimensions.outer_depth
+    complexity_multiplier = dimensions.complexity_multiplier
+    
+    count = _wall_actor_count(_OUTER_WALL_RUNS, outer_width, outer_depth)
+    count += _wall_actor_count(_INNER_WALL_RUNS, dimensions.inner_width, dimensions.inner_depth)
+    
+    # Bailey annexes: perimeter walkways, an annex plus door per north/south slot, one annex per east/west slot
+    spacing = 2400
+    count += 2 * (outer_width // 400) + 2 * (outer_depth // 400)
+    count += 4 * (max(0, outer_width - 2 * spacing) // spacing + 1)
+    count += 2 * (max(0, outer_depth - 2 * spacing) // spacing + 1)
+    
+    # Wall towers, plus the gate, corner towers, keep, courtyard, moat and flags
+    count += 2 * max(3, 3 * complexity_multiplier) + 195
+    
+    if include_siege_weapons:
+        count += 8
+    if include_village:
+        num_houses = (24 if castle_size == "epic" else 16) * complexity_multiplier
+        # Houses and roofs in both rings, market stalls with canopies, and the workshops
+        count += 2 * num_houses + 2 * (num_houses // 2) + 16 * complexity_multiplier + 12
+    return count
 
 
 def build_outer_bailey_walls(unreal, name_prefix: str, location: List[float], 
-                           dimensions: Dict[str, int], all_actors: List) -> None:
+                           dimensions: CastleDimensions, all_actors: List,
+                           instanced: bool = False) -> None:
     """Build the outer bailey walls with battlements."""
-    logger.info("Constructing massive outer bailey walls...")
-    
-    outer_width = dimensions["outer_width"]
-    outer_depth = dimensions["outer_depth"]
-    wall_height = dimensions["wall_height"]
-    wall_thickness = dimensions["wall_thickness"]
-    
-    # North wall
-    for i in range(int(outer_width / 200)):
-        wall_x = location[0] - outer_width/2 + i * 200 + 100
-        wall_name = f"{name_prefix}_WallNorth_{i}"
-        wall_result = _safe_spawn_castle_actor(unreal, {
-            "name": wall_name,
-            "type": "StaticMeshActor",
-            "location": [wall_x, location[1] - outer_depth/2, location[2] + wall_height/2],
-            "scale": [2.0, wall_thickness/100, wall_height/100],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if wall_result and wall_result.get("status") == "success":
-            all_actors.append(wall_result.get("result"))
-        
-        # Dense battlements
-        if i % 2 == 0:
-            battlement_name = f"{name_prefix}_BattlementNorth_{i}"
-            battlement_result = _safe_spawn_castle_actor(unreal, {
-                "name": battlement_name,
-                "type": "StaticMeshActor",
-                "location": [wall_x, location[1] - outer_depth/2, location[2] + wall_height + 50],
-                "scale": [1.0, wall_thickness/100, 1.0],
-                "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-            })
-            if battlement_result and battlement_result.get("status") == "success":
-                all_actors.append(battlement_result.get("result"))
-    
-    # South wall
-    for i in range(int(outer_width / 200)):
-        wall_x = location[0] - outer_width/2 + i * 200 + 100
-        wall_name = f"{name_prefix}_WallSouth_{i}"
-        wall_result = _safe_spawn_castle_actor(unreal, {
-            "name": wall_name,
-            "type": "StaticMeshActor",
-            "location": [wall_x, location[1] + outer_depth/2, location[2] + wall_height/2],
-            "scale": [2.0, wall_thickness/100, wall_height/100],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if wall_result and wall_result.get("status") == "success":
-            all_actors.append(wall_result.get("result"))
-        
-        if i % 2 == 0:
-            battlement_name = f"{name_prefix}_BattlementSouth_{i}"
-            battlement_result = _safe_spawn_castle_actor(unreal, {
-                "name": battlement_name,
-                "type": "StaticMeshActor",
-                "location": [wall_x, location[1] + outer_depth/2, location[2] + wall_height + 50],
-                "scale": [1.0, wall_thickness/100, 1.0],
-                "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-            })
-            if battlement_result and battlement_result.get("status") == "success":
-                all_actors.append(battlement_result.get("result"))
-    
-    # East wall
-    for i in range(int(outer_depth / 200)):
-        wall_y = location[1] - outer_depth/2 + i * 200 + 100
-        wall_name = f"{name_prefix}_WallEast_{i}"
-        wall_result = _safe_spawn_castle_actor(unreal, {
-            "name": wall_name,
-            "type": "StaticMeshActor",
-            "location": [location[0] + outer_width/2, wall_y, location[2] + wall_height/2],
-            "scale": [wall_thickness/100, 2.0, wall_height/100],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if wall_result and wall_result.get("status") == "success":
-            all_actors.append(wall_result.get("result"))
-    
-    # West wall with main gate
-    for i in range(int(outer_depth / 200)):
-        wall_y = location[1] - outer_depth/2 + i * 200 + 100
-        # Skip middle sections for massive gate
-        if abs(wall_y - location[1]) > 700:
-            wall_name = f"{name_prefix}_WallWest_{i}"
-            wall_result = _safe_spawn_castle_actor(unreal, {
-                "name": wall_name,
-                "type": "StaticMeshActor",
-                "location": [location[0] - outer_width/2, wall_y, location[2] + wall_height/2],
-                "scale": [wall_thickness/100, 2.0, wall_height/100],
-                "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-            })
-            if wall_result and wall_result.get("status") == "success":
-                all_actors.append(wall_result.get("result"))
+    logger.debug("Constructing massive outer bailey walls...")
+    specs = []
+    _append_wall_runs(specs, name_prefix, location, _OUTER_WALL_RUNS, dimensions.outer_width,
+                      dimensions.outer_depth, dimensions.wall_height, dimensions.wall_thickness)
+    _batch_spawn_castle_actors(unreal, specs, all_actors, f"{name_prefix}_OuterWalls", instanced)
 
 
 def build_inner_bailey_walls(unreal, name_prefix: str, location: List[float], 
-                           dimensions: Dict[str, int], all_actors: List) -> None:
+                           dimensions: CastleDimensions, all_actors: List,
+                           instanced: bool = False) -> None:
     """Build the inner bailey walls (higher and stronger)."""
-    logger.info("Building inner bailey fortifications...")
-    
-    inner_width = dimensions["inner_width"]
-    inner_depth = dimensions["inner_depth"]
-    wall_thickness = dimensions["wall_thickness"]
-    inner_wall_height = dimensions["wall_height"] * 1.3
-    
-    # Inner North wall
-    for i in range(int(inner_width / 200)):
-        wall_x = location[0] - inner_width/2 + i * 200 + 100
-        wall_name = f"{name_prefix}_InnerWallNorth_{i}"
-        wall_result = _safe_spawn_castle_actor(unreal, {
-            "name": wall_name,
-            "type": "StaticMeshActor",
-            "location": [wall_x, location[1] - inner_depth/2, location[2] + inner_wall_height/2],
-            "scale": [2.0, wall_thickness/100, inner_wall_height/100],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if wall_result and wall_result.get("status") == "success":
-            all_actors.append(wall_result.get("result"))
-    
-    # Inner South wall
-    for i in range(int(inner_width / 200)):
-        wall_x = location[0] - inner_width/2 + i * 200 + 100
-        wall_name = f"{name_prefix}_InnerWallSouth_{i}"
-        wall_result = _safe_spawn_castle_actor(unreal, {
-            "name": wall_name,
-            "type": "StaticMeshActor",
-            "location": [wall_x, location[1] + inner_depth/2, location[2] + inner_wall_height/2],
-            "scale": [2.0, wall_thickness/100, inner_wall_height/100],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if wall_result and wall_result.get("status") == "success":
-            all_actors.append(wall_result.get("result"))
-    
-    # Inner East and West walls
-    for i in range(int(inner_depth / 200)):
-        wall_y = location[1] - inner_depth/2 + i * 200 + 100
-        
-        # East inner wall
-        wall_name = f"{name_prefix}_InnerWallEast_{i}"
-        wall_result = _safe_spawn_castle_actor(unreal, {
-            "name": wall_name,
-            "type": "StaticMeshActor",
-            "location": [location[0] + inner_width/2, wall_y, location[2] + inner_wall_height/2],
-            "scale": [wall_thickness/100, 2.0, inner_wall_height/100],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if wall_result and wall_result.get("status") == "success":
-            all_actors.append(wall_result.get("result"))
-        
-        # West inner wall
-        wall_name = f"{name_prefix}_InnerWallWest_{i}"
-        wall_result = _safe_spawn_castle_actor(unreal, {
-            "name": wall_name,
-            "type": "StaticMeshActor",
-            "location": [location[0] - inner_width/2, wall_y, location[2] + inner_wall_height/2],
-            "scale": [wall_thickness/100, 2.0, inner_wall_height/100],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if wall_result and wall_result.get("status") == "success":
-            all_actors.append(wall_result.get("result"))
+    logger.debug("Building inner bailey fortifications...")
+    specs = []
+    _append_wall_runs(specs, name_prefix, location, _INNER_WALL_RUNS, dimensions.inner_width,
+                      dimensions.inner_depth, dimensions.wall_height * 1.3, dimensions.wall_thickness)
+    _batch_spawn_castle_actors(unreal, specs, all_actors, f"{name_prefix}_InnerWalls", instanced)
 
 
 def build_gate_complex(unreal, name_prefix: str, location: List[float], 
-                      dimensions: Dict[str, int], all_actors: List) -> None:
+                      dimensions: CastleDimensions, all_actors: List,
+                      instanced: bool = False) -> None:
     """Build the massive main gate complex."""
-    logger.info("Building elaborate main gate complex...")
+    logger.debug("Building elaborate main gate complex...")
+    specs = []
     
-    outer_width = dimensions["outer_width"]
-    inner_width = dimensions["inner_width"]
-    tower_height = dimensions["tower_height"]
-    wall_height = dimensions["wall_height"]
-    gate_tower_offset = dimensions["gate_tower_offset"]
-    barbican_offset = dimensions["barbican_offset"]
+    outer_width = dimensions.outer_width
+    inner_width = dimensions.inner_width
+    tower_height = dimensions.tower_height
+    wall_height = dimensions.wall_height
+    gate_tower_offset = dimensions.gate_tower_offset
+    barbican_offset = dimensions.barbican_offset
     
     # OUTER Gate towers (much larger)
+    gate_x = location[0] - outer_width/2
     for side in [-1, 1]:
-        gate_tower_name = f"{name_prefix}_GateTower_{side}"
-        gate_tower_result = _safe_spawn_castle_actor(unreal, {
-            "name": gate_tower_name,
-            "type": "StaticMeshActor",
-            "location": [
-                location[0] - outer_width/2,
-                location[1] + side * gate_tower_offset,
-                location[2] + tower_height/2
-            ],
-            "scale": [4.0, 4.0, tower_height/100],
-            "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
-        })
-        if gate_tower_result and gate_tower_result.get("status") == "success":
-            all_actors.append(gate_tower_result.get("result"))
+        gate_tower_y = location[1] + side * gate_tower_offset
+        specs.append(_static_mesh_spec(f"{name_prefix}_GateTower_{side}",
+                                       (gate_x, gate_tower_y, location[2] + tower_height/2),
+                                       (4.0, 4.0, tower_height/100), _CYLINDER_MESH))
         
         # Massive tower tops
-        tower_top_name = f"{name_prefix}_GateTowerTop_{side}"
-        tower_top_result = _safe_spawn_castle_actor(unreal, {
-            "name": tower_top_name,
-            "type": "StaticMeshActor",
-            "location": [
-                location[0] - outer_width/2,
-                location[1] + side * gate_tower_offset,
-                location[2] + tower_height + 200
-            ],
-            "scale": [5.0, 5.0, 0.8],
-            "static_mesh": "/Engine/BasicShapes/Cone.Cone"
-        })
-        if tower_top_result and tower_top_result.get("status") == "success":
-            all_actors.append(tower_top_result.get("result"))
+        specs.append(_static_mesh_spec(f"{name_prefix}_GateTowerTop_{side}",
+                                       (gate_x, gate_tower_y, location[2] + tower_height + 200),
+                                       (5.0, 5.0, 0.8), _CONE_MESH))
     
     # BARBICAN (outer gate structure)
     barbican_name = f"{name_prefix}_Barbican"
-    barbican_result = _safe_spawn_castle_actor(unreal, {
-        "name": barbican_name,
-        "type": "StaticMeshActor",
-        "location": [location[0] - outer_width/2 - barbican_offset, location[1], location[2] + wall_height/2],
-        "scale": [8.0, 12.0, wall_height/100],
-        "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-    })
-    if barbican_result and barbican_result.get("status") == "success":
-        all_actors.append(barbican_result.get("result"))
+    specs.append(_static_mesh_spec(barbican_name,
+                                   (location[0] - outer_width/2 - barbican_offset, location[1], location[2] + wall_height/2),
+                                   (8.0, 12.0, wall_height/100), _CUBE_MESH))
     
     # Main Portcullis (gate)
     portcullis_name = f"{name_prefix}_Portcullis"
-    portcullis_result = _safe_spawn_castle_actor(unreal, {
-        "name": portcullis_name,
-        "type": "StaticMeshActor",
-        "location": [location[0] - outer_width/2, location[1], location[2] + 200],
-        "scale": [0.5, 12.0, 8.0],
-        "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-    })
-    if portcullis_result and portcullis_result.get("status") == "success":
-        all_actors.append(portcullis_result.get("result"))
+    specs.append(_static_mesh_spec(portcullis_name,
+                                   (location[0] - outer_width/2, location[1], location[2] + 200),
+                                   (0.5, 12.0, 8.0), _CUBE_MESH))
     
     # Inner gate for inner bailey
     inner_portcullis_name = f"{name_prefix}_InnerPortcullis"
-    inner_portcullis_result = _safe_spawn_castle_actor(unreal, {
-        "name": inner_portcullis_name,
-        "type": "StaticMeshActor",
-        "location": [location[0] - inner_width/2, location[1], location[2] + 200],
-        "scale": [0.5, 8.0, 6.0],
-        "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-    })
-    if inner_portcullis_result and inner_portcullis_result.get("status") == "success":
-        all_actors.append(inner_portcullis_result.get("result"))
+    specs.append(_static_mesh_spec(inner_portcullis_name,
+                                   (location[0] - inner_width/2, location[1], location[2] + 200),
+                                   (0.5, 8.0, 6.0), _CUBE_MESH))
+    
+    _batch_spawn_castle_actors(unreal, specs, all_actors, f"{name_prefix}_GateComplex", instanced)
+
+
+# (yaw, dx, dy) of the window on each face of a corner tower, 350 units from its axis
+_TOWER_WINDOW_OFFSETS = tuple(
+    (angle, 350 * math.cos(angle * math.pi / 180), 350 * math.sin(angle * math.pi / 180))
+    for angle in (0, 90, 180, 270)
+)
 
 
 def get_corner_positions(location: List[float], width: int, depth: int) -> List[List[float]]:
@@ -324,170 +383,130 @@ def get_corner_positions(location: List[float], width: int, depth: int) -> List[
 
 
 def build_corner_towers(unreal, name_prefix: str, location: List[float], 
-                       dimensions: Dict[str, int], architectural_style: str, all_actors: List) -> None:
+                       dimensions: CastleDimensions, architectural_style: str, all_actors: List,
+                       instanced: bool = False) -> None:
     """Build massive corner towers for outer bailey."""
-    logger.info("Constructing massive corner towers...")
+    logger.debug("Constructing massive corner towers...")
+    specs = []
     
-    outer_width = dimensions["outer_width"]
-    outer_depth = dimensions["outer_depth"]
-    tower_height = dimensions["tower_height"]
+    outer_width = dimensions.outer_width
+    outer_depth = dimensions.outer_depth
+    tower_height = dimensions.tower_height
     
     outer_corners = get_corner_positions(location, outer_width, outer_depth)
+    window_heights = [location[2] + 300 + window_level * 300 for window_level in range(5)]
+    window_scale = (0.3, 0.5, 0.8)
+    tower_base_scale = (6.0, 6.0, 3.0)
+    tower_scale = (5.0, 5.0, tower_height/100)
+    tower_top_scale = (6.0, 6.0, 2.5)
     
     for i, corner in enumerate(outer_corners):
         # HUGE Tower base (much wider)
         tower_base_name = f"{name_prefix}_TowerBase_{i}"
-        tower_base_result = _safe_spawn_castle_actor(unreal, {
-            "name": tower_base_name,
-            "type": "StaticMeshActor",
-            "location": [corner[0], corner[1], location[2] + 150],
-            "scale": [6.0, 6.0, 3.0],
-            "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
-        })
-        if tower_base_result and tower_base_result.get("status") == "success":
-            all_actors.append(tower_base_result.get("result"))
+        specs.append(_static_mesh_spec(tower_base_name, (corner[0], corner[1], location[2] + 150),
+                                       tower_base_scale, _CYLINDER_MESH))
         
         # MASSIVE Main tower
         tower_name = f"{name_prefix}_Tower_{i}"
-        tower_result = _safe_spawn_castle_actor(unreal, {
-            "name": tower_name,
-            "type": "StaticMeshActor",
-            "location": [corner[0], corner[1], location[2] + tower_height/2],
-            "scale": [5.0, 5.0, tower_height/100],
-            "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
-        })
-        if tower_result and tower_result.get("status") == "success":
-            all_actors.append(tower_result.get("result"))
+        specs.append(_static_mesh_spec(tower_name, (corner[0], corner[1], location[2] + tower_height/2),
+                                       tower_scale, _CYLINDER_MESH))
         
         # HUGE Tower top (cone roof)
         if architectural_style in ["medieval", "fantasy"]:
             tower_top_name = f"{name_prefix}_TowerTop_{i}"
-            tower_top_result = _safe_spawn_castle_actor(unreal, {
-                "name": tower_top_name,
-                "type": "StaticMeshActor",
-                "location": [corner[0], corner[1], location[2] + tower_height + 150],
-                "scale": [6.0, 6.0, 2.5],
-                "static_mesh": "/Engine/BasicShapes/Cone.Cone"
-            })
-            if tower_top_result and tower_top_result.get("status") == "success":
-                all_actors.append(tower_top_result.get("result"))
+            specs.append(_static_mesh_spec(tower_top_name,
+                                           (corner[0], corner[1], location[2] + tower_height + 150),
+                                           tower_top_scale, _CONE_MESH))
         
         # Multiple levels of tower windows (5 levels instead of 3)
-        for window_level in range(5):
-            window_height = location[2] + 300 + window_level * 300
-            for angle in [0, 90, 180, 270]:
-                window_x = corner[0] + 350 * math.cos(angle * math.pi / 180)
-                window_y = corner[1] + 350 * math.sin(angle * math.pi / 180)
-                window_name = f"{name_prefix}_TowerWindow_{i}_{window_level}_{angle}"
-                window_result = _safe_spawn_castle_actor(unreal, {
-                    "name": window_name,
-                    "type": "StaticMeshActor",
-                    "location": [window_x, window_y, window_height],
-                    "rotation": [0, angle, 0],
-                    "scale": [0.3, 0.5, 0.8],
-                    "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-                })
-                if window_result and window_result.get("status") == "success":
-                    all_actors.append(window_result.get("result"))
+        for window_level, window_height in enumerate(window_heights):
+            window_prefix = f"{name_prefix}_TowerWindow_{i}_{window_level}_"
+            for angle, dx, dy in _TOWER_WINDOW_OFFSETS:
+                specs.append(_static_mesh_spec(window_prefix + str(angle),
+                                               (corner[0] + dx, corner[1] + dy, window_height), window_scale,
+                                               _CUBE_MESH, (0, angle, 0)))
+    
+    _batch_spawn_castle_actors(unreal, specs, all_actors, f"{name_prefix}_CornerTowers", instanced)
 
 
 def build_inner_corner_towers(unreal, name_prefix: str, location: List[float], 
-                             dimensions: Dict[str, int], all_actors: List) -> None:
+                             dimensions: CastleDimensions, all_actors: List,
+                             instanced: bool = False) -> None:
     """Build inner bailey corner towers (even more massive)."""
-    logger.info("Building inner bailey towers...")
+    logger.debug("Building inner bailey towers...")
+    specs = []
     
-    inner_width = dimensions["inner_width"]
-    inner_depth = dimensions["inner_depth"]
-    tower_height = dimensions["tower_height"]
+    inner_width = dimensions.inner_width
+    inner_depth = dimensions.inner_depth
+    tower_height = dimensions.tower_height
     
     inner_corners = get_corner_positions(location, inner_width, inner_depth)
+    inner_tower_height = tower_height * 1.4
+    tower_base_scale = (8.0, 8.0, 4.0)
+    tower_scale = (6.0, 6.0, inner_tower_height/100)
+    tower_top_scale = (8.0, 8.0, 3.0)
     
     for i, corner in enumerate(inner_corners):
         # ENORMOUS Tower base
         tower_base_name = f"{name_prefix}_InnerTowerBase_{i}"
-        tower_base_result = _safe_spawn_castle_actor(unreal, {
-            "name": tower_base_name,
-            "type": "StaticMeshActor",
-            "location": [corner[0], corner[1], location[2] + 200],
-            "scale": [8.0, 8.0, 4.0],
-            "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
-        })
-        if tower_base_result and tower_base_result.get("status") == "success":
-            all_actors.append(tower_base_result.get("result"))
+        specs.append(_static_mesh_spec(tower_base_name, (corner[0], corner[1], location[2] + 200),
+                                       tower_base_scale, _CYLINDER_MESH))
         
         # GIGANTIC Main inner tower
-        inner_tower_height = tower_height * 1.4
         tower_name = f"{name_prefix}_InnerTower_{i}"
-        tower_result = _safe_spawn_castle_actor(unreal, {
-            "name": tower_name,
-            "type": "StaticMeshActor",
-            "location": [corner[0], corner[1], location[2] + inner_tower_height/2],
-            "scale": [6.0, 6.0, inner_tower_height/100],
-            "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
-        })
-        if tower_result and tower_result.get("status") == "success":
-            all_actors.append(tower_result.get("result"))
+        specs.append(_static_mesh_spec(tower_name, (corner[0], corner[1], location[2] + inner_tower_height/2),
+                                       tower_scale, _CYLINDER_MESH))
         
         # MASSIVE Tower top
         tower_top_name = f"{name_prefix}_InnerTowerTop_{i}"
-        tower_top_result = _safe_spawn_castle_actor(unreal, {
-            "name": tower_top_name,
-            "type": "StaticMeshActor",
-            "location": [corner[0], corner[1], location[2] + inner_tower_height + 200],
-            "scale": [8.0, 8.0, 3.0],
-            "static_mesh": "/Engine/BasicShapes/Cone.Cone"
-        })
-        if tower_top_result and tower_top_result.get("status") == "success":
-            all_actors.append(tower_top_result.get("result"))
+        specs.append(_static_mesh_spec(tower_top_name,
+                                       (corner[0], corner[1], location[2] + inner_tower_height + 200),
+                                       tower_top_scale, _CONE_MESH))
+    
+    _batch_spawn_castle_actors(unreal, specs, all_actors, f"{name_prefix}_InnerCornerTowers", instanced)
 
 
 def build_intermediate_towers(unreal, name_prefix: str, location: List[float], 
-                            dimensions: Dict[str, int], all_actors: List) -> None:
+                            dimensions: CastleDimensions, all_actors: List,
+                            instanced: bool = False) -> None:
     """Add intermediate towers along walls."""
-    logger.info("Adding intermediate wall towers...")
+    logger.debug("Adding intermediate wall towers...")
+    specs = []
     
-    outer_width = dimensions["outer_width"]
-    outer_depth = dimensions["outer_depth"]
-    tower_height = dimensions["tower_height"]
-    complexity_multiplier = dimensions["complexity_multiplier"]
+    outer_width = dimensions.outer_width
+    outer_depth = dimensions.outer_depth
+    tower_height = dimensions.tower_height
+    complexity_multiplier = dimensions.complexity_multiplier
+    tower_z = location[2] + tower_height * 0.8/2
+    tower_scale = (3.0, 3.0, tower_height * 0.8/100)
     
     # North wall intermediate towers
     for i in range(max(3, 3 * complexity_multiplier)):
         tower_x = location[0] - outer_width/4 + i * outer_width/4
         tower_name = f"{name_prefix}_NorthWallTower_{i}"
-        tower_result = _safe_spawn_castle_actor(unreal, {
-            "name": tower_name,
-            "type": "StaticMeshActor",
-            "location": [tower_x, location[1] - outer_depth/2, location[2] + tower_height * 0.8/2],
-            "scale": [3.0, 3.0, tower_height * 0.8/100],
-            "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
-        })
-        if tower_result and tower_result.get("status") == "success":
-            all_actors.append(tower_result.get("result"))
+        specs.append(_static_mesh_spec(tower_name, (tower_x, location[1] - outer_depth/2, tower_z),
+                                       tower_scale, _CYLINDER_MESH))
     
     # South wall intermediate towers
     for i in range(max(3, 3 * complexity_multiplier)):
         tower_x = location[0] - outer_width/4 + i * outer_width/4
         tower_name = f"{name_prefix}_SouthWallTower_{i}"
-        tower_result = _safe_spawn_castle_actor(unreal, {
-            "name": tower_name,
-            "type": "StaticMeshActor",
-            "location": [tower_x, location[1] + outer_depth/2, location[2] + tower_height * 0.8/2],
-            "scale": [3.0, 3.0, tower_height * 0.8/100],
-            "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
-        })
-        if tower_result and tower_result.get("status") == "success":
-            all_actors.append(tower_result.get("result"))
+        specs.append(_static_mesh_spec(tower_name, (tower_x, location[1] + outer_depth/2, tower_z),
+                                       tower_scale, _CYLINDER_MESH))
+    
+    _batch_spawn_castle_actors(unreal, specs, all_actors, f"{name_prefix}_WallTowers", instanced)
 
 
 def build_central_keep(unreal, name_prefix: str, location: List[float], 
-                      dimensions: Dict[str, int], all_actors: List) -> None:
+                      dimensions: CastleDimensions, all_actors: List,
+                      instanced: bool = False) -> None:
     """Build the massive central keep complex."""
-    logger.info("Building enormous central keep complex...")
+    logger.debug("Building enormous central keep complex...")
+    specs = []
     
-    inner_width = dimensions["inner_width"]
-    inner_depth = dimensions["inner_depth"]
-    tower_height = dimensions["tower_height"]
+    inner_width = dimensions.inner_width
+    inner_depth = dimensions.inner_depth
+    tower_height = dimensions.tower_height
     
     keep_width = inner_width * 0.6
     keep_depth = inner_depth * 0.6
@@ -495,44 +514,25 @@ def build_central_keep(unreal, name_prefix: str, location: List[float],
     
     # MASSIVE Keep base
     keep_base_name = f"{name_prefix}_KeepBase"
-    keep_base_result = _safe_spawn_castle_actor(unreal, {
-        "name": keep_base_name,
-        "type": "StaticMeshActor",
-        "location": [location[0], location[1], location[2] + keep_height/2],
-        "scale": [keep_width/100, keep_depth/100, keep_height/100],
-        "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-    })
-    if keep_base_result and keep_base_result.get("status") == "success":
-        all_actors.append(keep_base_result.get("result"))
+    specs.append(_static_mesh_spec(keep_base_name, (location[0], location[1], location[2] + keep_height/2),
+                                   (keep_width/100, keep_depth/100, keep_height/100), _CUBE_MESH))
     
     # GIGANTIC central Keep spire/tower
     keep_spire_height = max(1200.0, tower_height * 1.0)
     keep_top_z = location[2] + keep_height
     keep_tower_name = f"{name_prefix}_KeepTower"
-    keep_tower_result = _safe_spawn_castle_actor(unreal, {
-        "name": keep_tower_name,
-        "type": "StaticMeshActor",
-        "location": [location[0], location[1], keep_top_z + keep_spire_height / 2.0],
-        "scale": [4.0, 4.0, keep_spire_height / 100.0],
-        "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
-    })
-    if keep_tower_result and keep_tower_result.get("status") == "success":
-        all_actors.append(keep_tower_result.get("result"))
+    specs.append(_static_mesh_spec(keep_tower_name,
+                                   (location[0], location[1], keep_top_z + keep_spire_height / 2.0),
+                                   (4.0, 4.0, keep_spire_height / 100.0), _CYLINDER_MESH))
     
     # ENORMOUS Great Hall (throne room)
     great_hall_name = f"{name_prefix}_GreatHall"
-    great_hall_result = _safe_spawn_castle_actor(unreal, {
-        "name": great_hall_name,
-        "type": "StaticMeshActor",
-        "location": [location[0], location[1] + keep_depth/3, location[2] + 200],
-        "scale": [keep_width/100 * 0.8, keep_depth/100 * 0.5, 6.0],
-        "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-    })
-    if great_hall_result and great_hall_result.get("status") == "success":
-        all_actors.append(great_hall_result.get("result"))
+    specs.append(_static_mesh_spec(great_hall_name,
+                                   (location[0], location[1] + keep_depth/3, location[2] + 200),
+                                   (keep_width/100 * 0.8, keep_depth/100 * 0.5, 6.0), _CUBE_MESH))
     
     # Additional keep towers (4 corner towers of the keep)
-    logger.info("Adding keep corner towers...")
+    logger.debug("Adding keep corner towers...")
     keep_corners = [
         [location[0] - keep_width/3, location[1] - keep_depth/3],
         [location[0] + keep_width/3, location[1] - keep_depth/3],
@@ -540,26 +540,25 @@ def build_central_keep(unreal, name_prefix: str, location: List[float],
         [location[0] - keep_width/3, location[1] + keep_depth/3],
     ]
     
+    keep_corner_tower_z = location[2] + keep_height * 0.8
+    keep_corner_tower_scale = (3.0, 3.0, keep_height/100 * 0.8)
     for i, corner in enumerate(keep_corners):
         keep_corner_tower_name = f"{name_prefix}_KeepCornerTower_{i}"
-        keep_corner_tower_result = _safe_spawn_castle_actor(unreal, {
-            "name": keep_corner_tower_name,
-            "type": "StaticMeshActor",
-            "location": [corner[0], corner[1], location[2] + keep_height * 0.8],
-            "scale": [3.0, 3.0, keep_height/100 * 0.8],
-            "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
-        })
-        if keep_corner_tower_result and keep_corner_tower_result.get("status") == "success":
-            all_actors.append(keep_corner_tower_result.get("result"))
+        specs.append(_static_mesh_spec(keep_corner_tower_name, (corner[0], corner[1], keep_corner_tower_z),
+                                       keep_corner_tower_scale, _CYLINDER_MESH))
+    
+    _batch_spawn_castle_actors(unreal, specs, all_actors, f"{name_prefix}_Keep", instanced)
 
 
 def build_courtyard_complex(unreal, name_prefix: str, location: List[float], 
-                          dimensions: Dict[str, int], all_actors: List) -> None:
+                          dimensions: CastleDimensions, all_actors: List,
+                          instanced: bool = False) -> None:
     """Build massive inner courtyard complex with various buildings."""
-    logger.info("Adding massive courtyard complex...")
+    logger.debug("Adding massive courtyard complex...")
+    specs = []
     
-    inner_width = dimensions["inner_width"]
-    inner_depth = dimensions["inner_depth"]
+    inner_width = dimensions.inner_width
+    inner_depth = dimensions.inner_depth
     
     buildings = [
         # [name, location_offset, scale]
@@ -577,26 +576,24 @@ def build_courtyard_complex(unreal, name_prefix: str, location: List[float],
     
     for building_name, offset, scale in buildings:
         building_full_name = f"{name_prefix}_{building_name}"
-        mesh_type = "/Engine/BasicShapes/Cylinder.Cylinder" if building_name == "Well" else "/Engine/BasicShapes/Cube.Cube"
+        mesh_type = _CYLINDER_MESH if building_name == "Well" else _CUBE_MESH
         
-        building_result = _safe_spawn_castle_actor(unreal, {
-            "name": building_full_name,
-            "type": "StaticMeshActor",
-            "location": [location[0] + offset[0], location[1] + offset[1], location[2] + offset[2]],
-            "scale": scale,
-            "static_mesh": mesh_type
-        })
-        if building_result and building_result.get("status") == "success":
-            all_actors.append(building_result.get("result"))
+        specs.append(_static_mesh_spec(building_full_name,
+                                       (location[0] + offset[0], location[1] + offset[1], location[2] + offset[2]),
+                                       scale, mesh_type))
+    
+    _batch_spawn_castle_actors(unreal, specs, all_actors, f"{name_prefix}_Courtyard", instanced)
 
 
 def build_bailey_annexes(unreal, name_prefix: str, location: List[float], 
-                        dimensions: Dict[str, int], all_actors: List) -> None:
+                        dimensions: CastleDimensions, all_actors: List,
+                        instanced: bool = False) -> None:
     """Fill outer bailey with smaller annex structures and walkways."""
-    logger.info("Populating bailey with annex rooms and walkways...")
+    logger.debug("Populating bailey with annex rooms and walkways...")
+    specs = []
     
-    outer_width = dimensions["outer_width"]
-    outer_depth = dimensions["outer_depth"]
+    outer_width = dimensions.outer_width
+    outer_depth = dimensions.outer_depth
     scale_factor = 2.0  # This should match the scale factor used in main function
     
     annex_depth = int(500 * max(1.0, scale_factor))
@@ -605,87 +602,56 @@ def build_bailey_annexes(unreal, name_prefix: str, location: List[float],
     walkway_height = 160
     walkway_width = int(300 * max(1.0, scale_factor))
     spacing = int(1200 * max(1.0, scale_factor))
+    annex_scale = (annex_width/100, annex_depth/100, annex_height/100)
+    side_annex_scale = (annex_depth/100, annex_width/100, annex_height/100)
+    door_scale = (1.0, 0.6, 2.4)
+    annex_z = location[2] + annex_height/2
+    door_z = location[2] + 120
 
     def _spawn_annex_row(start_x: float, end_x: float, fixed_y: float, align: str, base_name: str):
-        count = 0
-        x = start_x
-        while (x <= end_x and start_x <= end_x) or (x >= end_x and start_x > end_x):
-            annex_name = f"{name_prefix}_{base_name}_{count}"
-            annex_x = x
-            annex_y = fixed_y
-            # Offset annex inward from the wall
-            if align == "north":
-                annex_y += walkway_width
-            elif align == "south":
-                annex_y -= walkway_width
-            elif align == "east":
-                annex_x -= walkway_width
-            elif align == "west":
-                annex_x += walkway_width
-
-            result = _safe_spawn_castle_actor(unreal, {
-                "name": annex_name,
-                "type": "StaticMeshActor",
-                "location": [annex_x, annex_y, location[2] + annex_height/2],
-                "scale": [annex_width/100, annex_depth/100, annex_height/100],
-                "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-            })
-            if result and result.get("status") == "success":
-                all_actors.append(result.get("result"))
-
-            # Add a doorway arch on each annex
-            arch_offset = 0 if align in ["north", "south"] else (annex_width * 0.25)
-            door_x = annex_x + (50 if align == "east" else (-50 if align == "west" else arch_offset))
-            door_y = annex_y + (50 if align == "south" else (-50 if align == "north" else 0))
-            arch_name = f"{annex_name}_Door"
-            arch = _safe_spawn_castle_actor(unreal, {
-                "name": arch_name,
-                "type": "StaticMeshActor",
-                "location": [door_x, door_y, location[2] + 120],
-                "scale": [1.0, 0.6, 2.4],
-                "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
-            })
-            if arch and arch.get("status") == "success":
-                all_actors.append(arch.get("result"))
-
-            # Next annex position
-            x += spacing if start_x <= end_x else -spacing
-            count += 1
+        # The row runs from start_x towards end_x, inclusive, so its length is known up front
+        step = spacing if start_x <= end_x else -spacing
+        annex_count = int(abs(end_x - start_x) // spacing) + 1
+        
+        # Offset annex inward from the wall, and give each a doorway arch on its wall side
+        offset_x = {"east": -walkway_width, "west": walkway_width}.get(align, 0)
+        offset_y = {"north": walkway_width, "south": -walkway_width}.get(align, 0)
+        arch_offset = 0 if align in ["north", "south"] else (annex_width * 0.25)
+        door_dx = 50 if align == "east" else (-50 if align == "west" else arch_offset)
+        door_dy = 50 if align == "south" else (-50 if align == "north" else 0)
+        annex_y = fixed_y + offset_y
+        door_y = annex_y + door_dy
+        annex_prefix = f"{name_prefix}_{base_name}_"
+        # specs is a closure variable; bind its append once instead of per spec
+        append_spec = specs.append
+        
+        for count in range(annex_count):
+            annex_x = start_x + count * step + offset_x
+            annex_name = annex_prefix + str(count)
+            append_spec(_static_mesh_spec(annex_name, (annex_x, annex_y, annex_z), annex_scale, _CUBE_MESH))
+            append_spec(_static_mesh_spec(annex_name + "_Door", (annex_x + door_dx, door_y, door_z),
+                                          door_scale, _CYLINDER_MESH))
 
     # Build perimeter walkways
     walkway_z = location[2] + 100
+    ns_walkway_scale = (4.0, walkway_width/100, walkway_height/100)
+    ew_walkway_scale = (walkway_width/100, 4.0, walkway_height/100)
+    walkway_xs = _wall_segment_centers(location[0], outer_width, 400)
+    walkway_ys = _wall_segment_centers(location[1], outer_depth, 400)
     for side, fixed_y in [("north", location[1] - outer_depth/2 + walkway_width/2),
                           ("south", location[1] + outer_depth/2 - walkway_width/2)]:
-        segments = int(outer_width / 400)
-        for i in range(segments):
-            seg_x = location[0] - outer_width/2 + (i * 400) + 200
-            seg_name = f"{name_prefix}_Walkway_{side}_{i}"
-            res = _safe_spawn_castle_actor(unreal, {
-                "name": seg_name,
-                "type": "StaticMeshActor",
-                "location": [seg_x, fixed_y, walkway_z],
-                "scale": [4.0, walkway_width/100, walkway_height/100],
-                "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-            })
-            if res and res.get("status") == "success":
-                all_actors.append(res.get("result"))
+        walkway_prefix = f"{name_prefix}_Walkway_{side}_"
+        specs.extend(_static_mesh_spec(walkway_prefix + str(i), (seg_x, fixed_y, walkway_z), ns_walkway_scale,
+                                       _CUBE_MESH)
+                     for i, seg_x in enumerate(walkway_xs))
 
     # East and West walkways
     for side, fixed_x in [("east", location[0] + outer_width/2 - walkway_width/2),
                           ("west", location[0] - outer_width/2 + walkway_width/2)]:
-        segments = int(outer_depth / 400)
-        for i in range(segments):
-            seg_y = location[1] - outer_depth/2 + (i * 400) + 200
-            seg_name = f"{name_prefix}_Walkway_{side}_{i}"
-            res = _safe_spawn_castle_actor(unreal, {
-                "name": seg_name,
-                "type": "StaticMeshActor",
-                "location": [fixed_x, seg_y, walkway_z],
-                "scale": [walkway_width/100, 4.0, walkway_height/100],
-                "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-            })
-            if res and res.get("status") == "success":
-                all_actors.append(res.get("result"))
+        walkway_prefix = f"{name_prefix}_Walkway_{side}_"
+        specs.extend(_static_mesh_spec(walkway_prefix + str(i), (fixed_x, seg_y, walkway_z), ew_walkway_scale,
+                                       _CUBE_MESH)
+                     for i, seg_y in enumerate(walkway_ys))
 
     # Build annex rows along each wall
     _spawn_annex_row(
@@ -705,193 +671,160 @@ def build_bailey_annexes(unreal, name_prefix: str, location: List[float],
     )
 
     # West and East wall annexes
+    west_annex_x = location[0] - outer_width/2 + walkway_width + annex_depth/2
+    east_annex_x = location[0] + outer_width/2 - walkway_width - annex_depth/2
     for y in range(int(location[1] - outer_depth/2 + spacing), int(location[1] + outer_depth/2 - spacing) + 1, spacing):
         # West wall
-        res = _safe_spawn_castle_actor(unreal, {
-            "name": f"{name_prefix}_WestAnnex_{y}",
-            "type": "StaticMeshActor",
-            "location": [location[0] - outer_width/2 + walkway_width + annex_depth/2, y, location[2] + annex_height/2],
-            "scale": [annex_depth/100, annex_width/100, annex_height/100],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if res and res.get("status") == "success":
-            all_actors.append(res.get("result"))
+        specs.append(_static_mesh_spec(f"{name_prefix}_WestAnnex_{y}", (west_annex_x, y, annex_z),
+                                       side_annex_scale, _CUBE_MESH))
 
         # East wall
-        res = _safe_spawn_castle_actor(unreal, {
-            "name": f"{name_prefix}_EastAnnex_{y}",
-            "type": "StaticMeshActor",
-            "location": [location[0] + outer_width/2 - walkway_width - annex_depth/2, y, location[2] + annex_height/2],
-            "scale": [annex_depth/100, annex_width/100, annex_height/100],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if res and res.get("status") == "success":
-            all_actors.append(res.get("result"))
+        specs.append(_static_mesh_spec(f"{name_prefix}_EastAnnex_{y}", (east_annex_x, y, annex_z),
+                                       side_annex_scale, _CUBE_MESH))
+    
+    _batch_spawn_castle_actors(unreal, specs, all_actors, f"{name_prefix}_Annexes", instanced)
+
+
+# x offsets of the ammunition spheres piled in front of each catapult
+_CATAPULT_AMMO_OFFSETS = tuple(j * 80 - 160 for j in range(5))
+# Siege weapon part scales and the catapult arm pose, shared by every weapon
+_CATAPULT_BASE_SCALE = (4.0, 3.0, 1.0)
+_CATAPULT_ARM_SCALE = (0.4, 0.4, 6.0)
+_CATAPULT_ARM_OFFSET = (0, 0, 100)
+_CATAPULT_ARM_ROTATION = (45, 0, 0)
+_CATAPULT_AMMO_SCALE = (0.6, 0.6, 0.6)
+_BALLISTA_SCALE = (0.5, 3.0, 0.5)
 
 
 def build_siege_weapons(unreal, name_prefix: str, location: List[float], 
-                       dimensions: Dict[str, int], all_actors: List) -> None:
+                       dimensions: CastleDimensions, all_actors: List,
+                       instanced: bool = False) -> None:
     """Deploy siege weapons on walls and towers."""
-    logger.info("Deploying siege weapons...")
+    logger.debug("Deploying siege weapons...")
+    specs = []
     
-    outer_width = dimensions["outer_width"]
-    outer_depth = dimensions["outer_depth"]
-    wall_height = dimensions["wall_height"]
-    tower_height = dimensions["tower_height"]
+    outer_width = dimensions.outer_width
+    outer_depth = dimensions.outer_depth
+    wall_height = dimensions.wall_height
+    tower_height = dimensions.tower_height
     
     # MASSIVE Catapults on walls
-    catapult_positions = [
-        [location[0], location[1] - outer_depth/2 + 200, location[2] + wall_height],
-        [location[0], location[1] + outer_depth/2 - 200, location[2] + wall_height],
-        [location[0] - outer_width/3, location[1] - outer_depth/2 + 200, location[2] + wall_height],
-        [location[0] + outer_width/3, location[1] + outer_depth/2 - 200, location[2] + wall_height],
-    ]
+    north_y = location[1] - outer_depth/2 + 200
+    south_y = location[1] + outer_depth/2 - 200
+    catapult_z = location[2] + wall_height
+    catapult_positions = (
+        (location[0], north_y, catapult_z),
+        (location[0], south_y, catapult_z),
+        (location[0] - outer_width/3, north_y, catapult_z),
+        (location[0] + outer_width/3, south_y, catapult_z),
+    )
     
+    # Each catapult (base, arm and ammunition) is a rigid group, spawned as one actor
+    catapults = []
     for i, pos in enumerate(catapult_positions):
-        # MASSIVE Catapult base
-        catapult_base_name = f"{name_prefix}_CatapultBase_{i}"
-        catapult_base_result = _safe_spawn_castle_actor(unreal, {
-            "name": catapult_base_name,
-            "type": "StaticMeshActor",
-            "location": pos,
-            "scale": [4.0, 3.0, 1.0],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if catapult_base_result and catapult_base_result.get("status") == "success":
-            all_actors.append(catapult_base_result.get("result"))
-        
-        # MASSIVE Catapult arm
-        catapult_arm_name = f"{name_prefix}_CatapultArm_{i}"
-        catapult_arm_result = _safe_spawn_castle_actor(unreal, {
-            "name": catapult_arm_name,
-            "type": "StaticMeshActor",
-            "location": [pos[0], pos[1], pos[2] + 100],
-            "rotation": [45, 0, 0],
-            "scale": [0.4, 0.4, 6.0],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if catapult_arm_result and catapult_arm_result.get("status") == "success":
-            all_actors.append(catapult_arm_result.get("result"))
+        # MASSIVE Catapult base and arm
+        parts = [
+            _mesh_part(f"{name_prefix}_CatapultBase_{i}", (0, 0, 0), _CATAPULT_BASE_SCALE, _CUBE_MESH),
+            _mesh_part(f"{name_prefix}_CatapultArm_{i}", _CATAPULT_ARM_OFFSET, _CATAPULT_ARM_SCALE, _CUBE_MESH,
+                       _CATAPULT_ARM_ROTATION),
+        ]
         
-        # MASSIVE Ammunition pile
-        for j in range(5):
-            ammo_name = f"{name_prefix}_CatapultAmmo_{i}_{j}"
-            ammo_result = _safe_spawn_castle_actor(unreal, {
-                "name": ammo_name,
-                "type": "StaticMeshActor",
-                "location": [pos[0] + j * 80 - 160, pos[1] + 250, pos[2] + 40],
-                "scale": [0.6, 0.6, 0.6],
-                "static_mesh": "/Engine/BasicShapes/Sphere.Sphere"
-            })
-            if ammo_result and ammo_result.get("status") == "success":
-                all_actors.append(ammo_result.get("result"))
+        # MASSIVE Ammunition pile, in a row in front of the catapult
+        ammo_prefix = f"{name_prefix}_CatapultAmmo_{i}_"
+        parts.extend(_mesh_part(ammo_prefix + str(j), (dx, 250, 40), _CATAPULT_AMMO_SCALE, _SPHERE_MESH)
+                     for j, dx in enumerate(_CATAPULT_AMMO_OFFSETS))
+        catapults.append({"name": f"{name_prefix}_Catapult_{i}", "location": pos, "parts": parts})
+    _spawn_castle_composites(unreal, catapults, all_actors, f"{name_prefix}_Catapults", instanced)
     
     # MASSIVE Ballista on towers
     outer_corners = get_corner_positions(location, outer_width, outer_depth)
-    for i in range(4):
-        corner = outer_corners[i]
-        ballista_name = f"{name_prefix}_Ballista_{i}"
-        ballista_result = _safe_spawn_castle_actor(unreal, {
-            "name": ballista_name,
-            "type": "StaticMeshActor",
-            "location": [corner[0], corner[1], location[2] + tower_height],
-            "scale": [0.5, 3.0, 0.5],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if ballista_result and ballista_result.get("status") == "success":
-            all_actors.append(ballista_result.get("result"))
+    ballista_z = location[2] + tower_height
+    for i, corner in enumerate(outer_corners):
+        specs.append(_static_mesh_spec(f"{name_prefix}_Ballista_{i}", (corner[0], corner[1], ballista_z),
+                                       _BALLISTA_SCALE, _CUBE_MESH))
+    
+    _batch_spawn_castle_actors(unreal, specs, all_actors, f"{name_prefix}_SiegeWeapons", instanced)
 
 
 def build_village_settlement(unreal, name_prefix: str, location: List[float], 
-                           dimensions: Dict[str, int], castle_size: str, all_actors: List) -> None:
+                           dimensions: CastleDimensions, castle_size: str, all_actors: List,
+                           instanced: bool = False) -> None:
     """Build massive dense surrounding settlement."""
-    logger.info("Building massive dense outer settlement...")
+    logger.debug("Building massive dense outer settlement...")
+    specs = []
     
-    outer_width = dimensions["outer_width"]
-    outer_depth = dimensions["outer_depth"]
-    complexity_multiplier = dimensions["complexity_multiplier"]
+    outer_width = dimensions.outer_width
+    outer_depth = dimensions.outer_depth
+    complexity_multiplier = dimensions.complexity_multiplier
     
     # DENSE Village houses (much closer and more numerous)
     village_radius = outer_width * 0.3
     num_houses = (24 if castle_size == "epic" else 16) * complexity_multiplier
-    
-    # Inner ring of houses (very close)
-    for i in range(num_houses):
-        angle = (2 * math.pi * i) / num_houses
-        house_x = location[0] + (outer_width/2 + village_radius) * math.cos(angle)
-        house_y = location[1] + (outer_depth/2 + village_radius) * math.sin(angle)
+    house_scale = (3.0, 2.5, 2.0)
+    roof_scale = (3.5, 3.0, 0.8)
+    outer_house_scale = (2.5, 2.0, 2.0)
+    outer_roof_scale = (3.0, 2.5, 0.6)
+    house_z = location[2] + 100
+    roof_z = location[2] + 250
+    
+    # Inner ring of houses (very close), laid out before any specs are built
+    ring = _ring_unit(num_houses)
+    angles = [angle for angle, _, _ in ring]
+    house_xs = [location[0] + (outer_width/2 + village_radius) * cos_a for _, cos_a, _ in ring]
+    house_ys = [location[1] + (outer_depth/2 + village_radius) * sin_a for _, _, sin_a in ring]
+    # Leave out the houses that would stand in front of the main gate
+    gate_x_limit = location[0] - outer_width * 0.4
+    inner_ring = [
+        (i, angle, house_x, house_y)
+        for i, (angle, house_x, house_y) in enumerate(zip(angles, house_xs, house_ys))
+        if not (house_x < gate_x_limit and abs(house_y - location[1]) < 1000)
+    ]
+    for i, angle, house_x, house_y in inner_ring:
+        rotation = (0, angle * 180/math.pi, 0)
+        # BIGGER House base
+        house_name = f"{name_prefix}_VillageHouse_{i}"
+        specs.append(_static_mesh_spec(house_name, (house_x, house_y, house_z), house_scale, _CUBE_MESH, rotation))
         
-        # Skip houses that would be in front of main gate
-        if not (house_x < location[0] - outer_width * 0.4 and abs(house_y - location[1]) < 1000):
-            # BIGGER House base
-            house_name = f"{name_prefix}_VillageHouse_{i}"
-            house_result = _safe_spawn_castle_actor(unreal, {
-                "name": house_name,
-                "type": "StaticMeshActor",
-                "location": [house_x, house_y, location[2] + 100],
-                "rotation": [0, angle * 180/math.pi, 0],
-                "scale": [3.0, 2.5, 2.0],
-                "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-            })
-            if house_result and house_result.get("status") == "success":
-                all_actors.append(house_result.get("result"))
-            
-            # House roof
-            roof_name = f"{name_prefix}_VillageRoof_{i}"
-            roof_result = _safe_spawn_castle_actor(unreal, {
-                "name": roof_name,
-                "type": "StaticMeshActor",
-                "location": [house_x, house_y, location[2] + 250],
-                "rotation": [0, angle * 180/math.pi, 0],
-                "scale": [3.5, 3.0, 0.8],
-                "static_mesh": "/Engine/BasicShapes/Cone.Cone"
-            })
-            if roof_result and roof_result.get("status") == "success":
-                all_actors.append(roof_result.get("result"))
+        # House roof
+        roof_name = f"{name_prefix}_VillageRoof_{i}"
+        specs.append(_static_mesh_spec(roof_name, (house_x, house_y, roof_z), roof_scale, _CONE_MESH, rotation))
     
     # OUTER ring of houses
     outer_village_radius = outer_width * 0.5
-    for i in range(max(1, num_houses // 2)):
-        angle = (2 * math.pi * i) / (num_houses // 2)
-        house_x = location[0] + (outer_width/2 + outer_village_radius) * math.cos(angle)
-        house_y = location[1] + (outer_depth/2 + outer_village_radius) * math.sin(angle)
-        
+    ring = _ring_unit(num_houses // 2)
+    angles = [angle for angle, _, _ in ring]
+    house_xs = [location[0] + (outer_width/2 + outer_village_radius) * cos_a for _, cos_a, _ in ring]
+    house_ys = [location[1] + (outer_depth/2 + outer_village_radius) * sin_a for _, _, sin_a in ring]
+    for i, (angle, house_x, house_y) in enumerate(zip(angles, house_xs, house_ys)):
         # BIGGER outer houses
+        rotation = (0, angle * 180/math.pi, 0)
         house_name = f"{name_prefix}_OuterVillageHouse_{i}"
-        house_result = _safe_spawn_castle_actor(unreal, {
-            "name": house_name,
-            "type": "StaticMeshActor",
-            "location": [house_x, house_y, location[2] + 100],
-            "rotation": [0, angle * 180/math.pi, 0],
-            "scale": [2.5, 2.0, 2.0],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if house_result and house_result.get("status") == "success":
-            all_actors.append(house_result.get("result"))
+        specs.append(_static_mesh_spec(house_name, (house_x, house_y, house_z), outer_house_scale, _CUBE_MESH,
+                                       rotation))
         
         roof_name = f"{name_prefix}_OuterVillageRoof_{i}"
-        roof_result = _safe_spawn_castle_actor(unreal, {
-            "name": roof_name,
-            "type": "StaticMeshActor",
-            "location": [house_x, house_y, location[2] + 250],
-            "rotation": [0, angle * 180/math.pi, 0],
-            "scale": [3.0, 2.5, 0.6],
-            "static_mesh": "/Engine/BasicShapes/Cone.Cone"
-        })
-        if roof_result and roof_result.get("status") == "success":
-            all_actors.append(roof_result.get("result"))
+        specs.append(_static_mesh_spec(roof_name, (house_x, house_y, roof_z), outer_roof_scale, _CONE_MESH,
+                                       rotation))
+    
+    _batch_spawn_castle_actors(unreal, specs, all_actors, f"{name_prefix}_Village", instanced)
     
     # Build market area and workshops
-    _build_market_area(unreal, name_prefix, location, dimensions, all_actors)
-    _build_workshops(unreal, name_prefix, location, dimensions, all_actors)
+    _build_market_area(unreal, name_prefix, location, dimensions, all_actors, instanced)
+    _build_workshops(unreal, name_prefix, location, dimensions, all_actors, instanced)
 
 
 def _build_market_area(unreal, name_prefix: str, location: List[float], 
-                      dimensions: Dict[str, int], all_actors: List) -> None:
+                      dimensions: CastleDimensions, all_actors: List,
+                      instanced: bool = False) -> None:
     """Build dense market area near castle."""
-    outer_width = dimensions["outer_width"]
-    complexity_multiplier = dimensions["complexity_multiplier"]
+    specs = []
+    outer_width = dimensions.outer_width
+    complexity_multiplier = dimensions.complexity_multiplier
     scale_factor = 2.0
+    stall_scale = (2.0, 1.5, 1.5)
+    canopy_scale = (2.5, 2.0, 0.1)
+    stall_z = location[2] + 80
+    canopy_z = location[2] + 180
     
     # DENSE Market area (much closer to castle)
     market_x_start = location[0] - outer_width/2 - int(800 * scale_factor)
@@ -900,151 +833,113 @@ def _build_market_area(unreal, name_prefix: str, location: List[float],
         stall_y = location[1] + (200 if i % 2 == 0 else -200)  # Staggered
         
         stall_name = f"{name_prefix}_MarketStall_{i}"
-        stall_result = _safe_spawn_castle_actor(unreal, {
-            "name": stall_name,
-            "type": "StaticMeshActor",
-            "location": [stall_x, stall_y, location[2] + 80],
-            "scale": [2.0, 1.5, 1.5],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if stall_result and stall_result.get("status") == "success":
-            all_actors.append(stall_result.get("result"))
+        specs.append(_static_mesh_spec(stall_name, (stall_x, stall_y, stall_z), stall_scale, _CUBE_MESH))
         
         # Stall canopy
         canopy_name = f"{name_prefix}_StallCanopy_{i}"
-        canopy_result = _safe_spawn_castle_actor(unreal, {
-            "name": canopy_name,
-            "type": "StaticMeshActor",
-            "location": [stall_x, stall_y, location[2] + 180],
-            "scale": [2.5, 2.0, 0.1],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if canopy_result and canopy_result.get("status") == "success":
-            all_actors.append(canopy_result.get("result"))
+        specs.append(_static_mesh_spec(canopy_name, (stall_x, stall_y, canopy_z), canopy_scale, _CUBE_MESH))
+    
+    _batch_spawn_castle_actors(unreal, specs, all_actors, f"{name_prefix}_Market", instanced)
 
 
 def _build_workshops(unreal, name_prefix: str, location: List[float], 
-                    dimensions: Dict[str, int], all_actors: List) -> None:
+                    dimensions: CastleDimensions, all_actors: List,
+                    instanced: bool = False) -> None:
     """Add small outbuildings and workshops around the castle."""
-    logger.info("Adding small outbuildings and extensions...")
+    logger.debug("Adding small outbuildings and extensions...")
+    specs = []
     
-    outer_width = dimensions["outer_width"]
+    outer_width = dimensions.outer_width
     scale_factor = 2.0
     
     # Small workshops around the castle
-    workshop_positions = []
-    ring_offsets = [int(400 * scale_factor), int(600 * scale_factor), int(800 * scale_factor)]
-    for offset in ring_offsets:
-        workshop_positions.extend([
-            [location[0] - outer_width/2 - offset, location[1] + offset],
-            [location[0] - outer_width/2 - offset, location[1] - offset],
-            [location[0] + outer_width/2 + offset, location[1] + offset],
-            [location[0] + outer_width/2 + offset, location[1] - offset],
-        ])
+    ring_offsets = (int(400 * scale_factor), int(600 * scale_factor), int(800 * scale_factor))
+    west_x = location[0] - outer_width/2
+    east_x = location[0] + outer_width/2
+    workshop_positions = [
+        (wall_x + side * offset, location[1] + y_sign * offset)
+        for offset in ring_offsets
+        for wall_x, side in ((west_x, -1), (east_x, 1))
+        for y_sign in (1, -1)
+    ]
+    workshop_scale = (2.0, 1.8, 1.6)
+    workshop_z = location[2] + 80
     
     for i, pos in enumerate(workshop_positions):
         workshop_name = f"{name_prefix}_Workshop_{i}"
-        workshop_result = _safe_spawn_castle_actor(unreal, {
-            "name": workshop_name,
-            "type": "StaticMeshActor",
-            "location": [pos[0], pos[1], location[2] + 80],
-            "scale": [2.0, 1.8, 1.6],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if workshop_result and workshop_result.get("status") == "success":
-            all_actors.append(workshop_result.get("result"))
+        specs.append(_static_mesh_spec(workshop_name, (pos[0], pos[1], workshop_z), workshop_scale,
+                                       _CUBE_MESH))
+    
+    _batch_spawn_castle_actors(unreal, specs, all_actors, f"{name_prefix}_Workshops", instanced)
 
 
 def build_drawbridge_and_moat(unreal, name_prefix: str, location: List[float], 
-                            dimensions: Dict[str, int], all_actors: List) -> None:
+                            dimensions: CastleDimensions, all_actors: List,
+                            instanced: bool = False) -> None:
     """Add massive drawbridge and moat around castle."""
-    logger.info("Adding massive drawbridge...")
+    logger.debug("Adding massive drawbridge...")
+    specs = []
     
-    outer_width = dimensions["outer_width"]
-    outer_depth = dimensions["outer_depth"]
-    drawbridge_offset = dimensions["drawbridge_offset"]
-    complexity_multiplier = dimensions["complexity_multiplier"]
+    outer_width = dimensions.outer_width
+    outer_depth = dimensions.outer_depth
+    drawbridge_offset = dimensions.drawbridge_offset
+    complexity_multiplier = dimensions.complexity_multiplier
     scale_factor = 2.0
     
     # Add MASSIVE drawbridge
     drawbridge_name = f"{name_prefix}_Drawbridge"
-    drawbridge_result = _safe_spawn_castle_actor(unreal, {
-        "name": drawbridge_name,
-        "type": "StaticMeshActor",
-        "location": [location[0] - outer_width/2 - drawbridge_offset, location[1], location[2] + 20],
-        "rotation": [0, 0, 0],
-        "scale": [12.0 * scale_factor, 10.0 * scale_factor, 0.3],
-        "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-    })
-    if drawbridge_result and drawbridge_result.get("status") == "success":
-        all_actors.append(drawbridge_result.get("result"))
+    specs.append(_static_mesh_spec(drawbridge_name,
+                                   (location[0] - outer_width/2 - drawbridge_offset, location[1], location[2] + 20),
+                                   (12.0 * scale_factor, 10.0 * scale_factor, 0.3), _CUBE_MESH, (0, 0, 0)))
     
     # Add MASSIVE moat around castle
-    logger.info("Creating massive moat...")
+    logger.debug("Creating massive moat...")
     moat_width = int(1200 * scale_factor)
     moat_sections = int(30 * complexity_multiplier)
+    moat_scale = (moat_width/100, moat_width/100, 0.1)
+    moat_radius_x = outer_width/2 + moat_width/2
+    moat_radius_y = outer_depth/2 + moat_width/2
+    moat_z = location[2] - 50
+    moat_prefix = f"{name_prefix}_Moat_"
     
-    for i in range(moat_sections):
-        angle = (2 * math.pi * i) / moat_sections
-        moat_x = location[0] + (outer_width/2 + moat_width/2) * math.cos(angle)
-        moat_y = location[1] + (outer_depth/2 + moat_width/2) * math.sin(angle)
-        
-        moat_name = f"{name_prefix}_Moat_{i}"
-        moat_result = _safe_spawn_castle_actor(unreal, {
-            "name": moat_name,
-            "type": "StaticMeshActor",
-            "location": [moat_x, moat_y, location[2] - 50],
-            "scale": [moat_width/100, moat_width/100, 0.1],
-            "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
-        })
-        if moat_result and moat_result.get("status") == "success":
-            all_actors.append(moat_result.get("result"))
+    # Lay out the whole ring first, then turn it into specs in one pass
+    ring = _ring_unit(moat_sections)
+    moat_xs = [location[0] + moat_radius_x * cos_a for _, cos_a, _ in ring]
+    moat_ys = [location[1] + moat_radius_y * sin_a for _, _, sin_a in ring]
+    specs.extend(_static_mesh_spec(moat_prefix + str(i), (moat_x, moat_y, moat_z), moat_scale, _CYLINDER_MESH)
+                 for i, (moat_x, moat_y) in enumerate(zip(moat_xs, moat_ys)))
+    
+    _batch_spawn_castle_actors(unreal, specs, all_actors, f"{name_prefix}_Moat", instanced)
 
 
 def add_decorative_flags(unreal, name_prefix: str, location: List[float], 
-                        dimensions: Dict[str, int], all_actors: List) -> None:
+                        dimensions: CastleDimensions, all_actors: List,
+                        instanced: bool = False) -> None:
     """Add flags on towers for decoration."""
-    logger.info("Adding decorative flags...")
+    logger.debug("Adding decorative flags...")
     
-    outer_width = dimensions["outer_width"]
-    outer_depth = dimensions["outer_depth"]
-    tower_height = dimensions["tower_height"]
-    gate_tower_offset = dimensions["gate_tower_offset"]
+    outer_width = dimensions.outer_width
+    outer_depth = dimensions.outer_depth
+    tower_height = dimensions.tower_height
+    gate_tower_offset = dimensions.gate_tower_offset
     
     outer_corners = get_corner_positions(location, outer_width, outer_depth)
-    
-    for i in range(len(outer_corners) + 2):  # Corner towers + gate towers
-        flag_pole_name = f"{name_prefix}_FlagPole_{i}"
-        if i < len(outer_corners):
-            flag_x = outer_corners[i][0]
-            flag_y = outer_corners[i][1]
-            flag_z = location[2] + tower_height + 300
-        else:
-            # Gate tower flags
-            side = 1 if i == len(outer_corners) else -1
-            flag_x = location[0] - outer_width/2
-            flag_y = location[1] + side * gate_tower_offset
-            flag_z = location[2] + tower_height + 200
-        
-        # Flag pole
-        pole_result = _safe_spawn_castle_actor(unreal, {
-            "name": flag_pole_name,
-            "type": "StaticMeshActor",
-            "location": [flag_x, flag_y, flag_z],
-            "scale": [0.05, 0.05, 3.0],
-            "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
-        })
-        if pole_result and pole_result.get("status") == "success":
-            all_actors.append(pole_result.get("result"))
-        
-        # Flag
-        flag_name = f"{name_prefix}_Flag_{i}"
-        flag_result = _safe_spawn_castle_actor(unreal, {
-            "name": flag_name,
-            "type": "StaticMeshActor",
-            "location": [flag_x + 100, flag_y, flag_z + 100],
-            "scale": [0.05, 2.0, 1.5],
-            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-        })
-        if flag_result and flag_result.get("status") == "success":
-            all_actors.append(flag_result.get("result"))
+    pole_scale = (0.05, 0.05, 3.0)
+    flag_scale = (0.05, 2.0, 1.5)
+    
+    # Corner towers, then the two gate towers
+    corner_flag_z = location[2] + tower_height + 300
+    gate_flag_z = location[2] + tower_height + 200
+    gate_x = location[0] - outer_width/2
+    flag_positions = [(corner[0], corner[1], corner_flag_z) for corner in outer_corners]
+    flag_positions.extend((gate_x, location[1] + side * gate_tower_offset, gate_flag_z) for side in (1, -1))
+    
+    # Flag pole with the flag at a fixed offset, spawned together as one actor
+    flags = [
+        {"name": f"{name_prefix}_Flag_{i}", "location": position, "parts": [
+            _mesh_part(f"{name_prefix}_FlagPole_{i}", (0, 0, 0), pole_scale, _CYLINDER_MESH),
+            _mesh_part(f"{name_prefix}_Flag_{i}", (100, 0, 100), flag_scale, _CUBE_MESH),
+        ]}
+        for i, position in enumerate(flag_positions)
+    ]
+    _spawn_castle_composites(unreal, flags, all_actors, f"{name_prefix}_Flags", instanced)
@@ -4,18 +4,123 @@ House Construction Helper Functions
 Contains functions for building realistic houses with architectural details.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, NamedTuple
+import functools
 import logging
 
 logger = logging.getLogger("UnrealMCP_Advanced")
 
 # Import safe spawning functions
 try:
-    from .actor_name_manager import safe_spawn_actor
+    from .actor_name_manager import safe_batch_spawn_actors, safe_spawn_instanced_meshes
 except ImportError:
     logger.warning("Could not import actor_name_manager, using fallback spawning")
-    def safe_spawn_actor(unreal_connection, params, auto_unique_name=True):
-        return unreal_connection.send_command("spawn_actor", params)
+    def safe_batch_spawn_actors(unreal_connection, actor_specs, auto_unique_name=True):
+        # The spawns are independent, so pipeline them instead of waiting on each round trip
+        return {"status": "success", "results": unreal_connection.send_commands([("spawn_actor", spec) for spec in actor_specs])}
+    
+    def safe_spawn_instanced_meshes(unreal_connection, actor_specs, name_prefix, auto_unique_name=True):
+        return safe_batch_spawn_actors(unreal_connection, actor_specs, auto_unique_name)
+
+_WALL_THICKNESS = 20.0  # Thinner walls for realism
+_FLOOR_THICKNESS = 30.0
+_ROOF_THICKNESS = 30.0
+_ROOF_OVERHANG = 100.0
+_DOOR_WIDTH = 120.0
+_DOOR_HEIGHT = 240.0
+_WINDOW_HEIGHT = 150.0
+_CHIMNEY_MESH = "/Engine/BasicShapes/Cylinder.Cylinder"
+
+class _HouseFrame(NamedTuple):
+    """Reference coordinates shared by the house pieces, computed once per house."""
+    x: float  # house center
+    y: float
+    ground: float
+    base_z: float  # top of the floor
+    width: float
+    depth: float
+    height: float
+    half_width: float
+    third_width: float
+    front_y: float
+    back_y: float
+    mid_z: float  # wall center height, also the back window center
+    top_z: float  # top of the walls
+
+    @classmethod
+    def from_dimensions(cls, location, width, depth, height) -> "_HouseFrame":
+        x, y, ground = location[0], location[1], location[2]
+        base_z = ground + _FLOOR_THICKNESS
+        return cls(x, y, ground, base_z, width, depth, height,
+                   width/2, width/3, y - depth/2, y + depth/2, base_z + height/2, base_z + height)
+
+# House pieces as (name suffix, mesh override, geometry). Each geometry maps a _HouseFrame
+# to (location, size in cm); the size is turned into a scale once when the specs are built.
+_HOUSE_PIECES = (
+    # Foundation and floor slabs
+    ("Foundation", None, lambda f: (
+        [f.x, f.y, f.ground - _FLOOR_THICKNESS/2], (f.width + 200, f.depth + 200, _FLOOR_THICKNESS))),
+    ("Floor", None, lambda f: (
+        [f.x, f.y, f.ground + _FLOOR_THICKNESS/2], (f.width, f.depth, _FLOOR_THICKNESS))),
+    # Front wall, either side of and above the door opening
+    ("FrontWall_Left", None, lambda f: (
+        [f.x - f.width/4 - _DOOR_WIDTH/4, f.front_y, f.mid_z], (f.half_width - _DOOR_WIDTH/2, _WALL_THICKNESS, f.height))),
+    ("FrontWall_Right", None, lambda f: (
+        [f.x + f.width/4 + _DOOR_WIDTH/4, f.front_y, f.mid_z], (f.half_width - _DOOR_WIDTH/2, _WALL_THICKNESS, f.height))),
+    ("FrontWall_Top", None, lambda f: (
+        [f.x, f.front_y, f.base_z + _DOOR_HEIGHT + (f.height - _DOOR_HEIGHT)/2], (_DOOR_WIDTH, _WALL_THICKNESS, f.height - _DOOR_HEIGHT))),
+    # Back wall, with the window opening centered at mid_z
+    ("BackWall_Left", None, lambda f: (
+        [f.x - f.third_width, f.back_y, f.mid_z], (f.third_width, _WALL_THICKNESS, f.height))),
+    ("BackWall_Center_Bottom", None, lambda f: (
+        [f.x, f.back_y, f.base_z + (f.mid_z - _WINDOW_HEIGHT/2 - f.base_z)/2],
+        (f.third_width, _WALL_THICKNESS, f.mid_z - _WINDOW_HEIGHT/2 - f.base_z))),
+    ("BackWall_Center_Top", None, lambda f: (
+        [f.x, f.back_y, f.mid_z + _WINDOW_HEIGHT/2 + (f.top_z - f.mid_z - _WINDOW_HEIGHT/2)/2],
+        (f.third_width, _WALL_THICKNESS, f.top_z - f.mid_z - _WINDOW_HEIGHT/2))),
+    ("BackWall_Right", None, lambda f: (
+        [f.x + f.third_width, f.back_y, f.mid_z], (f.third_width, _WALL_THICKNESS, f.height))),
+    # Side walls
+    ("LeftWall", None, lambda f: (
+        [f.x - f.half_width, f.y, f.mid_z], (_WALL_THICKNESS, f.depth, f.height))),
+    ("RightWall", None, lambda f: (
+        [f.x + f.half_width, f.y, f.mid_z], (_WALL_THICKNESS, f.depth, f.height))),
+    # Single flat roof piece covering the entire house
+    ("Roof", None, lambda f: (
+        [f.x, f.y, f.top_z + _ROOF_THICKNESS/2], (f.width + _ROOF_OVERHANG*2, f.depth + _ROOF_OVERHANG*2, _ROOF_THICKNESS))),
+)
+
+# Style-specific pieces, appended after the main pieces
+_HOUSE_STYLE_PIECES = {
+    "cottage": (
+        # Chimney positioned above the flat roof
+        ("Chimney", _CHIMNEY_MESH, lambda f: (
+            [f.x + f.third_width, f.y + f.depth/3, f.top_z + _ROOF_THICKNESS + 150], (100, 100, 250))),
+    ),
+    "modern": (
+        ("Garage_Door", None, lambda f: (
+            [f.x - f.third_width, f.front_y + _WALL_THICKNESS/2, f.base_z + 150], (250, 10, 250))),
+    ),
+}
+
+@functools.lru_cache(maxsize=32)
+def _house_template(width: int, depth: int, height: int, house_style: str) -> tuple:
+    """
+    Lay out the house pieces once per size and style, relative to the house location.
+    
+    Towns build many houses from a few size presets, so repeated calls only add the
+    location to the cached offsets.
+    
+    Returns:
+        Tuple of (name suffix, (dx, dy, dz), scale, mesh override) tuples
+    """
+    frame = _HouseFrame.from_dimensions((0.0, 0.0, 0.0), width, depth, height)
+    template = []
+    for pieces in (_HOUSE_PIECES, _HOUSE_STYLE_PIECES.get(house_style, ())):
+        for suffix, piece_mesh, geometry in pieces:
+            offset, (sx, sy, sz) = geometry(frame)
+            template.append((suffix, tuple(offset), (sx/100.0, sy/100.0, sz/100.0), piece_mesh))
+    return tuple(template)
 
 def build_house(
     unreal_connection,
@@ -25,54 +130,43 @@ def build_house(
     location: List[float],
     name_prefix: str,
     mesh: str,
-    house_style: str
+    house_style: str,
+    instanced: bool = False
 ) -> Dict[str, Any]:
-    """Build a realistic house with architectural details and multiple rooms."""
+    """
+    Build a realistic house with architectural details and multiple rooms.
+    
+    With instanced=True the pieces are spawned as one instanced static mesh actor
+    per mesh instead of one actor per piece.
+    """
     try:
-        results = []
-        wall_thickness = 20.0  # Thinner walls for realism
-        floor_thickness = 30.0
-        
         # Adjust dimensions based on style
         if house_style == "cottage":
             width = int(width * 0.8)
             depth = int(depth * 0.8)
             height = int(height * 0.9)
         
-        # Create foundation as single large block
-        foundation_params = {
-            "name": f"{name_prefix}_Foundation",
-            "type": "StaticMeshActor",
-            "location": [location[0], location[1], location[2] - floor_thickness/2],
-            "scale": [(width + 200)/100.0, (depth + 200)/100.0, floor_thickness/100.0],
-            "static_mesh": mesh
-        }
-        foundation_resp = safe_spawn_actor(unreal_connection, foundation_params)
-        if foundation_resp and foundation_resp.get("status") == "success":
-            results.append(foundation_resp)
-        
-        # Create floor as single piece
-        floor_params = {
-            "name": f"{name_prefix}_Floor",
-            "type": "StaticMeshActor",
-            "location": [location[0], location[1], location[2] + floor_thickness/2],
-            "scale": [width/100.0, depth/100.0, floor_thickness/100.0],
-            "static_mesh": mesh
-        }
-        floor_resp = safe_spawn_actor(unreal_connection, floor_params)
-        if floor_resp and floor_resp.get("status") == "success":
-            results.append(floor_resp)
-        
-        base_z = location[2] + floor_thickness
-        
-        # Build walls
-        _build_house_walls(unreal_connection, name_prefix, location, width, depth, height, base_z, wall_thickness, mesh, results)
+        x, y, z = location[0], location[1], location[2]
+        specs = [
+            {
+                "name": f"{name_prefix}_{suffix}",
+                "type": "StaticMeshActor",
+                "location": [x + dx, y + dy, z + dz],
+                "scale": list(scale),
+                "static_mesh": piece_mesh or mesh
+            }
+            for suffix, (dx, dy, dz), scale, piece_mesh in _house_template(width, depth, height, house_style)
+        ]
         
-        # Build roof
-        _build_house_roof(unreal_connection, name_prefix, location, width, depth, height, base_z, mesh, house_style, results)
-        
-        # Add style-specific features
-        _add_house_features(unreal_connection, name_prefix, location, width, depth, height, base_z, wall_thickness, mesh, house_style, results)
+        if instanced:
+            batch_result = safe_spawn_instanced_meshes(unreal_connection, specs, name_prefix)
+        else:
+            # Spawn every piece in one round trip
+            batch_result = safe_batch_spawn_actors(unreal_connection, specs)
+        expected = len(batch_result.get("results", ())) if instanced else len(specs)
+        results = [r for r in batch_result.get("results", ()) if r.get("status") == "success"]
+        if len(results) < expected:
+            logger.warning("build_house: %d/%d spawns failed", expected - len(results), expected)
         
         return {
             "success": True,
@@ -87,182 +181,6 @@ def build_house(
         logger.error(f"build_house error: {e}")
         return {"success": False, "message": str(e)}
 
-def _build_house_walls(unreal_connection, name_prefix, location, width, depth, height, base_z, wall_thickness, mesh, results):
-    """Build the main walls of the house with door and window openings."""
-    door_width = 120.0
-    door_height = 240.0
-    
-    # Front wall (with door opening)
-    # Front wall - left side of door
-    front_left_width = (width/2 - door_width/2)
-    front_left_params = {
-        "name": f"{name_prefix}_FrontWall_Left",
-        "type": "StaticMeshActor",
-        "location": [location[0] - width/4 - door_width/4, location[1] - depth/2, base_z + height/2],
-        "scale": [front_left_width/100.0, wall_thickness/100.0, height/100.0],
-        "static_mesh": mesh
-    }
-    resp = safe_spawn_actor(unreal_connection, front_left_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
-    
-    # Front wall - right side of door
-    front_right_params = {
-        "name": f"{name_prefix}_FrontWall_Right",
-        "type": "StaticMeshActor",
-        "location": [location[0] + width/4 + door_width/4, location[1] - depth/2, base_z + height/2],
-        "scale": [front_left_width/100.0, wall_thickness/100.0, height/100.0],
-        "static_mesh": mesh
-    }
-    resp = safe_spawn_actor(unreal_connection, front_right_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
-    
-    # Front wall - above door
-    front_top_params = {
-        "name": f"{name_prefix}_FrontWall_Top",
-        "type": "StaticMeshActor",
-        "location": [location[0], location[1] - depth/2, base_z + door_height + (height - door_height)/2],
-        "scale": [door_width/100.0, wall_thickness/100.0, (height - door_height)/100.0],
-        "static_mesh": mesh
-    }
-    resp = safe_spawn_actor(unreal_connection, front_top_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
-    
-    # Back wall with window openings
-    window_width = 150.0
-    window_height = 150.0
-    window_y = base_z + height/2
-    
-    # Back wall - left section
-    back_left_params = {
-        "name": f"{name_prefix}_BackWall_Left",
-        "type": "StaticMeshActor",
-        "location": [location[0] - width/3, location[1] + depth/2, base_z + height/2],
-        "scale": [width/3/100.0, wall_thickness/100.0, height/100.0],
-        "static_mesh": mesh
-    }
-    resp = safe_spawn_actor(unreal_connection, back_left_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
-    
-    # Back wall - center section (with window cutouts)
-    back_center_bottom_params = {
-        "name": f"{name_prefix}_BackWall_Center_Bottom",
-        "type": "StaticMeshActor",
-        "location": [location[0], location[1] + depth/2, base_z + (window_y - window_height/2 - base_z)/2],
-        "scale": [width/3/100.0, wall_thickness/100.0, (window_y - window_height/2 - base_z)/100.0],
-        "static_mesh": mesh
-    }
-    resp = safe_spawn_actor(unreal_connection, back_center_bottom_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
-    
-    back_center_top_params = {
-        "name": f"{name_prefix}_BackWall_Center_Top",
-        "type": "StaticMeshActor",
-        "location": [location[0], location[1] + depth/2, window_y + window_height/2 + (base_z + height - window_y - window_height/2)/2],
-        "scale": [width/3/100.0, wall_thickness/100.0, (base_z + height - window_y - window_height/2)/100.0],
-        "static_mesh": mesh
-    }
-    resp = safe_spawn_actor(unreal_connection, back_center_top_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
-    
-    # Back wall - right section
-    back_right_params = {
-        "name": f"{name_prefix}_BackWall_Right",
-        "type": "StaticMeshActor",
-        "location": [location[0] + width/3, location[1] + depth/2, base_z + height/2],
-        "scale": [width/3/100.0, wall_thickness/100.0, height/100.0],
-        "static_mesh": mesh
-    }
-    resp = safe_spawn_actor(unreal_connection, back_right_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
-    
-    # Left wall
-    left_wall_params = {
-        "name": f"{name_prefix}_LeftWall",
-        "type": "StaticMeshActor",
-        "location": [location[0] - width/2, location[1], base_z + height/2],
-        "scale": [wall_thickness/100.0, depth/100.0, height/100.0],
-        "static_mesh": mesh
-    }
-    resp = safe_spawn_actor(unreal_connection, left_wall_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
-    
-    # Right wall  
-    right_wall_params = {
-        "name": f"{name_prefix}_RightWall",
-        "type": "StaticMeshActor",
-        "location": [location[0] + width/2, location[1], base_z + height/2],
-        "scale": [wall_thickness/100.0, depth/100.0, height/100.0],
-        "static_mesh": mesh
-    }
-    resp = safe_spawn_actor(unreal_connection, right_wall_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
-
-def _build_house_roof(unreal_connection, name_prefix, location, width, depth, height, base_z, mesh, house_style, results):
-    """Build the roof of the house."""
-    roof_thickness = 30.0
-    roof_overhang = 100.0
-    
-    # Single flat roof piece covering the entire house
-    flat_roof_params = {
-        "name": f"{name_prefix}_Roof",
-        "type": "StaticMeshActor",
-        "location": [
-            location[0],
-            location[1],
-            base_z + height + roof_thickness/2
-        ],
-        "rotation": [0, 0, 0],  # No rotation - flat roof
-        "scale": [(width + roof_overhang*2)/100.0, (depth + roof_overhang*2)/100.0, roof_thickness/100.0],
-        "static_mesh": mesh
-    }
-    resp = safe_spawn_actor(unreal_connection, flat_roof_params)
-    if resp and resp.get("status") == "success":
-        results.append(resp)
-    
-    # Add chimney for cottage style
-    if house_style == "cottage":
-        chimney_params = {
-            "name": f"{name_prefix}_Chimney",
-            "type": "StaticMeshActor",
-            "location": [
-                location[0] + width/3,
-                location[1] + depth/3,
-                base_z + height + roof_thickness + 150  # Position above flat roof
-            ],
-            "scale": [1.0, 1.0, 2.5],
-            "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
-        }
-        resp = safe_spawn_actor(unreal_connection, chimney_params)
-        if resp and resp.get("status") == "success":
-            results.append(resp)
-
-def _add_house_features(unreal_connection, name_prefix, location, width, depth, height, base_z, wall_thickness, mesh, house_style, results):
-    """Add style-specific features to the house."""
-
-    
-    # Add details based on style
-    if house_style == "modern":
-        # Add garage door
-        garage_params = {
-            "name": f"{name_prefix}_Garage_Door",
-            "type": "StaticMeshActor",
-            "location": [location[0] - width/3, location[1] - depth/2 + wall_thickness/2, base_z + 150],
-            "scale": [2.5, 0.1, 2.5],
-            "static_mesh": mesh
-        }
-        resp = safe_spawn_actor(unreal_connection, garage_params)
-        if resp and resp.get("status") == "success":
-            results.append(resp)
-
 def _get_house_features(house_style: str) -> List[str]:
     """Get the list of features for a house style."""
     base_features = ["foundation", "floor", "walls", "windows", "door", "flat_roof"]
@@ -0,0 +1,14 @@
+"""
+Random number utilities for Unreal MCP Server.
+Shared by the builders that place or vary pieces randomly.
+"""
+from typing import Optional
+import random
+import zlib
+
+
+def get_rng(rng: Optional[random.Random], name_prefix: str) -> random.Random:
+    """Return the caller's RNG, or a private one seeded from name_prefix so builds are reproducible."""
+    if rng is None:
+        rng = random.Random(zlib.crc32(name_prefix.encode("utf-8")))
+    return rng
@@ -7,11 +7,67 @@ with various architectural styles and color schemes.
 
 import math
 import random
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional
 import logging
 
+from .random_utilities import get_rng
+
 logger = logging.getLogger("TowerCreation")
 
+# Predefined RGBA palettes for get_tower_color_palette
+_TOWER_COLOR_PALETTES = {
+    "rainbow": [
+        [1.0, 0.0, 0.0, 1.0],  # Red
+        [1.0, 0.5, 0.0, 1.0],  # Orange
+        [1.0, 1.0, 0.0, 1.0],  # Yellow
+        [0.0, 1.0, 0.0, 1.0],  # Green
+        [0.0, 0.0, 1.0, 1.0],  # Blue
+        [0.5, 0.0, 1.0, 1.0],  # Purple
+    ],
+    "fire": [
+        [1.0, 0.0, 0.0, 1.0],  # Red
+        [1.0, 0.3, 0.0, 1.0],  # Red-Orange
+        [1.0, 0.6, 0.0, 1.0],  # Orange
+        [1.0, 0.8, 0.0, 1.0],  # Yellow-Orange
+        [1.0, 1.0, 0.2, 1.0],  # Yellow
+    ],
+    "ocean": [
+        [0.0, 0.2, 0.4, 1.0],  # Dark Blue
+        [0.0, 0.4, 0.6, 1.0],  # Blue
+        [0.0, 0.6, 0.8, 1.0],  # Light Blue
+        [0.0, 0.8, 1.0, 1.0],  # Cyan
+        [0.2, 1.0, 1.0, 1.0],  # Light Cyan
+    ],
+    "sunset": [
+        [1.0, 0.4, 0.6, 1.0],  # Pink
+        [1.0, 0.6, 0.4, 1.0],  # Coral
+        [1.0, 0.8, 0.2, 1.0],  # Gold
+        [1.0, 0.9, 0.6, 1.0],  # Light Gold
+        [0.9, 0.7, 0.9, 1.0],  # Lavender
+    ],
+    "forest": [
+        [0.2, 0.5, 0.2, 1.0],  # Dark Green
+        [0.3, 0.6, 0.3, 1.0],  # Green
+        [0.4, 0.7, 0.2, 1.0],  # Light Green
+        [0.5, 0.4, 0.1, 1.0],  # Brown
+        [0.6, 0.3, 0.1, 1.0],  # Dark Brown
+    ],
+    "cosmic": [
+        [0.2, 0.0, 0.4, 1.0],  # Deep Purple
+        [0.4, 0.0, 0.6, 1.0],  # Purple
+        [0.6, 0.2, 0.8, 1.0],  # Magenta
+        [0.8, 0.4, 1.0, 1.0],  # Light Purple
+        [1.0, 0.6, 1.0, 1.0],  # Pink
+    ],
+    "metallic": [
+        [0.7, 0.7, 0.7, 1.0],  # Silver
+        [0.9, 0.8, 0.6, 1.0],  # Gold
+        [0.5, 0.3, 0.1, 1.0],  # Bronze
+        [0.4, 0.4, 0.5, 1.0],  # Steel
+        [0.6, 0.4, 0.2, 1.0],  # Copper
+    ],
+}
+
 def get_tower_color_palette(palette_name: str = "rainbow") -> List[List[float]]:
     """
     Get a predefined color palette for tower creation.
@@ -22,60 +78,8 @@ def get_tower_color_palette(palette_name: str = "rainbow") -> List[List[float]]:
     Returns:
         List of RGBA color values [R, G, B, A] where values are 0.0-1.0
     """
-    palettes = {
-        "rainbow": [
-            [1.0, 0.0, 0.0, 1.0],  # Red
-            [1.0, 0.5, 0.0, 1.0],  # Orange
-            [1.0, 1.0, 0.0, 1.0],  # Yellow
-            [0.0, 1.0, 0.0, 1.0],  # Green
-            [0.0, 0.0, 1.0, 1.0],  # Blue
-            [0.5, 0.0, 1.0, 1.0],  # Purple
-        ],
-        "fire": [
-            [1.0, 0.0, 0.0, 1.0],  # Red
-            [1.0, 0.3, 0.0, 1.0],  # Red-Orange
-            [1.0, 0.6, 0.0, 1.0],  # Orange
-            [1.0, 0.8, 0.0, 1.0],  # Yellow-Orange
-            [1.0, 1.0, 0.2, 1.0],  # Yellow
-        ],
-        "ocean": [
-            [0.0, 0.2, 0.4, 1.0],  # Dark Blue
-            [0.0, 0.4, 0.6, 1.0],  # Blue
-            [0.0, 0.6, 0.8, 1.0],  # Light Blue
-            [0.0, 0.8, 1.0, 1.0],  # Cyan
-            [0.2, 1.0, 1.0, 1.0],  # Light Cyan
-        ],
-        "sunset": [
-            [1.0, 0.4, 0.6, 1.0],  # Pink
-            [1.0, 0.6, 0.4, 1.0],  # Coral
-            [1.0, 0.8, 0.2, 1.0],  # Gold
-            [1.0, 0.9, 0.6, 1.0],  # Light Gold
-            [0.9, 0.7, 0.9, 1.0],  # Lavender
-        ],
-        "forest": [
-            [0.2, 0.5, 0.2, 1.0],  # Dark Green
-            [0.3, 0.6, 0.3, 1.0],  # Green
-            [0.4, 0.7, 0.2, 1.0],  # Light Green
-            [0.5, 0.4, 0.1, 1.0],  # Brown
-            [0.6, 0.3, 0.1, 1.0],  # Dark Brown
-        ],
-        "cosmic": [
-            [0.2, 0.0, 0.4, 1.0],  # Deep Purple
-            [0.4, 0.0, 0.6, 1.0],  # Purple
-            [0.6, 0.2, 0.8, 1.0],  # Magenta
-            [0.8, 0.4, 1.0, 1.0],  # Light Purple
-            [1.0, 0.6, 1.0, 1.0],  # Pink
-        ],
-        "metallic": [
-            [0.7, 0.7, 0.7, 1.0],  # Silver
-            [0.9, 0.8, 0.6, 1.0],  # Gold
-            [0.5, 0.3, 0.1, 1.0],  # Bronze
-            [0.4, 0.4, 0.5, 1.0],  # Steel
-            [0.6, 0.4, 0.2, 1.0],  # Copper
-        ],
-    }
-    
-    return palettes.get(palette_name, palettes["rainbow"])
+    
+    return _TOWER_COLOR_PALETTES.get(palette_name, _TOWER_COLOR_PALETTES["rainbow"])
 
 def assign_tower_piece_color(level: int, piece_index: int, total_levels: int, color_palette: List[List[float]], color_pattern: str = "gradient") -> List[float]:
     """
@@ -111,9 +115,9 @@ def assign_tower_piece_color(level: int, piece_index: int, total_levels: int, co
         return color_palette[color_index]
         
     elif color_pattern == "random":
-        # Random color from palette (consistent per level+piece)
-        random.seed(level * 1000 + piece_index)
-        return random.choice(color_palette)
+        # Scattered color from palette, a pure hash of level+piece so no generator is involved
+        mixed = ((level * 1000 + piece_index) * 2654435761) & 0xFFFFFFFF
+        return color_palette[(mixed >> 16) % len(color_palette)]
         
     else:  # Default to gradient
         ratio = level / max(1, total_levels - 1)
@@ -122,10 +126,12 @@ def assign_tower_piece_color(level: int, piece_index: int, total_levels: int, co
 
 def create_spiral_tower_pieces(level: int, height: int, base_size: int, block_size: float, 
                              location: List[float], name_prefix: str, 
-                             color_palette: List[List[float]], color_pattern: str) -> List[Dict[str, Any]]:
+                             color_palette: List[List[float]], color_pattern: str,
+                             rng: Optional[random.Random] = None) -> List[Dict[str, Any]]:
     """
     Generate piece data for a single level of a spiral tower.
     Returns data structure instead of spawning directly for batch processing.
+    Pass the same rng for every level of a tower to draw the jitter from one generator.
     """
     pieces = []
     
@@ -141,14 +147,17 @@ def create_spiral_tower_pieces(level: int, height: int, base_size: int, block_si
     # Number of blocks per level decreases with height
     num_blocks = max(6, int((base_size * 8) * (1 - level / height * 0.5)))
     
+    uniform = get_rng(rng, f"{name_prefix}_spiral_{level}").uniform
+    jitter = block_size * 0.1
+    
     for i in range(num_blocks):
         angle = (2 * math.pi * i) / num_blocks + twist_angle
         x = location[0] + current_radius * math.cos(angle)
         y = location[1] + current_radius * math.sin(angle)
         
         # Add some randomness to create organic look
-        x += random.uniform(-block_size * 0.1, block_size * 0.1)
-        y += random.uniform(-block_size * 0.1, block_size * 0.1)
+        x += uniform(-jitter, jitter)
+        y += uniform(-jitter, jitter)
         
         # Get color for this piece
         color = assign_tower_piece_color(level, i, height, color_palette, color_pattern)
@@ -164,13 +173,14 @@ def create_spiral_tower_pieces(level: int, height: int, base_size: int, block_si
 
 def create_spiral_tower_level(unreal, level: int, height: int, base_size: int, block_size: float, 
                             location: List[float], name_prefix: str, mesh: str, 
-                            color_palette: List[List[float]], color_pattern: str) -> List[Dict[str, Any]]:
+                            color_palette: List[List[float]], color_pattern: str,
+                            rng: Optional[random.Random] = None) -> List[Dict[str, Any]]:
     """
     DEPRECATED: Use create_spiral_tower_pieces for batch processing.
     Create a single level of a spiral tower with twisted geometry.
     """
     logger.warning("create_spiral_tower_level is deprecated. Use batch processing instead.")
-    pieces = create_spiral_tower_pieces(level, height, base_size, block_size, location, name_prefix, color_palette, color_pattern)
+    pieces = create_spiral_tower_pieces(level, height, base_size, block_size, location, name_prefix, color_palette, color_pattern, rng)
     
     if not pieces:
         return []
@@ -195,6 +205,10 @@ def create_twisted_tower_level(unreal, level: int, height: int, base_size: int,
     half_size = current_size / 2
     perimeter_blocks = int(current_size * 4)
     
+    # The twist is the same for every block on this level
+    cos_twist = math.cos(twist_angle)
+    sin_twist = math.sin(twist_angle)
+    
     for i in range(perimeter_blocks):
         # Calculate position on square perimeter
         side = i // int(current_size)
@@ -214,8 +228,6 @@ def create_twisted_tower_level(unreal, level: int, height: int, base_size: int,
             local_y = half_size - pos_on_side - 0.5
         
         # Apply twist transformation
-        cos_twist = math.cos(twist_angle)
-        sin_twist = math.sin(twist_angle)
         twisted_x = local_x * cos_twist - local_y * sin_twist
         twisted_y = local_x * sin_twist + local_y * cos_twist
         
@@ -283,6 +295,53 @@ def clear_tower_blueprint_cache():
     _tower_blueprint_cache.clear()
     logger.info("Cleared tower blueprint cache")
 
+def _set_up_colored_blueprint(unreal, bp_name: str, mesh: str, color: List[float]) -> bool:
+    """
+    Turn a freshly created blueprint into a colored physics mesh piece.
+    
+    The Mesh component is added on its own first, since every later step targets it;
+    the remaining steps only depend on each other's order, so they are pipelined.
+    
+    Returns:
+        True if every step succeeded
+    """
+    add_result = unreal.send_command("add_component_to_blueprint", {
+        "blueprint_name": bp_name,
+        "component_type": "StaticMeshComponent",
+        "component_name": "Mesh"
+    })
+    if not add_result or not add_result.get("status") == "success":
+        logger.warning(f"Failed to add component to {bp_name}")
+        return False
+    
+    steps = [
+        ("set_static_mesh_properties", {
+            "blueprint_name": bp_name,
+            "component_name": "Mesh",
+            "static_mesh": mesh
+        }),
+        ("set_physics_properties", {
+            "blueprint_name": bp_name,
+            "component_name": "Mesh",
+            "simulate_physics": True,
+            "gravity_enabled": True,
+            "mass": 1.0
+        }),
+        ("set_mesh_material_color", {
+            "blueprint_name": bp_name,
+            "component_name": "Mesh",
+            "color": color,
+            "material_slot": 0
+        }),
+        ("compile_blueprint", {"blueprint_name": bp_name})
+    ]
+    succeeded = True
+    for (command, _), result in zip(steps, unreal.send_commands(steps)):
+        if not result or not result.get("status") == "success":
+            logger.warning(f"{command} failed for {bp_name}")
+            succeeded = False
+    return succeeded
+
 def get_or_create_colored_blueprint(unreal, mesh: str, color: List[float], base_name: str = "TowerPiece") -> str:
     """
     Get or create a reusable colored blueprint for tower pieces.
@@ -338,51 +397,10 @@ def get_or_create_colored_blueprint(unreal, mesh: str, color: List[float], base_
     
     # Set up the newly created blueprint
     try:
-        # Add mesh component
-        add_result = unreal.send_command("add_component_to_blueprint", {
-            "blueprint_name": bp_name,
-            "component_type": "StaticMeshComponent", 
-            "component_name": "Mesh"
-        })
-        if not add_result or not add_result.get("status") == "success":
-            logger.warning(f"Failed to add component to {bp_name}")
+        if not _set_up_colored_blueprint(unreal, bp_name, mesh, color):
+            # Leave a half-configured blueprint out of the cache
             return None
         
-        # Set mesh properties
-        mesh_result = unreal.send_command("set_static_mesh_properties", {
-            "blueprint_name": bp_name,
-            "component_name": "Mesh",
-            "static_mesh": mesh
-        })
-        if not mesh_result or not mesh_result.get("status") == "success":
-            logger.warning(f"Failed to set mesh properties for {bp_name}")
-        
-        # Set physics properties
-        physics_result = unreal.send_command("set_physics_properties", {
-            "blueprint_name": bp_name,
-            "component_name": "Mesh",
-            "simulate_physics": True,
-            "gravity_enabled": True,
-            "mass": 1.0
-        })
-        if not physics_result or not physics_result.get("status") == "success":
-            logger.warning(f"Failed to set physics properties for {bp_name}")
-        
-        # Apply color
-        color_result = unreal.send_command("set_mesh_material_color", {
-            "blueprint_name": bp_name,
-            "component_name": "Mesh",
-            "color": color,
-            "material_slot": 0
-        })
-        if not color_result or not color_result.get("status") == "success":
-            logger.warning(f"Failed to set color for {bp_name}")
-        
-        # Compile blueprint
-        compile_result = unreal.send_command("compile_blueprint", {"blueprint_name": bp_name})
-        if not compile_result or not compile_result.get("status") == "success":
-            logger.warning(f"Failed to compile blueprint {bp_name}")
-        
         # Cache the blueprint for reuse
         _tower_blueprint_cache[cache_key] = bp_name
         logger.info(f"CACHED NEW: Created and cached new blueprint {bp_name} for color {color} -> {color_key}. Cache now has {len(_tower_blueprint_cache)} entries.")
@@ -446,40 +464,10 @@ def create_tower_blueprints_and_batch_spawn(
             if create_result and create_result.get("status") == "success":
                 logger.info(f"Created new blueprint {bp_name} for color {color}")
                 
-                # Set up the blueprint
-                # Add mesh component
-                unreal.send_command("add_component_to_blueprint", {
-                    "blueprint_name": bp_name,
-                    "component_type": "StaticMeshComponent", 
-                    "component_name": "Mesh"
-                })
-                
-                # Set mesh properties
-                unreal.send_command("set_static_mesh_properties", {
-                    "blueprint_name": bp_name,
-                    "component_name": "Mesh",
-                    "static_mesh": mesh
-                })
-                
-                # Set physics properties
-                unreal.send_command("set_physics_properties", {
-                    "blueprint_name": bp_name,
-                    "component_name": "Mesh",
-                    "simulate_physics": True,
-                    "gravity_enabled": True,
-                    "mass": 1.0
-                })
-                
-                # Apply color
-                unreal.send_command("set_mesh_material_color", {
-                    "blueprint_name": bp_name,
-                    "component_name": "Mesh",
-                    "color": color,
-                    "material_slot": 0
-                })
-                
-                # Compile blueprint
-                unreal.send_command("compile_blueprint", {"blueprint_name": bp_name})
+                # Set up the blueprint: mesh component, mesh, physics, color, compile
+                if not _set_up_colored_blueprint(unreal, bp_name, mesh, color):
+                    logger.error(f"Failed to set up blueprint {bp_name}, skipping its pieces")
+                    continue
                 
             elif create_result and "already exists" in create_result.get("error", "").lower():
                 logger.info(f"Blueprint {bp_name} already exists, reusing it")
@@ -491,14 +479,10 @@ def create_tower_blueprints_and_batch_spawn(
             # Now spawn all pieces of this color using the same blueprint
             pieces_spawned = 0
             for piece in pieces:
-                spawn_result = spawn_blueprint_actor(unreal, bp_name, piece["name"], piece["location"])
+                # The scale is applied as part of the spawn, so no set_actor_transform follows
+                spawn_result = spawn_blueprint_actor(unreal, bp_name, piece["name"], piece["location"],
+                                                     scale=piece["scale"])
                 if spawn_result.get("status") == "success":
-                    # Set correct scale
-                    spawned_name = spawn_result.get("result", {}).get("name", piece["name"])
-                    unreal.send_command("set_actor_transform", {
-                        "name": spawned_name,
-                        "scale": piece["scale"]
-                    })
                     spawned_actors.append(spawn_result)
                     pieces_spawned += 1
                 else:
@@ -5,17 +5,30 @@ A streamlined MCP server focused on advanced composition tools for Unreal Engine
 Contains only the advanced tools from the expanded MCP tool system to keep tool count manageable.
 """
 
+import asyncio
+import functools
+import itertools
 import logging
 import socket
 import json
 import math
+import select
 import struct
+import sys
 import time
 import threading
-from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any, Optional, List
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
 from mcp.server.fastmcp import FastMCP
 
+# orjson is optional; it encodes/decodes bytes directly and is much faster on large payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from helpers.infrastructure_creation import (
     _create_street_grid, _create_street_lights, _create_town_vehicles, _create_town_decorations,
     _create_traffic_lights, _create_street_signage, _create_sidewalks_crosswalks, _create_urban_furniture,
@@ -23,7 +36,7 @@ from helpers.infrastructure_creation import (
 )
 from helpers.building_creation import _create_town_building
 from helpers.castle_creation import (
-    get_castle_size_params, calculate_scaled_dimensions, build_outer_bailey_walls, 
+    get_castle_dimensions, estimate_castle_actor_count, build_outer_bailey_walls, 
     build_inner_bailey_walls, build_gate_complex, build_corner_towers, 
     build_inner_corner_towers, build_intermediate_towers, build_central_keep, 
     build_courtyard_complex, build_bailey_annexes, build_siege_weapons, 
@@ -37,7 +50,7 @@ from helpers.mansion_creation import (
 )
 from helpers.actor_utilities import spawn_blueprint_actor, get_blueprint_material_info
 from helpers.actor_name_manager import (
-    safe_spawn_actor, safe_delete_actor
+    safe_delete_actor, safe_batch_spawn_actors, safe_spawn_instanced_meshes
 )
 from helpers.bridge_aqueduct_creation import (
     build_suspension_bridge_structure, build_aqueduct_structure
@@ -57,8 +70,9 @@ from helpers.blueprint_graph import function_io
 
 
 # Configure logging with more detailed format
+# INFO keeps per-command payload dumps (debug) from being formatted at all
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
     handlers=[
         logging.FileHandler('unreal_mcp_advanced.log'),
@@ -70,11 +84,57 @@ logger = logging.getLogger("UnrealMCP_Advanced")
 UNREAL_HOST = "127.0.0.1"
 UNREAL_PORT = 55557
 
+# Engine mesh paths and actor type shared by nearly every spawned spec; interned
+# so all specs reference one string object instead of per-call copies
+CUBE_MESH = sys.intern("/Engine/BasicShapes/Cube.Cube")
+CYLINDER_MESH = sys.intern("/Engine/BasicShapes/Cylinder.Cylinder")
+STATIC_MESH_ACTOR = sys.intern("StaticMeshActor")
+
+# Buildings create_town builds concurrently; they share the one Unreal connection
+TOWN_BUILD_WORKERS = 4
+
+# Castle sections create_castle_fortress builds concurrently on the same connection
+CASTLE_BUILD_WORKERS = 4
+
+# Projected actors above which create_castle_fortress refuses a non-instanced build,
+# since spawning that many individual actors runs into RPC timeouts
+MAX_CASTLE_ACTORS = 5000
+
+# Every ordering of the four maze carving directions, so a shuffle is one random index
+_MAZE_DIRECTION_ORDERS = tuple(itertools.permutations(((0, 1), (1, 0), (0, -1), (-1, 0))))
+
+
+# stdlib fallback configured to emit the same compact UTF-8 output as orjson
+_json_encode = json.JSONEncoder(ensure_ascii=False, check_circular=False, separators=(",", ":")).encode
+
+
+def _json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _json_encode(obj).encode('utf-8')
+
+
+def _json_loads(data) -> Any:
+    """Parse UTF-8 JSON bytes (or a memoryview over them), using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+class CommandDeliveredError(Exception):
+    """A command failed after its frame was fully sent, so Unreal may already have run it."""
+
+
 class UnrealConnection:
     """
     Robust connection to Unreal Engine with automatic retry and reconnection.
     
     Features:
+    - Persistent connection reused across commands, closed after a short idle
+      period so other clients can reach the single-client plugin server
     - Exponential backoff retry for connection attempts
     - Automatic reconnection on failure
     - Configurable timeouts per command type
@@ -89,11 +149,23 @@ class UnrealConnection:
     CONNECT_TIMEOUT = 10    # seconds
     DEFAULT_RECV_TIMEOUT = 30  # seconds
     LARGE_OP_RECV_TIMEOUT = 300  # seconds for large operations
-    BUFFER_SIZE = 8192
+    FRAME_HEADER = struct.Struct('>I')  # 4-byte big-endian payload length prefix
+    NOTSENT_LOWAT = 16384  # bytes of unsent data allowed in the kernel send queue
+    INITIAL_RECV_BUFFER_SIZE = 65536  # reusable response buffer, doubled on demand
+    KEEPALIVE_IDLE = 60  # seconds idle before the first keepalive probe
+    KEEPALIVE_INTERVAL = 10  # seconds between unanswered probes
+    KEEPALIVE_COUNT = 3  # unanswered probes before the connection is dropped
+    PIPELINE_WINDOW = 32  # commands in flight before send_commands waits for a response
+    IDLE_CLOSE_TIMEOUT = 2.0  # seconds without a command before the connection is released
+    
+    # Fixed attribute set: no per-instance __dict__ and faster attribute access
+    __slots__ = ("socket", "connected", "_lock", "_last_error", "_header_buffer", "_recv_buffer",
+                 "_last_activity", "_idle_closer")
     
     # Commands that need longer timeouts
     LARGE_OPERATION_COMMANDS = {
         "get_available_materials",
+        "batch_spawn",
         "create_town",
         "create_castle_fortress", 
         "construct_mansion",
@@ -108,6 +180,10 @@ class UnrealConnection:
         self.connected = False
         self._lock = threading.RLock()  # RLock allows reentrant acquisition for retry logic
         self._last_error = None
+        self._header_buffer = bytearray(self.FRAME_HEADER.size)
+        self._recv_buffer = bytearray(self.INITIAL_RECV_BUFFER_SIZE)
+        self._last_activity = 0.0
+        self._idle_closer = None
     
     def _create_socket(self) -> socket.socket:
         """Create and configure a new socket."""
@@ -115,8 +191,21 @@ class UnrealConnection:
         sock.settimeout(self.CONNECT_TIMEOUT)
         sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 131072)  # 128KB
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 131072)  # 128KB
+        # Tune keepalive so a half-open persistent connection (e.g. Unreal was
+        # closed or crashed) is detected in about 90s instead of hours
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.KEEPALIVE_IDLE)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, self.KEEPALIVE_INTERVAL)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, self.KEEPALIVE_COUNT)
+            except OSError:
+                pass
+        # Leave SO_RCVBUF/SO_SNDBUF to kernel auto-tuning; instead cap unsent data queued
+        # in the kernel so a large batch payload does not delay the next command
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, 'TCP_NOTSENT_LOWAT', 25), self.NOTSENT_LOWAT)
+        except OSError:
+            pass
         
         # Set linger to ensure clean socket closure (l_onoff=1, l_linger=0)
         # struct linger is two 16-bit integers: l_onoff and l_linger
@@ -150,6 +239,8 @@ class UnrealConnection:
                     self.socket.connect((UNREAL_HOST, UNREAL_PORT))
                     self.connected = True
                     self._last_error = None
+                    self._last_activity = time.monotonic()
+                    self._start_idle_closer()
                     
                     logger.info("Successfully connected to Unreal Engine")
                     return True
@@ -179,6 +270,43 @@ class UnrealConnection:
         logger.error(f"Failed to connect after {self.MAX_RETRIES + 1} attempts. Last error: {self._last_error}")
         return False
     
+    def _start_idle_closer(self):
+        """Start the idle-close thread for the current connection if none is running."""
+        if self._idle_closer is None:
+            self._idle_closer = threading.Thread(
+                target=self._close_when_idle, name="UnrealMCPIdleClose", daemon=True
+            )
+            self._idle_closer.start()
+
+    def _close_when_idle(self):
+        """
+        Close the connection once no command has used it for IDLE_CLOSE_TIMEOUT.
+        
+        The plugin serves one accepted socket at a time and only accepts the next
+        client after the current one disconnects, so a connection held open by an
+        idle MCP server would block every other client. The thread exits once the
+        connection is gone; connect() starts a new one.
+        """
+        while True:
+            time.sleep(self.IDLE_CLOSE_TIMEOUT / 2)
+            with self._lock:
+                if self.socket is not None and time.monotonic() - self._last_activity < self.IDLE_CLOSE_TIMEOUT:
+                    continue
+                if self.socket is not None:
+                    logger.debug("Closing idle connection to Unreal Engine")
+                    self._close_socket_unsafe()
+                self._idle_closer = None
+                return
+
+    def _peer_closed(self) -> bool:
+        """Whether Unreal has closed the persistent connection while it sat idle (never blocks)."""
+        try:
+            readable, _, _ = select.select([self.socket], [], [], 0)
+            # An idle connection has nothing to read unless the peer closed or reset it
+            return bool(readable) and not self.socket.recv(1, socket.MSG_PEEK)
+        except OSError:
+            return True
+
     def _close_socket_unsafe(self):
         """Close socket without lock (internal use only)."""
         if self.socket:
@@ -205,101 +333,79 @@ class UnrealConnection:
             return self.LARGE_OP_RECV_TIMEOUT
         return self.DEFAULT_RECV_TIMEOUT
 
-    def _receive_response(self, command_type: str) -> bytes:
+    def _recv_into(self, view: memoryview, command_type: str, start_time: float, timeout: float) -> None:
         """
-        Receive complete JSON response from Unreal.
+        Fill view completely from the socket.
+        
+        Raises:
+            socket.timeout: If the overall timeout elapses
+            ConnectionError: If the remote side closes mid-message
+        """
+        size = len(view)
+        received = 0
+        recv_into = self.socket.recv_into
+        while received < size:
+            # Check for overall timeout
+            elapsed = time.time() - start_time
+            if elapsed > timeout:
+                raise socket.timeout(f"Overall timeout after {elapsed:.1f}s")
+            
+            count = recv_into(view[received:])
+            if not count:
+                # Connection closed by remote
+                raise ConnectionError(f"Connection closed with incomplete data ({received}/{size} bytes) for {command_type}")
+            received += count
+
+    def _receive_response(self, command_type: str) -> memoryview:
+        """
+        Receive one length-prefixed JSON response from Unreal.
+        
+        Each response is a 4-byte big-endian length followed by that many bytes
+        of UTF-8 JSON, so the payload is read exactly with no parsing in the loop.
+        The payload lands in a receive buffer owned by the connection, which only
+        grows (by doubling) when a response is larger than any seen before.
         
         Args:
             command_type: Type of command (used for timeout selection)
             
         Returns:
-            Raw response bytes
+            View over the raw response bytes, valid until the next command
             
         Raises:
             Exception: On timeout or connection error
         """
         timeout = self._get_timeout_for_command(command_type)
         self.socket.settimeout(timeout)
-        
-        chunks = []
-        total_bytes = 0
         start_time = time.time()
         
         try:
-            while True:
-                # Check for overall timeout
-                elapsed = time.time() - start_time
-                if elapsed > timeout:
-                    raise socket.timeout(f"Overall timeout after {elapsed:.1f}s")
-                
-                try:
-                    chunk = self.socket.recv(self.BUFFER_SIZE)
-                except socket.timeout:
-                    # Check if we have a complete response
-                    if chunks:
-                        data = b''.join(chunks)
-                        try:
-                            json.loads(data.decode('utf-8'))
-                            logger.info(f"Got complete response after recv timeout ({total_bytes} bytes)")
-                            return data
-                        except json.JSONDecodeError:
-                            pass
-                    raise
-                
-                if not chunk:
-                    # Connection closed by remote
-                    if not chunks:
-                        raise ConnectionError("Connection closed before receiving any data")
-                    break
-                
-                chunks.append(chunk)
-                total_bytes += len(chunk)
-                
-                # Try to parse accumulated data as JSON
-                data = b''.join(chunks)
-                try:
-                    decoded = data.decode('utf-8')
-                    json.loads(decoded)
-                    # Successfully parsed - we have complete response
-                    logger.info(f"Received complete response ({total_bytes} bytes) for {command_type}")
-                    return data
-                except json.JSONDecodeError:
-                    # Incomplete JSON, continue reading
-                    continue
-                except UnicodeDecodeError:
-                    # Incomplete UTF-8, continue reading
-                    continue
-                    
+            self._recv_into(memoryview(self._header_buffer), command_type, start_time, timeout)
+            (length,) = self.FRAME_HEADER.unpack(self._header_buffer)
+            if length > len(self._recv_buffer):
+                # Replace rather than resize so no outstanding view blocks the growth
+                self._recv_buffer = bytearray(max(length, 2 * len(self._recv_buffer)))
+            data = memoryview(self._recv_buffer)[:length]
+            self._recv_into(data, command_type, start_time, timeout)
         except socket.timeout:
             elapsed = time.time() - start_time
-            if chunks:
-                data = b''.join(chunks)
-                try:
-                    json.loads(data.decode('utf-8'))
-                    logger.warning(f"Using response received before timeout ({total_bytes} bytes)")
-                    return data
-                except:
-                    pass
-            raise TimeoutError(f"Timeout after {elapsed:.1f}s waiting for response to {command_type} (received {total_bytes} bytes)")
-        
-        # If we get here, connection was closed
-        if chunks:
-            data = b''.join(chunks)
-            try:
-                json.loads(data.decode('utf-8'))
-                return data
-            except:
-                raise ConnectionError(f"Connection closed with incomplete data ({total_bytes} bytes)")
+            raise TimeoutError(f"Timeout after {elapsed:.1f}s waiting for response to {command_type}")
         
-        raise ConnectionError("Connection closed without response")
+        logger.debug("Received complete response (%d bytes) for %s", length, command_type)
+        return data
 
-    def send_command(self, command: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+    def send_command(self, command: str, params: Dict[str, Any] = None, payload: bytes = None) -> Optional[Dict[str, Any]]:
         """
         Send a command to Unreal Engine with automatic retry.
         
+        Only failures before the command frame is fully sent are retried. Once
+        Unreal may have received it, an error is returned instead, since resending
+        a spawn would create the actors a second time.
+        
         Args:
             command: Command type string
             params: Command parameters dictionary
+            payload: Pre-encoded frame body (e.g. a binary batch_spawn frame) sent
+                instead of JSON-encoding command and params
             
         Returns:
             Response dictionary or error dictionary
@@ -307,8 +413,12 @@ class UnrealConnection:
         last_error = None
         
         for attempt in range(self.MAX_RETRIES + 1):
+            reused = self.connected
             try:
-                return self._send_command_once(command, params, attempt)
+                return self._send_command_once(command, params, attempt, payload)
+            except CommandDeliveredError as e:
+                logger.error(f"Command failed after it was sent, not retrying: {e}")
+                return {"status": "error", "error": str(e)}
             except (ConnectionError, TimeoutError, socket.error, OSError) as e:
                 last_error = str(e)
                 logger.warning(f"Command failed (attempt {attempt + 1}/{self.MAX_RETRIES + 1}): {e}")
@@ -316,6 +426,12 @@ class UnrealConnection:
                 # Clean up and prepare for retry
                 self.disconnect()
                 
+                if reused and isinstance(e, ConnectionError):
+                    # The persistent connection went stale (e.g. Unreal restarted);
+                    # reconnect right away rather than backing off
+                    logger.info("Persistent connection was dropped, reconnecting")
+                    continue
+                
                 if attempt < self.MAX_RETRIES:
                     delay = min(self.BASE_RETRY_DELAY * (2 ** attempt), self.MAX_RETRY_DELAY)
                     logger.info(f"Retrying command in {delay:.1f}s...")
@@ -328,7 +444,7 @@ class UnrealConnection:
         
         return {"status": "error", "error": f"Command failed after {self.MAX_RETRIES + 1} attempts: {last_error}"}
 
-    def _send_command_once(self, command: str, params: Dict[str, Any], attempt: int) -> Dict[str, Any]:
+    def _send_command_once(self, command: str, params: Dict[str, Any], attempt: int, payload: bytes = None) -> Dict[str, Any]:
         """
         Send command once (internal method).
         
@@ -336,6 +452,7 @@ class UnrealConnection:
             command: Command type
             params: Command parameters
             attempt: Current attempt number
+            payload: Optional pre-encoded frame body used instead of params
             
         Returns:
             Response dictionary
@@ -347,52 +464,124 @@ class UnrealConnection:
         # where another thread could close/reconnect the socket mid-operation.
         # RLock allows nested acquisition from connect()/disconnect() calls.
         with self._lock:
-            # Connect (or reconnect)
-            if not self.connect():
-                raise ConnectionError(f"Failed to connect to Unreal Engine: {self._last_error}")
+            # Reuse the persistent connection; only (re)connect when there is none or
+            # Unreal dropped it, so a stale socket is caught before anything is sent
+            if self.socket is None or not self.connected or self._peer_closed():
+                if not self.connect():
+                    raise ConnectionError(f"Failed to connect to Unreal Engine: {self._last_error}")
             
             try:
-                # Build and send command
-                command_obj = {
-                    "type": command,
-                    "params": params or {}
-                }
-                command_json = json.dumps(command_obj)
+                if payload is None:
+                    frame = self._frame(command, params)
+                else:
+                    frame = self.FRAME_HEADER.pack(len(payload)) + payload
                 
-                logger.info(f"Sending command (attempt {attempt + 1}): {command}")
-                logger.debug(f"Command payload: {command_json[:500]}...")
+                logger.info("Sending command (attempt %d): %s", attempt + 1, command)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Command payload: %s...", frame[4:504])
                 
                 # Send with timeout
-                self.socket.settimeout(10)  # 10 second send timeout
-                self.socket.sendall(command_json.encode('utf-8'))
-                
-                # Receive response
-                response_data = self._receive_response(command)
-                
-                # Parse response
-                try:
-                    response = json.loads(response_data.decode('utf-8'))
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON decode error: {e}")
-                    logger.debug(f"Raw response: {response_data[:500]}")
-                    raise ValueError(f"Invalid JSON response: {e}")
-                
-                logger.info(f"Command {command} completed successfully")
-                
-                # Normalize error responses
-                if response.get("status") == "error":
-                    error_msg = response.get("error") or response.get("message", "Unknown error")
-                    logger.warning(f"Unreal returned error: {error_msg}")
-                elif response.get("success") is False:
-                    error_msg = response.get("error") or response.get("message", "Unknown error")
-                    response = {"status": "error", "error": error_msg}
-                    logger.warning(f"Unreal returned failure: {error_msg}")
-                
-                return response
+                sock = self.socket
+                sock.settimeout(10)  # 10 second send timeout
+                sock.sendall(frame)
                 
+            except Exception:
+                # Drop the connection so the next attempt starts from a clean socket
+                self._close_socket_unsafe()
+                raise
+            
+            try:
+                return self._parse_response(command, self._receive_response(command))
+            except Exception as e:
+                # The whole frame went out, so Unreal may have run the command already;
+                # resending would duplicate spawns, so this failure is never retried
+                self._close_socket_unsafe()
+                raise CommandDeliveredError(f"{command} failed after it was sent: {e}") from e
             finally:
-                # Always clean up connection after command
+                self._last_activity = time.monotonic()
+
+    def send_commands(self, commands: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Send several commands back-to-back and return their responses in order.
+        
+        Unreal handles the commands on a connection strictly in arrival order, so up
+        to PIPELINE_WINDOW frames are written in a single send before waiting for
+        the first response, and the round trips overlap instead of adding up. Slots
+        freed by each response are refilled with one more write. Commands are not
+        retried: earlier ones in the sequence may already have taken effect.
+        
+        Args:
+            commands: List of (command_type, params) tuples
+            
+        Returns:
+            One response dictionary per command; commands that could not be
+            completed get an error dictionary
+        """
+        if not commands:
+            return []
+        
+        responses = []
+        with self._lock:
+            if self.socket is None or not self.connected or self._peer_closed():
+                if not self.connect():
+                    error = f"Failed to connect to Unreal Engine: {self._last_error}"
+                    return [{"status": "error", "error": error} for _ in commands]
+            
+            sent = 0
+            sock = self.socket
+            try:
+                logger.info("Sending %d pipelined commands", len(commands))
+                while len(responses) < len(commands):
+                    # Refill the window, coalescing the new frames into a single write
+                    frames = []
+                    while sent < len(commands) and sent - len(responses) < self.PIPELINE_WINDOW:
+                        command, params = commands[sent]
+                        frames.append(self._frame(command, params))
+                        sent += 1
+                    if frames:
+                        sock.settimeout(10)  # 10 second send timeout
+                        sock.sendall(b"".join(frames))
+                    command = commands[len(responses)][0]
+                    responses.append(self._parse_response(command, self._receive_response(command)))
+            except Exception as e:
+                logger.error(f"Pipelined commands failed after {len(responses)}/{len(commands)} responses: {e}")
                 self._close_socket_unsafe()
+                responses.extend({"status": "error", "error": str(e)} for _ in range(len(commands) - len(responses)))
+            finally:
+                self._last_activity = time.monotonic()
+        
+        return responses
+
+    def _frame(self, command: str, params: Dict[str, Any]) -> bytes:
+        """Encode a command as a length-prefixed JSON frame."""
+        payload = _json_dumps_bytes({
+            "type": command,
+            "params": params or {}
+        })
+        return self.FRAME_HEADER.pack(len(payload)) + payload
+
+    def _parse_response(self, command: str, response_data) -> Dict[str, Any]:
+        """Decode a response payload and normalize failure responses to status/error form."""
+        try:
+            response = _json_loads(response_data)
+        except ValueError as e:
+            logger.error(f"JSON decode error: {e}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Raw response: %s", bytes(response_data[:500]))
+            raise ValueError(f"Invalid JSON response: {e}")
+        
+        logger.debug("Command %s completed successfully", command)
+        
+        # Normalize error responses
+        if response.get("status") == "error":
+            error_msg = response.get("error") or response.get("message", "Unknown error")
+            logger.warning(f"Unreal returned error: {error_msg}")
+        elif response.get("success") is False:
+            error_msg = response.get("error") or response.get("message", "Unknown error")
+            response = {"status": "error", "error": error_msg}
+            logger.warning(f"Unreal returned failure: {error_msg}")
+        
+        return response
 
 # Global connection instance (singleton pattern)
 _unreal_connection: Optional[UnrealConnection] = None
@@ -446,38 +635,51 @@ mcp = FastMCP(
     lifespan=server_lifespan
 )
 
-# Essential Actor Management Tools
-@mcp.tool()
-def get_actors_in_level(random_string: str = "") -> Dict[str, Any]:
-    """Get a list of all actors in the current level."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
+def threaded_tool():
+    """
+    Register a blocking tool with FastMCP so it runs in a worker thread.
     
+    Tools talk to Unreal over a blocking socket; running them via asyncio.to_thread
+    keeps the event loop free to serve other requests while a large build is in
+    progress. The undecorated sync function is returned so helpers can keep
+    calling tools such as set_actor_transform or construct_house directly.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            return await asyncio.to_thread(fn, *args, **kwargs)
+        mcp.tool()(wrapper)
+        return fn
+    return decorator
+
+def _call(command: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    Send one command on the shared connection and return its response.
+    
+    The connection reconnects lazily inside send_command, so tools that only
+    forward their arguments to Unreal need no connection checks of their own.
+    """
     try:
-        response = unreal.send_command("get_actors_in_level", {})
+        response = get_unreal_connection().send_command(command, params or {})
         return response or {"success": False, "message": "No response from Unreal"}
     except Exception as e:
-        logger.error(f"get_actors_in_level error: {e}")
+        logger.error(f"{command} error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+# Essential Actor Management Tools
+@threaded_tool()
+def get_actors_in_level(random_string: str = "") -> Dict[str, Any]:
+    """Get a list of all actors in the current level."""
+    return _call("get_actors_in_level")
+
+@threaded_tool()
 def find_actors_by_name(pattern: str) -> Dict[str, Any]:
     """Find actors by name pattern."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        response = unreal.send_command("find_actors_by_name", {"pattern": pattern})
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"find_actors_by_name error: {e}")
-        return {"success": False, "message": str(e)}
+    return _call("find_actors_by_name", {"pattern": pattern})
 
 
 
-@mcp.tool()
+@threaded_tool()
 def delete_actor(name: str) -> Dict[str, Any]:
     """Delete an actor by name."""
     unreal = get_unreal_connection()
@@ -492,7 +694,7 @@ def delete_actor(name: str) -> Dict[str, Any]:
         logger.error(f"delete_actor error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def set_actor_transform(
     name: str,
     location: List[float] = None,
@@ -500,45 +702,27 @@ def set_actor_transform(
     scale: List[float] = None
 ) -> Dict[str, Any]:
     """Set the transform of an actor."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {"name": name}
-        if location is not None:
-            params["location"] = location
-        if rotation is not None:
-            params["rotation"] = rotation
-        if scale is not None:
-            params["scale"] = scale
-            
-        response = unreal.send_command("set_actor_transform", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"set_actor_transform error: {e}")
-        return {"success": False, "message": str(e)}
+    params = {"name": name}
+    if location is not None:
+        params["location"] = location
+    if rotation is not None:
+        params["rotation"] = rotation
+    if scale is not None:
+        params["scale"] = scale
+        
+    return _call("set_actor_transform", params)
 
 # Essential Blueprint Tools for Physics Actors
-@mcp.tool()
+@threaded_tool()
 def create_blueprint(name: str, parent_class: str) -> Dict[str, Any]:
     """Create a new Blueprint class."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {
-            "name": name,
-            "parent_class": parent_class
-        }
-        response = unreal.send_command("create_blueprint", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"create_blueprint error: {e}")
-        return {"success": False, "message": str(e)}
+    params = {
+        "name": name,
+        "parent_class": parent_class
+    }
+    return _call("create_blueprint", params)
 
-@mcp.tool()
+@threaded_tool()
 def add_component_to_blueprint(
     blueprint_name: str,
     component_type: str,
@@ -549,50 +733,32 @@ def add_component_to_blueprint(
     component_properties: Dict[str, Any] = {}
 ) -> Dict[str, Any]:
     """Add a component to a Blueprint."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {
-            "blueprint_name": blueprint_name,
-            "component_type": component_type,
-            "component_name": component_name,
-            "location": location,
-            "rotation": rotation,
-            "scale": scale,
-            "component_properties": component_properties
-        }
-        response = unreal.send_command("add_component_to_blueprint", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"add_component_to_blueprint error: {e}")
-        return {"success": False, "message": str(e)}
+    params = {
+        "blueprint_name": blueprint_name,
+        "component_type": component_type,
+        "component_name": component_name,
+        "location": location,
+        "rotation": rotation,
+        "scale": scale,
+        "component_properties": component_properties
+    }
+    return _call("add_component_to_blueprint", params)
 
-@mcp.tool()
+@threaded_tool()
 def set_static_mesh_properties(
     blueprint_name: str,
     component_name: str,
-    static_mesh: str = "/Engine/BasicShapes/Cube.Cube"
+    static_mesh: str = CUBE_MESH
 ) -> Dict[str, Any]:
     """Set static mesh properties on a StaticMeshComponent."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {
-            "blueprint_name": blueprint_name,
-            "component_name": component_name,
-            "static_mesh": static_mesh
-        }
-        response = unreal.send_command("set_static_mesh_properties", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"set_static_mesh_properties error: {e}")
-        return {"success": False, "message": str(e)}
+    params = {
+        "blueprint_name": blueprint_name,
+        "component_name": component_name,
+        "static_mesh": static_mesh
+    }
+    return _call("set_static_mesh_properties", params)
 
-@mcp.tool()
+@threaded_tool()
 def set_physics_properties(
     blueprint_name: str,
     component_name: str,
@@ -603,42 +769,24 @@ def set_physics_properties(
     angular_damping: float = 0
 ) -> Dict[str, Any]:
     """Set physics properties on a component."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {
-            "blueprint_name": blueprint_name,
-            "component_name": component_name,
-            "simulate_physics": simulate_physics,
-            "gravity_enabled": gravity_enabled,
-            "mass": mass,
-            "linear_damping": linear_damping,
-            "angular_damping": angular_damping
-        }
-        response = unreal.send_command("set_physics_properties", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"set_physics_properties error: {e}")
-        return {"success": False, "message": str(e)}
+    params = {
+        "blueprint_name": blueprint_name,
+        "component_name": component_name,
+        "simulate_physics": simulate_physics,
+        "gravity_enabled": gravity_enabled,
+        "mass": mass,
+        "linear_damping": linear_damping,
+        "angular_damping": angular_damping
+    }
+    return _call("set_physics_properties", params)
 
-@mcp.tool()
+@threaded_tool()
 def compile_blueprint(blueprint_name: str) -> Dict[str, Any]:
     """Compile a Blueprint."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {"blueprint_name": blueprint_name}
-        response = unreal.send_command("compile_blueprint", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"compile_blueprint error: {e}")
-        return {"success": False, "message": str(e)}
+    params = {"blueprint_name": blueprint_name}
+    return _call("compile_blueprint", params)
 
-@mcp.tool()
+@threaded_tool()
 def read_blueprint_content(
     blueprint_path: str,
     include_event_graph: bool = True,
@@ -696,7 +844,7 @@ def read_blueprint_content(
         logger.error(f"read_blueprint_content error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def analyze_blueprint_graph(
     blueprint_path: str,
     graph_name: str = "EventGraph",
@@ -749,7 +897,7 @@ def analyze_blueprint_graph(
         logger.error(f"analyze_blueprint_graph error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def get_blueprint_variable_details(
     blueprint_path: str,
     variable_name: str = None
@@ -765,28 +913,18 @@ def get_blueprint_variable_details(
     Returns:
         Dictionary with variable details including type, defaults, and usage
     """
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
+    params = {
+        "blueprint_path": blueprint_path,
+        "variable_name": variable_name
+    }
     
-    try:
-        params = {
-            "blueprint_path": blueprint_path,
-            "variable_name": variable_name
-        }
-        
-        logger.info(f"Getting Blueprint variable details: {blueprint_path}")
-        if variable_name:
-            logger.info(f"  - Specific variable: {variable_name}")
-        
-        response = unreal.send_command("get_blueprint_variable_details", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-        
-    except Exception as e:
-        logger.error(f"get_blueprint_variable_details error: {e}")
-        return {"success": False, "message": str(e)}
+    logger.info(f"Getting Blueprint variable details: {blueprint_path}")
+    if variable_name:
+        logger.info(f"  - Specific variable: {variable_name}")
+    
+    return _call("get_blueprint_variable_details", params)
 
-@mcp.tool()
+@threaded_tool()
 def get_blueprint_function_details(
     blueprint_path: str,
     function_name: str = None,
@@ -804,72 +942,85 @@ def get_blueprint_function_details(
     Returns:
         Dictionary with function details including signature and graph content
     """
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
+    params = {
+        "blueprint_path": blueprint_path,
+        "function_name": function_name,
+        "include_graph": include_graph
+    }
     
-    try:
-        params = {
-            "blueprint_path": blueprint_path,
-            "function_name": function_name,
-            "include_graph": include_graph
-        }
-        
-        logger.info(f"Getting Blueprint function details: {blueprint_path}")
-        if function_name:
-            logger.info(f"  - Specific function: {function_name}")
-        
-        response = unreal.send_command("get_blueprint_function_details", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-        
-    except Exception as e:
-        logger.error(f"get_blueprint_function_details error: {e}")
-        return {"success": False, "message": str(e)}
+    logger.info(f"Getting Blueprint function details: {blueprint_path}")
+    if function_name:
+        logger.info(f"  - Specific function: {function_name}")
+    
+    return _call("get_blueprint_function_details", params)
 
 
 
 # Advanced Composition Tools
-@mcp.tool()
+@contextmanager
+def _viewport_realtime_suspended(unreal):
+    """
+    Pause realtime rendering of the level viewports for the duration of a large build.
+    
+    Otherwise the editor keeps redrawing the growing level between every batch.
+    Plugins without set_viewport_realtime just answer with an error, and the build
+    then runs as before.
+    """
+    response = unreal.send_command("set_viewport_realtime", {"enabled": False})
+    suspended = bool(response) and response.get("status") == "success"
+    try:
+        yield
+    finally:
+        if suspended:
+            unreal.send_command("set_viewport_realtime", {"enabled": True})
+
+def _spawn_specs(unreal, specs: List[Dict[str, Any]], label: str) -> List[Dict[str, Any]]:
+    """Spawn a list of actor specs with one batch_spawn call and return the successful responses."""
+    batch_result = safe_batch_spawn_actors(unreal, specs)
+    spawned = [r for r in batch_result.get("results", ()) if r.get("status") == "success"]
+    if len(spawned) < len(specs):
+        logger.warning(f"{label}: {len(specs) - len(spawned)}/{len(specs)} actors failed to spawn")
+    return spawned
+
+@threaded_tool()
 def create_pyramid(
     base_size: int = 3,
     block_size: float = 100.0,
     location: List[float] = [0.0, 0.0, 0.0],
     name_prefix: str = "PyramidBlock",
-    mesh: str = "/Engine/BasicShapes/Cube.Cube"
+    mesh: str = CUBE_MESH
 ) -> Dict[str, Any]:
     """Spawn a pyramid made of cube actors."""
     try:
         unreal = get_unreal_connection()
         if not unreal:
             return {"success": False, "message": "Failed to connect to Unreal Engine"}
-        spawned = []
+        specs = []
         scale = block_size / 100.0
+        # Every block copies these shared fields and adds its own name and location
+        common = {"type": STATIC_MESH_ACTOR, "scale": [scale, scale, scale], "static_mesh": mesh}
         for level in range(base_size):
             count = base_size - level
+            # Level-invariant terms: centering offset, height and the row of y coordinates
+            center = (count - 1)/2
+            z = location[2] + level * block_size
+            ys = [location[1] + (y - center) * block_size for y in range(count)]
             for x in range(count):
+                # Format the structured name prefix once per row, not once per block
+                row_prefix = f"{name_prefix}_{level}_{x}_"
+                px = location[0] + (x - center) * block_size
                 for y in range(count):
-                    actor_name = f"{name_prefix}_{level}_{x}_{y}"
-                    loc = [
-                        location[0] + (x - (count - 1)/2) * block_size,
-                        location[1] + (y - (count - 1)/2) * block_size,
-                        location[2] + level * block_size
-                    ]
-                    params = {
-                        "name": actor_name,
-                        "type": "StaticMeshActor",
-                        "location": loc,
-                        "scale": [scale, scale, scale],
-                        "static_mesh": mesh
-                    }
-                    resp = safe_spawn_actor(unreal, params)
-                    if resp and resp.get("status") == "success":
-                        spawned.append(resp)
+                    spec = common.copy()
+                    spec["name"] = row_prefix + str(y)
+                    spec["location"] = [px, ys[y], z]
+                    specs.append(spec)
+        spawned = _spawn_specs(unreal, specs, "create_pyramid")
         return {"success": True, "actors": spawned}
     except Exception as e:
         logger.error(f"create_pyramid error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def create_wall(
     length: int = 5,
     height: int = 2,
@@ -877,45 +1028,59 @@ def create_wall(
     location: List[float] = [0.0, 0.0, 0.0],
     orientation: str = "x",
     name_prefix: str = "WallBlock",
-    mesh: str = "/Engine/BasicShapes/Cube.Cube"
+    mesh: str = CUBE_MESH
 ) -> Dict[str, Any]:
     """Create a simple wall from cubes."""
     try:
         unreal = get_unreal_connection()
         if not unreal:
             return {"success": False, "message": "Failed to connect to Unreal Engine"}
-        spawned = []
+        specs = []
         scale = block_size / 100.0
+        common = {"type": STATIC_MESH_ACTOR, "scale": [scale, scale, scale], "static_mesh": mesh}
         for h in range(height):
+            row_prefix = f"{name_prefix}_{h}_"
+            z = location[2] + h * block_size
             for i in range(length):
-                actor_name = f"{name_prefix}_{h}_{i}"
+                spec = common.copy()
+                spec["name"] = row_prefix + str(i)
                 if orientation == "x":
-                    loc = [location[0] + i * block_size, location[1], location[2] + h * block_size]
+                    spec["location"] = [location[0] + i * block_size, location[1], z]
                 else:
-                    loc = [location[0], location[1] + i * block_size, location[2] + h * block_size]
-                params = {
-                    "name": actor_name,
-                    "type": "StaticMeshActor",
-                    "location": loc,
-                    "scale": [scale, scale, scale],
-                    "static_mesh": mesh
-                }
-                resp = safe_spawn_actor(unreal, params)
-                if resp and resp.get("status") == "success":
-                    spawned.append(resp)
+                    spec["location"] = [location[0], location[1] + i * block_size, z]
+                specs.append(spec)
+        spawned = _spawn_specs(unreal, specs, "create_wall")
         return {"success": True, "actors": spawned}
     except Exception as e:
         logger.error(f"create_wall error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+def _square_wall_offsets(size: int, block_size: float) -> List[tuple]:
+    """
+    Compute (name_suffix, x_offset, y_offset) for each block of a square tower ring.
+    
+    Walls are emitted front, right, back, left, matching the block naming of create_tower.
+    """
+    half_size = size / 2
+    offsets = []
+    for i in range(size):  # Front wall
+        offsets.append((f"front_{i}", (i - half_size + 0.5) * block_size, -half_size * block_size))
+    for i in range(size):  # Right wall
+        offsets.append((f"right_{i}", half_size * block_size, (i - half_size + 0.5) * block_size))
+    for i in range(size):  # Back wall
+        offsets.append((f"back_{i}", (half_size - i - 0.5) * block_size, half_size * block_size))
+    for i in range(size):  # Left wall
+        offsets.append((f"left_{i}", -half_size * block_size, (half_size - i - 0.5) * block_size))
+    return offsets
+
+@threaded_tool()
 def create_tower(
     height: int = 10,
     base_size: int = 4,
     block_size: float = 100.0,
     location: List[float] = [0.0, 0.0, 0.0],
     name_prefix: str = "TowerBlock",
-    mesh: str = "/Engine/BasicShapes/Cube.Cube",
+    mesh: str = CUBE_MESH,
     tower_style: str = "cylindrical"  # "cylindrical", "square", "tapered"
 ) -> Dict[str, Any]:
     """Create a realistic tower with various architectural styles."""
@@ -923,183 +1088,121 @@ def create_tower(
         unreal = get_unreal_connection()
         if not unreal:
             return {"success": False, "message": "Failed to connect to Unreal Engine"}
-        spawned = []
+        specs = []
         scale = block_size / 100.0
+        # Shared fields for wall blocks and corner details; only name and location vary
+        block_common = {"type": STATIC_MESH_ACTOR, "scale": [scale, scale, scale], "static_mesh": mesh}
+        detail_common = {
+            "type": STATIC_MESH_ACTOR,
+            "scale": [scale * 0.7, scale * 0.7, scale * 0.7],
+            "static_mesh": CYLINDER_MESH
+        }
+
+        # Every level reuses the same ring of world-space (x, y) positions; only z changes.
+        # Build each ring once, already translated to the tower origin.
+        origin_x, origin_y = location[0], location[1]
+        radius = (base_size / 2) * block_size  # Convert to world units (centimeters)
+        circumference = 2 * math.pi * radius
+        num_blocks = max(8, int(circumference / block_size))
+        circle_ring = [
+            (str(i),
+             origin_x + radius * math.cos((2 * math.pi * i) / num_blocks),
+             origin_y + radius * math.sin((2 * math.pi * i) / num_blocks))
+            for i in range(num_blocks)
+        ]
+        # Square rings per wall size (tapered towers shrink every two levels)
+        square_rings = {}
+        detail_radius = (base_size/2 + 0.5) * block_size
+        corner_ring = [
+            (f"detail_{corner}",
+             origin_x + detail_radius * math.cos(corner * math.pi / 2),
+             origin_y + detail_radius * math.sin(corner * math.pi / 2))
+            for corner in range(4)
+        ]
 
         for level in range(height):
             level_height = location[2] + level * block_size
+            level_prefix = f"{name_prefix}_{level}_"
             
             if tower_style == "cylindrical":
                 # Create circular tower
-                radius = (base_size / 2) * block_size  # Convert to world units (centimeters)
-                circumference = 2 * math.pi * radius
-                num_blocks = max(8, int(circumference / block_size))
-                
-                for i in range(num_blocks):
-                    angle = (2 * math.pi * i) / num_blocks
-                    x = location[0] + radius * math.cos(angle)
-                    y = location[1] + radius * math.sin(angle)
-                    
-                    actor_name = f"{name_prefix}_{level}_{i}"
-                    params = {
-                        "name": actor_name,
-                        "type": "StaticMeshActor",
-                        "location": [x, y, level_height],
-                        "scale": [scale, scale, scale],
-                        "static_mesh": mesh
-                    }
-                    resp = safe_spawn_actor(unreal, params)
-                    if resp and resp.get("status") == "success":
-                        spawned.append(resp)
-                        
-            elif tower_style == "tapered":
-                # Create tapering square tower
-                current_size = max(1, base_size - (level // 2))
-                half_size = current_size / 2
-                
-                # Create walls for current level
-                for side in range(4):
-                    for i in range(current_size):
-                        if side == 0:  # Front wall
-                            x = location[0] + (i - half_size + 0.5) * block_size
-                            y = location[1] - half_size * block_size
-                            actor_name = f"{name_prefix}_{level}_front_{i}"
-                        elif side == 1:  # Right wall
-                            x = location[0] + half_size * block_size
-                            y = location[1] + (i - half_size + 0.5) * block_size
-                            actor_name = f"{name_prefix}_{level}_right_{i}"
-                        elif side == 2:  # Back wall
-                            x = location[0] + (half_size - i - 0.5) * block_size
-                            y = location[1] + half_size * block_size
-                            actor_name = f"{name_prefix}_{level}_back_{i}"
-                        else:  # Left wall
-                            x = location[0] - half_size * block_size
-                            y = location[1] + (half_size - i - 0.5) * block_size
-                            actor_name = f"{name_prefix}_{level}_left_{i}"
-                            
-                        params = {
-                            "name": actor_name,
-                            "type": "StaticMeshActor",
-                            "location": [x, y, level_height],
-                            "scale": [scale, scale, scale],
-                            "static_mesh": mesh
-                        }
-                        resp = unreal.send_command("spawn_actor", params)
-                        if resp:
-                            spawned.append(resp)
-                            
-            else:  # square tower
-                # Create square tower walls
-                half_size = base_size / 2
-                
-                # Four walls
-                for side in range(4):
-                    for i in range(base_size):
-                        if side == 0:  # Front wall
-                            x = location[0] + (i - half_size + 0.5) * block_size
-                            y = location[1] - half_size * block_size
-                            actor_name = f"{name_prefix}_{level}_front_{i}"
-                        elif side == 1:  # Right wall
-                            x = location[0] + half_size * block_size
-                            y = location[1] + (i - half_size + 0.5) * block_size
-                            actor_name = f"{name_prefix}_{level}_right_{i}"
-                        elif side == 2:  # Back wall
-                            x = location[0] + (half_size - i - 0.5) * block_size
-                            y = location[1] + half_size * block_size
-                            actor_name = f"{name_prefix}_{level}_back_{i}"
-                        else:  # Left wall
-                            x = location[0] - half_size * block_size
-                            y = location[1] + (half_size - i - 0.5) * block_size
-                            actor_name = f"{name_prefix}_{level}_left_{i}"
-                            
-                        params = {
-                            "name": actor_name,
-                            "type": "StaticMeshActor",
-                            "location": [x, y, level_height],
-                            "scale": [scale, scale, scale],
-                            "static_mesh": mesh
-                        }
-                        resp = unreal.send_command("spawn_actor", params)
-                        if resp:
-                            spawned.append(resp)
+                ring = circle_ring
+            else:
+                # Square towers keep base_size; tapered towers shrink every two levels
+                ring_size = base_size if tower_style != "tapered" else max(1, base_size - (level // 2))
+                ring = square_rings.get(ring_size)
+                if ring is None:
+                    ring = square_rings[ring_size] = [
+                        (suffix, origin_x + offset_x, origin_y + offset_y)
+                        for suffix, offset_x, offset_y in _square_wall_offsets(ring_size, block_size)
+                    ]
+            
+            # One comprehension per level keeps the per-block work in a tight loop
+            specs.extend([
+                {**block_common, "name": level_prefix + suffix, "location": [x, y, level_height]}
+                for suffix, x, y in ring
+            ])
                             
             # Add decorative elements every few levels
             if level % 3 == 2 and level < height - 1:
                 # Add corner details
-                for corner in range(4):
-                    angle = corner * math.pi / 2
-                    detail_x = location[0] + (base_size/2 + 0.5) * block_size * math.cos(angle)
-                    detail_y = location[1] + (base_size/2 + 0.5) * block_size * math.sin(angle)
-                    
-                    actor_name = f"{name_prefix}_{level}_detail_{corner}"
-                    params = {
-                        "name": actor_name,
-                        "type": "StaticMeshActor",
-                        "location": [detail_x, detail_y, level_height],
-                        "scale": [scale * 0.7, scale * 0.7, scale * 0.7],
-                        "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
-                    }
-                    resp = safe_spawn_actor(unreal, params)
-                    if resp and resp.get("status") == "success":
-                        spawned.append(resp)
+                specs.extend([
+                    {**detail_common, "name": level_prefix + suffix, "location": [x, y, level_height]}
+                    for suffix, x, y in corner_ring
+                ])
                         
+        spawned = _spawn_specs(unreal, specs, "create_tower")
         return {"success": True, "actors": spawned, "tower_style": tower_style}
     except Exception as e:
         logger.error(f"create_tower error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def create_staircase(
     steps: int = 5,
     step_size: List[float] = [100.0, 100.0, 50.0],
     location: List[float] = [0.0, 0.0, 0.0],
     name_prefix: str = "Stair",
-    mesh: str = "/Engine/BasicShapes/Cube.Cube"
+    mesh: str = CUBE_MESH
 ) -> Dict[str, Any]:
     """Create a staircase from cubes."""
     try:
         unreal = get_unreal_connection()
         if not unreal:
             return {"success": False, "message": "Failed to connect to Unreal Engine"}
-        spawned = []
+        specs = []
         sx, sy, sz = step_size
+        common = {"type": STATIC_MESH_ACTOR, "scale": [sx/100.0, sy/100.0, sz/100.0], "static_mesh": mesh}
         for i in range(steps):
-            actor_name = f"{name_prefix}_{i}"
-            loc = [location[0] + i * sx, location[1], location[2] + i * sz]
-            scale = [sx/100.0, sy/100.0, sz/100.0]
-            params = {
-                "name": actor_name,
-                "type": "StaticMeshActor",
-                "location": loc,
-                "scale": scale,
-                "static_mesh": mesh
-            }
-            resp = safe_spawn_actor(unreal, params)
-            if resp and resp.get("status") == "success":
-                spawned.append(resp)
+            spec = common.copy()
+            spec["name"] = f"{name_prefix}_{i}"
+            spec["location"] = [location[0] + i * sx, location[1], location[2] + i * sz]
+            specs.append(spec)
+        spawned = _spawn_specs(unreal, specs, "create_staircase")
         return {"success": True, "actors": spawned}
     except Exception as e:
         logger.error(f"create_staircase error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def construct_house(
     width: int = 1200,
     depth: int = 1000,
     height: int = 600,
     location: List[float] = [0.0, 0.0, 0.0],
     name_prefix: str = "House",
-    mesh: str = "/Engine/BasicShapes/Cube.Cube",
-    house_style: str = "modern"  # "modern", "cottage"
+    mesh: str = CUBE_MESH,
+    house_style: str = "modern",  # "modern", "cottage"
+    instanced: bool = False
 ) -> Dict[str, Any]:
-    """Construct a realistic house with architectural details and multiple rooms."""
+    """Construct a realistic house with architectural details and multiple rooms. Set instanced=True to render the pieces as instanced static meshes (far fewer actors, pieces are not individually selectable)."""
     try:
         unreal = get_unreal_connection()
         if not unreal:
             return {"success": False, "message": "Failed to connect to Unreal Engine"}
 
         # Use the helper function to build the house
-        return build_house(unreal, width, depth, height, location, name_prefix, mesh, house_style)
+        return build_house(unreal, width, depth, height, location, name_prefix, mesh, house_style, instanced)
 
     except Exception as e:
         logger.error(f"construct_house error: {e}")
@@ -1107,7 +1210,7 @@ def construct_house(
 
 
 
-@mcp.tool()
+@threaded_tool()
 def construct_mansion(
     mansion_scale: str = "large",  # "small", "large", "epic", "legendary"
     location: List[float] = [0.0, 0.0, 0.0],
@@ -1146,13 +1249,13 @@ def construct_mansion(
             "actors": all_actors,
             "stats": {
                 "scale": mansion_scale,
-                "wings": layout["wings"],
-                "floors": layout["floors"],
-                "main_rooms": layout["main_rooms"],
-                "bedrooms": layout["bedrooms"],
-                "garden_size": layout["garden_size"],
-                "fountain_count": layout["fountain_count"],
-                "car_count": layout["car_count"],
+                "wings": layout.wings,
+                "floors": layout.floors,
+                "main_rooms": layout.main_rooms,
+                "bedrooms": layout.bedrooms,
+                "garden_size": layout.garden_size,
+                "fountain_count": layout.fountain_count,
+                "car_count": layout.car_count,
                 "total_actors": len(all_actors)
             }
         }
@@ -1161,46 +1264,45 @@ def construct_mansion(
         logger.error(f"construct_mansion error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def create_arch(
     radius: float = 300.0,
     segments: int = 6,
     location: List[float] = [0.0, 0.0, 0.0],
     name_prefix: str = "ArchBlock",
-    mesh: str = "/Engine/BasicShapes/Cube.Cube"
+    mesh: str = CUBE_MESH
 ) -> Dict[str, Any]:
     """Create a simple arch using cubes in a semicircle."""
     try:
         unreal = get_unreal_connection()
         if not unreal:
             return {"success": False, "message": "Failed to connect to Unreal Engine"}
-        spawned = []
         angle_step = math.pi / segments
         scale = radius / 300.0 / 2
+        common = {"type": STATIC_MESH_ACTOR, "scale": [scale, scale, scale], "static_mesh": mesh}
+        # Every block lies in the plane y = location[1]; only the angle varies
+        x0, y0, z0 = location[0], location[1], location[2]
+        cos, sin = math.cos, math.sin
+        specs = []
         for i in range(segments + 1):
             theta = angle_step * i
-            x = radius * math.cos(theta)
-            z = radius * math.sin(theta)
-            actor_name = f"{name_prefix}_{i}"
-            params = {
-                "name": actor_name,
-                "type": "StaticMeshActor",
-                "location": [location[0] + x, location[1], location[2] + z],
-                "scale": [scale, scale, scale],
-                "static_mesh": mesh
-            }
-            resp = safe_spawn_actor(unreal, params)
-            if resp and resp.get("status") == "success":
-                spawned.append(resp)
+            spec = common.copy()
+            spec["name"] = f"{name_prefix}_{i}"
+            spec["location"] = [x0 + radius * cos(theta), y0, z0 + radius * sin(theta)]
+            specs.append(spec)
+        spawned = _spawn_specs(unreal, specs, "create_arch")
         return {"success": True, "actors": spawned}
     except Exception as e:
         logger.error(f"create_arch error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+# Physics blueprints by (mesh, mass, physics flags, scale, color), shared across spawns
+_physics_blueprint_cache: Dict[tuple, str] = {}
+
+@threaded_tool()
 def spawn_physics_blueprint_actor (
     name: str,
-    mesh_path: str = "/Engine/BasicShapes/Cube.Cube",
+    mesh_path: str = CUBE_MESH,
     location: List[float] = [0.0, 0.0, 0.0],
     mass: float = 1.0,
     simulate_physics: bool = True,
@@ -1221,145 +1323,184 @@ def spawn_physics_blueprint_actor (
                If [R, G, B] is provided, alpha will be set to 1.0 automatically.
     """
     try:
-        bp_name = f"{name}_BP"
-        create_blueprint(bp_name, "Actor")
-        add_component_to_blueprint(bp_name, "StaticMeshComponent", "Mesh", scale=scale)
-        set_static_mesh_properties(bp_name, "Mesh", mesh_path)
-        set_physics_properties(bp_name, "Mesh", simulate_physics, gravity_enabled, mass)
-
-        # Set color if provided
+        # Convert 3-value color [R,G,B] to 4-value [R,G,B,A] if needed
         if color is not None:
-            # Convert 3-value color [R,G,B] to 4-value [R,G,B,A] if needed
             if len(color) == 3:
                 color = color + [1.0]  # Add alpha=1.0
             elif len(color) != 4:
                 logger.warning(f"Invalid color format: {color}. Expected [R,G,B] or [R,G,B,A]. Skipping color.")
                 color = None
-
+        
+        # Actors with identical settings share one blueprint, so repeat spawns skip the setup and compile
+        cache_key = (mesh_path, round(mass, 3), simulate_physics, gravity_enabled,
+                     tuple(scale), tuple(color) if color is not None else ())
+        unreal = get_unreal_connection()
+        bp_name = _physics_blueprint_cache.get(cache_key)
+        if bp_name is not None:
+            result = spawn_blueprint_actor(unreal, bp_name, name, location)
+            if "Blueprint not found" not in str(result.get("error", "")):
+                # Success, or a failure such as a name collision that a new blueprint would not fix
+                return result
+            # The cached blueprint was deleted in the editor; build a fresh one
+            logger.info("Cached blueprint %s no longer exists, recreating it", bp_name)
+            del _physics_blueprint_cache[cache_key]
+        
+        # Name the blueprint after its settings rather than the actor, so reusing an
+        # actor name with different settings can never reconfigure a cached blueprint
+        bp_name = f"PhysicsBP_{zlib.crc32(repr(cache_key).encode('utf-8')):08x}"
+        create_result = create_blueprint(bp_name, "Actor")
+        if create_result.get("status") == "success":
+            # The Mesh component carries the scale, so spawned actors need no set_actor_transform
+            add_component_to_blueprint(bp_name, "StaticMeshComponent", "Mesh", scale=scale)
+            set_static_mesh_properties(bp_name, "Mesh", mesh_path)
+            set_physics_properties(bp_name, "Mesh", simulate_physics, gravity_enabled, mass)
+
+            # Set color if provided
             if color is not None:
                 color_result = set_mesh_material_color(bp_name, "Mesh", color)
                 if not color_result.get("success", False):
                     logger.warning(f"Failed to set color {color} for {bp_name}: {color_result.get('message', 'Unknown error')}")
 
-        compile_blueprint(bp_name)
-        result = spawn_blueprint_actor(bp_name, name, location)
+            if compile_blueprint(bp_name).get("status") == "success":
+                _physics_blueprint_cache[cache_key] = bp_name
+        elif "already exists" in str(create_result.get("error", "")):
+            # Built by an earlier session; the name encodes the settings, so it is reused as is
+            _physics_blueprint_cache[cache_key] = bp_name
+        else:
+            return create_result
         
         # Spawn the blueprint actor using helper function
-        unreal = get_unreal_connection()
         result = spawn_blueprint_actor(unreal, bp_name, name, location)
 
-        # Ensure proper scale is set on the spawned actor
-        if result.get("success", False):
-            spawned_name = result.get("result", {}).get("name", name)
-            set_actor_transform(spawned_name, scale=scale)
-
         return result
     except Exception as e:
         logger.error(f"spawn_physics_blueprint_actor  error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def create_maze(
     rows: int = 8,
     cols: int = 8,
     cell_size: float = 300.0,
     wall_height: int = 3,
-    location: List[float] = [0.0, 0.0, 0.0]
+    location: List[float] = [0.0, 0.0, 0.0],
+    instanced: bool = False,
+    stacked_blocks: bool = False
 ) -> Dict[str, Any]:
-    """Create a proper solvable maze with entrance, exit, and guaranteed path using recursive backtracking algorithm."""
+    """Create a proper solvable maze with entrance, exit, and guaranteed path using recursive backtracking algorithm. Each wall cell is one cube stretched to wall_height cells; set stacked_blocks=True to stack wall_height separate cubes instead. Set instanced=True to render the wall blocks as one instanced static mesh instead of one actor per block."""
     try:
         unreal = get_unreal_connection()
         if not unreal:
             return {"success": False, "message": "Failed to connect to Unreal Engine"}
             
         import random
-        spawned = []
-        
-        # Initialize maze grid - True means wall, False means open
-        maze = [[True for _ in range(cols * 2 + 1)] for _ in range(rows * 2 + 1)]
-        
-        # Recursive backtracking maze generation
+        specs = []
+        
+        # Initialize maze grid - 1 means wall, 0 means open (one byte per cell, one bytearray per row)
+        maze = [bytearray(b"\x01") * (cols * 2 + 1) for _ in range(rows * 2 + 1)]
+        
+        # Backtracking maze generation with an explicit stack (no recursion limit on large mazes).
+        # Each stack entry keeps its shuffled directions so cells resume where they left off,
+        # which carves exactly the same maze as the recursive formulation.
+        # Each cell picks one of the 24 direction orders from a local generator instead of
+        # shuffling a fresh list through the module-level random functions.
+        randrange = random.Random().randrange
+        direction_count = len(_MAZE_DIRECTION_ORDERS)
         def carve_path(row, col):
-            # Mark current cell as path
-            maze[row * 2 + 1][col * 2 + 1] = False
-            
-            # Random directions
-            directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-            random.shuffle(directions)
+            maze[row * 2 + 1][col * 2 + 1] = 0
+            stack = [(row, col, iter(_MAZE_DIRECTION_ORDERS[randrange(direction_count)]))]
             
-            for dr, dc in directions:
-                new_row, new_col = row + dr, col + dc
-                
-                # Check bounds
-                if (0 <= new_row < rows and 0 <= new_col < cols and 
-                    maze[new_row * 2 + 1][new_col * 2 + 1]):
+            while stack:
+                row, col, remaining = stack[-1]
+                for dr, dc in remaining:
+                    new_row, new_col = row + dr, col + dc
                     
-                    # Carve wall between current and new cell
-                    maze[row * 2 + 1 + dr][col * 2 + 1 + dc] = False
-                    carve_path(new_row, new_col)
+                    # Check bounds
+                    if (0 <= new_row < rows and 0 <= new_col < cols and 
+                        maze[new_row * 2 + 1][new_col * 2 + 1]):
+                        
+                        # Carve wall between current and new cell, then descend into it
+                        maze[row * 2 + 1 + dr][col * 2 + 1 + dc] = 0
+                        maze[new_row * 2 + 1][new_col * 2 + 1] = 0
+                        stack.append((new_row, new_col, iter(_MAZE_DIRECTION_ORDERS[randrange(direction_count)])))
+                        break
+                else:
+                    stack.pop()
         
         # Start carving from top-left corner
         carve_path(0, 0)
         
         # Create entrance and exit
-        maze[1][0] = False  # Entrance on left side
-        maze[rows * 2 - 1][cols * 2] = False  # Exit on right side
+        maze[1][0] = 0  # Entrance on left side
+        maze[rows * 2 - 1][cols * 2] = 0  # Exit on right side
         
         # Build the actual maze in Unreal
         maze_height = rows * 2 + 1
         maze_width = cols * 2 + 1
         
+        wall_scale = cell_size/100.0
+        # Column x, row y and layer z coordinates are shared by every wall block on that line
+        xs = [location[0] + (c - maze_width/2) * cell_size for c in range(maze_width)]
+        if stacked_blocks:
+            wall_common = {"type": STATIC_MESH_ACTOR, "scale": [wall_scale, wall_scale, wall_scale], "static_mesh": CUBE_MESH}
+            zs = [location[2] + h * cell_size for h in range(wall_height)]
+        else:
+            # One cube per wall cell covering the same span as the stacked layers
+            wall_common = {"type": STATIC_MESH_ACTOR, "scale": [wall_scale, wall_scale, wall_scale * wall_height], "static_mesh": CUBE_MESH}
+            zs = [location[2] + (wall_height - 1) * cell_size / 2] if wall_height > 0 else []
+        # Wall blocks are numbered in emission order rather than named by row, column and layer
+        copy_wall = wall_common.copy
         for r in range(maze_height):
+            y_pos = location[1] + (r - maze_height/2) * cell_size
+            row = maze[r]
             for c in range(maze_width):
-                if maze[r][c]:  # If this is a wall
-                    # Stack blocks to create wall height
-                    for h in range(wall_height):
-                        x_pos = location[0] + (c - maze_width/2) * cell_size
-                        y_pos = location[1] + (r - maze_height/2) * cell_size
-                        z_pos = location[2] + h * cell_size
-                        
-                        actor_name = f"Maze_Wall_{r}_{c}_{h}"
-                        params = {
-                            "name": actor_name,
-                            "type": "StaticMeshActor",
-                            "location": [x_pos, y_pos, z_pos],
-                            "scale": [cell_size/100.0, cell_size/100.0, cell_size/100.0],
-                            "static_mesh": "/Engine/BasicShapes/Cube.Cube"
-                        }
-                        resp = safe_spawn_actor(unreal, params)
-                        if resp and resp.get("status") == "success":
-                            spawned.append(resp)
+                if row[c]:  # If this is a wall
+                    x_pos = xs[c]
+                    for z_pos in zs:
+                        spec = copy_wall()
+                        spec["name"] = "Maze_Wall_" + str(len(specs))
+                        spec["location"] = [x_pos, y_pos, z_pos]
+                        specs.append(spec)
+        
+        markers = []
         
         # Add entrance and exit markers
-        entrance_marker = safe_spawn_actor(unreal, {
+        markers.append({
             "name": "Maze_Entrance",
-            "type": "StaticMeshActor",
+            "type": STATIC_MESH_ACTOR,
             "location": [location[0] - maze_width/2 * cell_size - cell_size, 
                        location[1] + (-maze_height/2 + 1) * cell_size, 
                        location[2] + cell_size],
             "scale": [0.5, 0.5, 0.5],
-            "static_mesh": "/Engine/BasicShapes/Cylinder.Cylinder"
+            "static_mesh": CYLINDER_MESH
         })
-        if entrance_marker and entrance_marker.get("status") == "success":
-            spawned.append(entrance_marker)
             
-        exit_marker = safe_spawn_actor(unreal, {
+        markers.append({
             "name": "Maze_Exit",
-            "type": "StaticMeshActor", 
+            "type": STATIC_MESH_ACTOR, 
             "location": [location[0] + maze_width/2 * cell_size + cell_size,
                        location[1] + (-maze_height/2 + rows * 2 - 1) * cell_size,
                        location[2] + cell_size],
             "scale": [0.5, 0.5, 0.5],
             "static_mesh": "/Engine/BasicShapes/Sphere.Sphere"
         })
-        if exit_marker and exit_marker.get("status") == "success":
-            spawned.append(exit_marker)
+        
+        if instanced:
+            # Every wall block becomes an instance of one Maze_Walls actor
+            instanced_result = safe_spawn_instanced_meshes(unreal, specs, "Maze_Walls")
+            spawned = [r for r in instanced_result.get("results", ()) if r.get("status") == "success"]
+            wall_count = sum(r.get("result", {}).get("instance_count", 0) for r in spawned)
+            spawned.extend(_spawn_specs(unreal, markers, "create_maze"))
+        else:
+            # Walls and markers go to Unreal in one batch_spawn
+            spawned = _spawn_specs(unreal, specs + markers, "create_maze")
+            wall_count = sum(1 for block in spawned if "Wall" in block["result"].get("name", ""))
         
         return {
             "success": True, 
             "actors": spawned, 
             "maze_size": f"{rows}x{cols}",
-            "wall_count": len([block for block in spawned if "Wall" in block.get("name", "")]),
+            "wall_count": wall_count,
             "entrance": "Left side (cylinder marker)",
             "exit": "Right side (sphere marker)"
         }
@@ -1367,51 +1508,33 @@ def create_maze(
         logger.error(f"create_maze error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def get_available_materials(
     search_path: str = "/Game/",
     include_engine_materials: bool = True
 ) -> Dict[str, Any]:
     """Get a list of available materials in the project that can be applied to objects."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {
-            "search_path": search_path,
-            "include_engine_materials": include_engine_materials
-        }
-        response = unreal.send_command("get_available_materials", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"get_available_materials error: {e}")
-        return {"success": False, "message": str(e)}
+    params = {
+        "search_path": search_path,
+        "include_engine_materials": include_engine_materials
+    }
+    return _call("get_available_materials", params)
 
-@mcp.tool()
+@threaded_tool()
 def apply_material_to_actor(
     actor_name: str,
     material_path: str,
     material_slot: int = 0
 ) -> Dict[str, Any]:
     """Apply a specific material to an actor in the level."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {
-            "actor_name": actor_name,
-            "material_path": material_path,
-            "material_slot": material_slot
-        }
-        response = unreal.send_command("apply_material_to_actor", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"apply_material_to_actor error: {e}")
-        return {"success": False, "message": str(e)}
+    params = {
+        "actor_name": actor_name,
+        "material_path": material_path,
+        "material_slot": material_slot
+    }
+    return _call("apply_material_to_actor", params)
 
-@mcp.tool()
+@threaded_tool()
 def apply_material_to_blueprint(
     blueprint_name: str,
     component_name: str,
@@ -1419,41 +1542,23 @@ def apply_material_to_blueprint(
     material_slot: int = 0
 ) -> Dict[str, Any]:
     """Apply a specific material to a component in a Blueprint."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {
-            "blueprint_name": blueprint_name,
-            "component_name": component_name,
-            "material_path": material_path,
-            "material_slot": material_slot
-        }
-        response = unreal.send_command("apply_material_to_blueprint", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"apply_material_to_blueprint error: {e}")
-        return {"success": False, "message": str(e)}
+    params = {
+        "blueprint_name": blueprint_name,
+        "component_name": component_name,
+        "material_path": material_path,
+        "material_slot": material_slot
+    }
+    return _call("apply_material_to_blueprint", params)
 
-@mcp.tool()
+@threaded_tool()
 def get_actor_material_info(
     actor_name: str
 ) -> Dict[str, Any]:
     """Get information about the materials currently applied to an actor."""
-    unreal = get_unreal_connection()
-    if not unreal:
-        return {"success": False, "message": "Failed to connect to Unreal Engine"}
-    
-    try:
-        params = {"actor_name": actor_name}
-        response = unreal.send_command("get_actor_material_info", params)
-        return response or {"success": False, "message": "No response from Unreal"}
-    except Exception as e:
-        logger.error(f"get_actor_material_info error: {e}")
-        return {"success": False, "message": str(e)}
+    params = {"actor_name": actor_name}
+    return _call("get_actor_material_info", params)
 
-@mcp.tool()
+@threaded_tool()
 def set_mesh_material_color(
     blueprint_name: str,
     component_name: str,
@@ -1475,41 +1580,31 @@ def set_mesh_material_color(
         # Ensure all color values are floats between 0 and 1
         color = [float(min(1.0, max(0.0, val))) for val in color]
         
-        # Set BaseColor parameter first
-        params_base = {
-            "blueprint_name": blueprint_name,
-            "component_name": component_name,
-            "color": color,
-            "material_path": material_path,
-            "parameter_name": "BaseColor",
-            "material_slot": material_slot
-        }
-        response_base = unreal.send_command("set_mesh_material_color", params_base)
-        
-        # Set Color parameter second (for maximum compatibility)
-        params_color = {
+        # Set both BaseColor and Color (for maximum compatibility) on one material instance in a
+        # single round trip; plugins without parameter_names fall back to parameter_name alone
+        params = {
             "blueprint_name": blueprint_name,
             "component_name": component_name,
             "color": color,
             "material_path": material_path,
             "parameter_name": "Color",
+            "parameter_names": ["BaseColor", "Color"],
             "material_slot": material_slot
         }
-        response_color = unreal.send_command("set_mesh_material_color", params_color)
+        response = unreal.send_command("set_mesh_material_color", params)
         
-        # Return success if either parameter setting worked
-        if (response_base and response_base.get("status") == "success") or (response_color and response_color.get("status") == "success"):
+        if response and response.get("status") == "success":
             return {
                 "success": True, 
                 "message": f"Color applied successfully to slot {material_slot}: {color}",
-                "base_color_result": response_base,
-                "color_result": response_color,
+                "base_color_result": response,
+                "color_result": response,
                 "material_slot": material_slot
             }
         else:
             return {
                 "success": False, 
-                "message": f"Failed to set color parameters on slot {material_slot}. BaseColor: {response_base}, Color: {response_color}"
+                "message": f"Failed to set color parameters on slot {material_slot}: {response}"
             }
             
     except Exception as e:
@@ -1517,7 +1612,7 @@ def set_mesh_material_color(
         return {"success": False, "message": str(e)}
 
 # Advanced Town Generation System
-@mcp.tool()
+@threaded_tool()
 def create_town(
     town_size: str = "medium",  # "small", "medium", "large", "metropolis"
     building_density: float = 0.7,  # 0.0 to 1.0
@@ -1529,7 +1624,7 @@ def create_town(
     """Create a full dynamic town with buildings, streets, infrastructure, and vehicles."""
     try:
         import random
-        random.seed()  # Use different seed each time for variety
+        rng = random.Random()  # Fresh unseeded RNG per call for variety, shared by all helpers of this build
         
         unreal = get_unreal_connection()
         if not unreal:
@@ -1561,47 +1656,66 @@ def create_town(
         street_results = _create_street_grid(blocks, block_size, street_width, location, name_prefix)
         all_spawned.extend(street_results.get("actors", []))
         
-        # Create buildings in each block
+        # Plan the buildings for each block, then build them on a small worker pool: a
+        # building's Python-side layout overlaps the previous one's round trip to Unreal
         logger.info("Placing buildings...")
-        building_count = 0
+        # Only mixed towns pick their building mix per block; the other styles use one list throughout
+        if architectural_style == "downtown" or architectural_style == "futuristic":
+            style_building_types = ["skyscraper", "office_tower", "apartment_complex", "shopping_mall", "parking_garage", "hotel"]
+        elif architectural_style == "mixed":
+            style_building_types = None
+        else:
+            style_building_types = [architectural_style] * 3 + ["commercial", "restaurant", "store"]
+        central_building_types = ["skyscraper", "office_tower", "apartment_complex", "hotel", "shopping_mall"]
+        outer_building_types = ["house", "tower", "mansion", "commercial", "apartment_building", "restaurant", "store"]
+        
+        planned = []
         for block_x in range(blocks):
             for block_y in range(blocks):
-                if building_count >= target_population:
+                if len(planned) >= target_population:
                     break
                     
                 # Skip some blocks randomly for variety
-                if random.random() > building_density:
+                if rng.random() > building_density:
                     continue
                 
                 block_center_x = location[0] + (block_x - blocks/2) * block_size
                 block_center_y = location[1] + (block_y - blocks/2) * block_size
                 
                 # Randomly choose building type based on style and location
-                if architectural_style == "downtown" or architectural_style == "futuristic":
-                    building_types = ["skyscraper", "office_tower", "apartment_complex", "shopping_mall", "parking_garage", "hotel"]
-                elif architectural_style == "mixed":
+                if style_building_types is not None:
+                    building_types = style_building_types
+                else:
                     # Central blocks get taller buildings
                     is_central = abs(block_x - blocks//2) <= 1 and abs(block_y - blocks//2) <= 1
-                    if is_central and random.random() < skyscraper_chance:
-                        building_types = ["skyscraper", "office_tower", "apartment_complex", "hotel", "shopping_mall"]
+                    if is_central and rng.random() < skyscraper_chance:
+                        building_types = central_building_types
                     else:
-                        building_types = ["house", "tower", "mansion", "commercial", "apartment_building", "restaurant", "store"]
-                else:
-                    building_types = [architectural_style] * 3 + ["commercial", "restaurant", "store"]
+                        building_types = outer_building_types
                 
-                building_type = random.choice(building_types)
+                building_type = rng.choice(building_types)
                 
-                # Create building with variety
-                building_result = _create_town_building(
+                # Each building gets its own RNG so concurrent builds don't share one
+                planned.append((
                     building_type, 
                     [block_center_x, block_center_y, location[2]],
                     building_area,
                     max_height,
                     f"{name_prefix}_Building_{block_x}_{block_y}",
-                    building_count
-                )
-                
-                if building_result.get("status") == "success":
+                    len(planned),
+                    random.Random(rng.getrandbits(64))
+                ))
+        
+        building_count = 0
+        with ThreadPoolExecutor(max_workers=TOWN_BUILD_WORKERS) as executor:
+            futures = [
+                executor.submit(_create_town_building, building_type, building_loc, area, height, prefix, building_id, rng=building_rng)
+                for building_type, building_loc, area, height, prefix, building_id, building_rng in planned
+            ]
+            # Collect in plan order so the actor list is independent of completion order
+            for future in futures:
+                building_result = future.result()
+                if building_result.get("success"):
                     all_spawned.extend(building_result.get("actors", []))
                     building_count += 1
         
@@ -1611,17 +1725,17 @@ def create_town(
             logger.info("Adding infrastructure...")
             
             # Street lights
-            light_results = _create_street_lights(blocks, block_size, location, name_prefix)
+            light_results = _create_street_lights(blocks, block_size, location, name_prefix, rng=rng)
             all_spawned.extend(light_results.get("actors", []))
             infrastructure_count += len(light_results.get("actors", []))
             
             # Vehicles
-            vehicle_results = _create_town_vehicles(blocks, block_size, street_width, location, name_prefix, target_population // 3)
+            vehicle_results = _create_town_vehicles(blocks, block_size, street_width, location, name_prefix, target_population // 3, rng=rng)
             all_spawned.extend(vehicle_results.get("actors", []))
             infrastructure_count += len(vehicle_results.get("actors", []))
             
             # Parks and decorations
-            decoration_results = _create_town_decorations(blocks, block_size, location, name_prefix)
+            decoration_results = _create_town_decorations(blocks, block_size, location, name_prefix, rng=rng)
             all_spawned.extend(decoration_results.get("actors", []))
             infrastructure_count += len(decoration_results.get("actors", []))
             
@@ -1635,7 +1749,7 @@ def create_town(
             infrastructure_count += len(traffic_results.get("actors", []))
             
             # Street signs and billboards
-            signage_results = _create_street_signage(blocks, block_size, location, name_prefix, town_size)
+            signage_results = _create_street_signage(blocks, block_size, location, name_prefix, town_size, rng=rng)
             all_spawned.extend(signage_results.get("actors", []))
             infrastructure_count += len(signage_results.get("actors", []))
             
@@ -1645,12 +1759,12 @@ def create_town(
             infrastructure_count += len(sidewalk_results.get("actors", []))
             
             # Urban furniture (benches, trash cans, bus stops)
-            furniture_results = _create_urban_furniture(blocks, block_size, location, name_prefix)
+            furniture_results = _create_urban_furniture(blocks, block_size, location, name_prefix, rng=rng)
             all_spawned.extend(furniture_results.get("actors", []))
             infrastructure_count += len(furniture_results.get("actors", []))
             
             # Parking meters and hydrants
-            utility_results = _create_street_utilities(blocks, block_size, location, name_prefix)
+            utility_results = _create_street_utilities(blocks, block_size, location, name_prefix, rng=rng)
             all_spawned.extend(utility_results.get("actors", []))
             infrastructure_count += len(utility_results.get("actors", []))
             
@@ -1680,19 +1794,25 @@ def create_town(
         return {"success": False, "message": str(e)}
 
 
-@mcp.tool()
+@threaded_tool()
 def create_castle_fortress(
     castle_size: str = "large",  # "small", "medium", "large", "epic"
     location: List[float] = [0.0, 0.0, 0.0],
     name_prefix: str = "Castle",
     include_siege_weapons: bool = True,
     include_village: bool = True,
-    architectural_style: str = "medieval"  # "medieval", "fantasy", "gothic"
+    architectural_style: str = "medieval",  # "medieval", "fantasy", "gothic"
+    instanced: bool = False
 ) -> Dict[str, Any]:
     """
     Create a massive castle fortress with walls, towers, courtyards, throne room,
     and surrounding village. Perfect for dramatic TikTok reveals showing
     the scale and detail of a complete medieval fortress.
+    
+    Set instanced=True to render each castle section as one instanced static mesh
+    actor per mesh (a few dozen actors instead of thousands; pieces are not
+    individually selectable). A non-instanced castle projected to need more than
+    MAX_CASTLE_ACTORS actors is refused before anything is spawned.
     """
     try:
         unreal = get_unreal_connection()
@@ -1700,36 +1820,58 @@ def create_castle_fortress(
             return {"success": False, "message": "Failed to connect to Unreal Engine"}
         
         logger.info(f"Creating {castle_size} {architectural_style} castle fortress")
+        start_time = time.perf_counter()
         all_actors = []
         
         # Get size parameters and calculate scaled dimensions
-        params = get_castle_size_params(castle_size)
-        dimensions = calculate_scaled_dimensions(params, scale_factor=2.0)
-        
-        # Build castle components using helper functions
-        build_outer_bailey_walls(unreal, name_prefix, location, dimensions, all_actors)
-        build_inner_bailey_walls(unreal, name_prefix, location, dimensions, all_actors)
-        build_gate_complex(unreal, name_prefix, location, dimensions, all_actors)
-        build_corner_towers(unreal, name_prefix, location, dimensions, architectural_style, all_actors)
-        build_inner_corner_towers(unreal, name_prefix, location, dimensions, all_actors)
-        build_intermediate_towers(unreal, name_prefix, location, dimensions, all_actors)
-        build_central_keep(unreal, name_prefix, location, dimensions, all_actors)
-        build_courtyard_complex(unreal, name_prefix, location, dimensions, all_actors)
-        build_bailey_annexes(unreal, name_prefix, location, dimensions, all_actors)
+        dimensions = get_castle_dimensions(castle_size, scale_factor=2.0)
+        
+        if not instanced:
+            projected = estimate_castle_actor_count(dimensions, castle_size, include_siege_weapons, include_village)
+            if projected > MAX_CASTLE_ACTORS:
+                return {
+                    "success": False,
+                    "message": f"The {castle_size} castle would spawn about {projected} actors (limit {MAX_CASTLE_ACTORS}); "
+                               "use instanced=True, a smaller castle_size, or include_village=False"
+                }
+        
+        # Castle components as independent sections, listed in build order
+        sections = [
+            lambda actors: build_outer_bailey_walls(unreal, name_prefix, location, dimensions, actors, instanced),
+            lambda actors: build_inner_bailey_walls(unreal, name_prefix, location, dimensions, actors, instanced),
+            lambda actors: build_gate_complex(unreal, name_prefix, location, dimensions, actors, instanced),
+            lambda actors: build_corner_towers(unreal, name_prefix, location, dimensions, architectural_style, actors, instanced),
+            lambda actors: build_inner_corner_towers(unreal, name_prefix, location, dimensions, actors, instanced),
+            lambda actors: build_intermediate_towers(unreal, name_prefix, location, dimensions, actors, instanced),
+            lambda actors: build_central_keep(unreal, name_prefix, location, dimensions, actors, instanced),
+            lambda actors: build_courtyard_complex(unreal, name_prefix, location, dimensions, actors, instanced),
+            lambda actors: build_bailey_annexes(unreal, name_prefix, location, dimensions, actors, instanced),
+        ]
         
         # Add optional components
         if include_siege_weapons:
-            build_siege_weapons(unreal, name_prefix, location, dimensions, all_actors)
+            sections.append(lambda actors: build_siege_weapons(unreal, name_prefix, location, dimensions, actors, instanced))
         
         if include_village:
-            build_village_settlement(unreal, name_prefix, location, dimensions, castle_size, all_actors)
+            sections.append(lambda actors: build_village_settlement(unreal, name_prefix, location, dimensions, castle_size, actors, instanced))
         
         # Add final touches
-        build_drawbridge_and_moat(unreal, name_prefix, location, dimensions, all_actors)
-        add_decorative_flags(unreal, name_prefix, location, dimensions, all_actors)
-        
-        logger.info(f"Castle fortress creation complete! Created {len(all_actors)} actors")
-
+        sections.append(lambda actors: build_drawbridge_and_moat(unreal, name_prefix, location, dimensions, actors, instanced))
+        sections.append(lambda actors: add_decorative_flags(unreal, name_prefix, location, dimensions, actors, instanced))
+        
+        # Sections overlap building their specs with each other's spawn round trips;
+        # each fills its own list so the actor order matches the build order
+        section_actors = [[] for _ in sections]
+        with _viewport_realtime_suspended(unreal), ThreadPoolExecutor(max_workers=CASTLE_BUILD_WORKERS) as executor:
+            futures = [executor.submit(section, actors) for section, actors in zip(sections, section_actors)]
+            for future in futures:
+                future.result()
+        for actors in section_actors:
+            all_actors.extend(actors)
+        
+        # Sections only log at DEBUG; one summary line covers the whole build
+        logger.info("Castle fortress creation complete! Created %d actors (%d towers) in %.2fs",
+                    len(all_actors), dimensions.tower_count, time.perf_counter() - start_time)
         
         return {
             "success": True,
@@ -1738,8 +1880,8 @@ def create_castle_fortress(
             "stats": {
                 "size": castle_size,
                 "style": architectural_style,
-                "wall_sections": int(dimensions["outer_width"]/200) * 2 + int(dimensions["outer_depth"]/200) * 2,
-                "towers": dimensions["tower_count"],
+                "wall_sections": (dimensions.outer_width // 200) * 2 + (dimensions.outer_depth // 200) * 2,
+                "towers": dimensions.tower_count,
                 "has_village": include_village,
                 "has_siege_weapons": include_siege_weapons,
                 "total_actors": len(all_actors)
@@ -1750,7 +1892,7 @@ def create_castle_fortress(
         logger.error(f"create_castle_fortress error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def create_suspension_bridge(
     span_length: float = 6000.0,
     deck_width: float = 800.0,
@@ -1760,10 +1902,10 @@ def create_suspension_bridge(
     location: List[float] = [0.0, 0.0, 0.0],
     orientation: str = "x",
     name_prefix: str = "Bridge",
-    deck_mesh: str = "/Engine/BasicShapes/Cube.Cube",
-    tower_mesh: str = "/Engine/BasicShapes/Cube.Cube",
-    cable_mesh: str = "/Engine/BasicShapes/Cylinder.Cylinder",
-    suspender_mesh: str = "/Engine/BasicShapes/Cylinder.Cylinder",
+    deck_mesh: str = CUBE_MESH,
+    tower_mesh: str = CUBE_MESH,
+    cable_mesh: str = CYLINDER_MESH,
+    suspender_mesh: str = CYLINDER_MESH,
     dry_run: bool = False
 ) -> Dict[str, Any]:
     """
@@ -1873,7 +2015,7 @@ def create_suspension_bridge(
         logger.error(f"create_suspension_bridge error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def create_aqueduct(
     arches: int = 18,
     arch_radius: float = 600.0,
@@ -1884,9 +2026,9 @@ def create_aqueduct(
     location: List[float] = [0.0, 0.0, 0.0],
     orientation: str = "x",
     name_prefix: str = "Aqueduct",
-    arch_mesh: str = "/Engine/BasicShapes/Cylinder.Cylinder",
-    pier_mesh: str = "/Engine/BasicShapes/Cube.Cube",
-    deck_mesh: str = "/Engine/BasicShapes/Cube.Cube",
+    arch_mesh: str = CYLINDER_MESH,
+    pier_mesh: str = CUBE_MESH,
+    deck_mesh: str = CUBE_MESH,
     dry_run: bool = False
 ) -> Dict[str, Any]:
     """
@@ -2012,7 +2154,7 @@ def create_aqueduct(
 # Blueprint Node Graph Tool
 # ============================================================================
 
-@mcp.tool()
+@threaded_tool()
 def add_node(
     blueprint_name: str,
     node_type: str,
@@ -2130,7 +2272,7 @@ def add_node(
         logger.error(f"add_node error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def connect_nodes(
     blueprint_name: str,
     source_node_id: str,
@@ -2175,7 +2317,7 @@ def connect_nodes(
         logger.error(f"connect_nodes error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def create_variable(
     blueprint_name: str,
     variable_name: str,
@@ -2223,7 +2365,7 @@ def create_variable(
         logger.error(f"create_variable error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def set_blueprint_variable_properties(
     blueprint_name: str,
     variable_name: str,
@@ -2393,7 +2535,7 @@ def set_blueprint_variable_properties(
         logger.error(f"set_blueprint_variable_properties error: {e}")
         return {"success": False, "message": str(e)}
 
-@mcp.tool()
+@threaded_tool()
 def add_event_node(
     blueprint_name: str,
     event_name: str,
@@ -2434,7 +2576,7 @@ def add_event_node(
         return {"success": False, "message": str(e)}
 
 
-@mcp.tool()
+@threaded_tool()
 def delete_node(
     blueprint_name: str,
     node_id: str,
@@ -2471,7 +2613,7 @@ def delete_node(
         return {"success": False, "message": str(e)}
 
 
-@mcp.tool()
+@threaded_tool()
 def set_node_property(
     blueprint_name: str,
     node_id: str,
@@ -2606,7 +2748,7 @@ def set_node_property(
         return {"success": False, "message": str(e)}
 
 
-@mcp.tool()
+@threaded_tool()
 def create_function(
     blueprint_name: str,
     function_name: str,
@@ -2640,7 +2782,7 @@ def create_function(
         return {"success": False, "message": str(e)}
 
 
-@mcp.tool()
+@threaded_tool()
 def add_function_input(
     blueprint_name: str,
     function_name: str,
@@ -2680,7 +2822,7 @@ def add_function_input(
         return {"success": False, "message": str(e)}
 
 
-@mcp.tool()
+@threaded_tool()
 def add_function_output(
     blueprint_name: str,
     function_name: str,
@@ -2720,7 +2862,7 @@ def add_function_output(
         return {"success": False, "message": str(e)}
 
 
-@mcp.tool()
+@threaded_tool()
 def delete_function(
     blueprint_name: str,
     function_name: str
@@ -2751,7 +2893,7 @@ def delete_function(
         return {"success": False, "message": str(e)}
 
 
-@mcp.tool()
+@threaded_tool()
 def rename_function(
     blueprint_name: str,
     old_function_name: str,
@@ -7,6 +7,7 @@
 #include "Dom/JsonValue.h"
 #include "Serialization/JsonSerializer.h"
 #include "Serialization/JsonReader.h"
+#include "Serialization/JsonWriter.h"
 #include "JsonObjectConverter.h"
 #include "Misc/ScopeLock.h"
 #include "HAL/PlatformTime.h"
@@ -53,28 +54,61 @@ uint32 FMCPServerRunnable::Run()
                 ClientSocket->SetSendBufferSize(SocketBufferSize, SocketBufferSize);
                 ClientSocket->SetReceiveBufferSize(SocketBufferSize, SocketBufferSize);
                 
-                uint8 Buffer[8192];
+                // Each message is a 4-byte big-endian length followed by that many bytes of UTF-8 JSON
+                TArray<uint8> MessageBuffer;
                 while (bRunning)
                 {
-                    int32 BytesRead = 0;
-                    if (ClientSocket->Recv(Buffer, sizeof(Buffer) - 1, BytesRead))
+                    uint8 Header[4];
+                    if (!ReceiveExact(Header, sizeof(Header)))
                     {
-                        if (BytesRead == 0)
+                        break;
+                    }
+
+                    const int32 MessageLength = (int32)(((uint32)Header[0] << 24) | ((uint32)Header[1] << 16) | ((uint32)Header[2] << 8) | (uint32)Header[3]);
+                    if (MessageLength <= 0 || MessageLength > MaxMessageSize)
+                    {
+                        UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Invalid message length %d, closing connection"), MessageLength);
+                        break;
+                    }
+
+                    MessageBuffer.SetNumUninitialized(MessageLength + 1, false);
+                    if (!ReceiveExact(MessageBuffer.GetData(), MessageLength))
+                    {
+                        break;
+                    }
+                    MessageBuffer[MessageLength] = '\0';
+
+                    FString Response;
+                    if (MessageBuffer[0] == BinaryBatchSpawnOpcode)
+                    {
+                        // Compact binary batch_spawn frame: skips JSON text parsing for bulk spawns
+                        TSharedPtr<FJsonObject> Params;
+                        FString DecodeError;
+                        if (DecodeBinaryBatchSpawn(MessageBuffer.GetData(), MessageLength, Params, DecodeError))
                         {
-                            UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Client disconnected (zero bytes)"));
-                            break;
+                            UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Executing binary batch_spawn (%d bytes)"), MessageLength);
+                            Response = Bridge->ExecuteCommand(TEXT("batch_spawn"), Params);
                         }
-
-                        // Convert received data to string
-                        Buffer[BytesRead] = '\0';
-                        FString ReceivedText = UTF8_TO_TCHAR(Buffer);
-                        UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Received: %s"), *ReceivedText);
+                        else
+                        {
+                            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: %s"), *DecodeError);
+                            TSharedPtr<FJsonObject> ErrorJson = MakeShared<FJsonObject>();
+                            ErrorJson->SetStringField(TEXT("status"), TEXT("error"));
+                            ErrorJson->SetStringField(TEXT("error"), DecodeError);
+                            TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&Response);
+                            FJsonSerializer::Serialize(ErrorJson.ToSharedRef(), Writer);
+                        }
+                    }
+                    else
+                    {
+                        FString ReceivedText = UTF8_TO_TCHAR((const ANSICHAR*)MessageBuffer.GetData());
+                        UE_LOG(LogTemp, Verbose, TEXT("MCPServerRunnable: Received %d bytes"), MessageLength);
 
                         // Parse JSON
                         TSharedPtr<FJsonObject> JsonObject;
                         TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(ReceivedText);
-                        
-                        if (FJsonSerializer::Deserialize(Reader, JsonObject))
+                    
+                        if (FJsonSerializer::Deserialize(Reader, JsonObject) && JsonObject.IsValid())
                         {
                             // Get command type
                             FString CommandType;
@@ -83,89 +117,27 @@ uint32 FMCPServerRunnable::Run()
                                 UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Executing command: %s"), *CommandType);
 
                                 // Execute command
-                                FString Response = Bridge->ExecuteCommand(CommandType, JsonObject->GetObjectField(TEXT("params")));
+                                Response = Bridge->ExecuteCommand(CommandType, JsonObject->GetObjectField(TEXT("params")));
 
                                 UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Command executed, response length: %d"), Response.Len());
-
-                                // Log response for debugging (truncated for large responses)
-                                FString LogResponse = Response.Len() > 200 ? Response.Left(200) + TEXT("...") : Response;
-                                UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Sending response (%d bytes): %s"),
-                                       Response.Len(), *LogResponse);
-
-                                // Convert to UTF8 once
-                                FTCHARToUTF8 UTF8Response(*Response);
-                                const uint8* DataToSend = (const uint8*)UTF8Response.Get();
-                                int32 TotalDataSize = UTF8Response.Length();
-                                int32 TotalBytesSent = 0;
-                                bool bSuccess = true;
-
-                                // Send all data in a loop (TCP may not send everything at once)
-                                while (TotalBytesSent < TotalDataSize)
-                                {
-                                    int32 BytesSent = 0;
-                                    bool bSendResult = ClientSocket->Send(DataToSend + TotalBytesSent,
-                                                                          TotalDataSize - TotalBytesSent,
-                                                                          BytesSent);
-
-                                    if (!bSendResult)
-                                    {
-                                        int32 LastError = (int32)ISocketSubsystem::Get()->GetLastErrorCode();
-                                        UE_LOG(LogTemp, Error, TEXT("MCPServerRunnable: Failed to send response after %d/%d bytes - Error code: %d"),
-                                               TotalBytesSent, TotalDataSize, LastError);
-                                        bSuccess = false;
-                                        break;
-                                    }
-
-                                    TotalBytesSent += BytesSent;
-                                    UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Sent %d bytes (%d/%d total)"),
-                                           BytesSent, TotalBytesSent, TotalDataSize);
-                                }
-
-                                if (bSuccess)
-                                {
-                                    UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Response sent successfully (%d bytes)"),
-                                           TotalBytesSent);
-                                }
                             }
                             else
                             {
                                 UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Missing 'type' field in command"));
+                                Response = TEXT("{\"status\":\"error\",\"error\":\"Missing 'type' field in command\"}");
                             }
                         }
                         else
                         {
-                            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Failed to parse JSON from: %s"), *ReceivedText);
+                            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Failed to parse JSON message (%d bytes)"), MessageLength);
+                            Response = TEXT("{\"status\":\"error\",\"error\":\"Failed to parse JSON message\"}");
                         }
                     }
-                    else
+
+                    // Every framed request gets exactly one framed reply so the client never waits on a timeout
+                    if (!SendFramedResponse(Response))
                     {
-                        int32 LastError = (int32)ISocketSubsystem::Get()->GetLastErrorCode();
-                        // Don't break the connection for WouldBlock error, which is normal for non-blocking sockets
-                        bool bShouldBreak = true;
-                        
-                        // Check for "would block" error which isn't a real error for non-blocking sockets
-                        if (LastError == SE_EWOULDBLOCK) 
-                        {
-                            UE_LOG(LogTemp, Verbose, TEXT("MCPServerRunnable: Socket would block, continuing..."));
-                            bShouldBreak = false;
-                            // Small sleep to prevent tight loop when no data
-                            FPlatformProcess::Sleep(0.01f);
-                        }
-                        // Check for other transient errors we might want to tolerate
-                        else if (LastError == SE_EINTR) // Interrupted system call
-                        {
-                            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Socket read interrupted, continuing..."));
-                            bShouldBreak = false;
-                        }
-                        else 
-                        {
-                            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Client disconnected or error. Last error code: %d"), LastError);
-                        }
-                        
-                        if (bShouldBreak)
-                        {
-                            break;
-                        }
+                        break;
                     }
                 }
             }
@@ -183,6 +155,231 @@ uint32 FMCPServerRunnable::Run()
     return 0;
 }
 
+bool FMCPServerRunnable::ReceiveExact(uint8* Destination, int32 NumBytes)
+{
+    int32 TotalBytesRead = 0;
+    while (TotalBytesRead < NumBytes)
+    {
+        if (!bRunning)
+        {
+            return false;
+        }
+
+        int32 BytesRead = 0;
+        if (ClientSocket->Recv(Destination + TotalBytesRead, NumBytes - TotalBytesRead, BytesRead))
+        {
+            if (BytesRead == 0)
+            {
+                UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Client disconnected (zero bytes)"));
+                return false;
+            }
+            TotalBytesRead += BytesRead;
+            continue;
+        }
+
+        int32 LastError = (int32)ISocketSubsystem::Get()->GetLastErrorCode();
+        // Check for "would block" error which isn't a real error for non-blocking sockets
+        if (LastError == SE_EWOULDBLOCK)
+        {
+            UE_LOG(LogTemp, Verbose, TEXT("MCPServerRunnable: Socket would block, continuing..."));
+            // Small sleep to prevent tight loop when no data
+            FPlatformProcess::Sleep(0.01f);
+        }
+        // Check for other transient errors we might want to tolerate
+        else if (LastError == SE_EINTR) // Interrupted system call
+        {
+            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Socket read interrupted, continuing..."));
+        }
+        else
+        {
+            UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Client disconnected or error. Last error code: %d"), LastError);
+            return false;
+        }
+    }
+    return true;
+}
+
+bool FMCPServerRunnable::SendFramedResponse(const FString& Response)
+{
+    // Log response for debugging (truncated for large responses)
+    FString LogResponse = Response.Len() > 200 ? Response.Left(200) + TEXT("...") : Response;
+    UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Sending response (%d bytes): %s"),
+           Response.Len(), *LogResponse);
+
+    // Convert to UTF8 once and prepend the 4-byte big-endian length
+    FTCHARToUTF8 UTF8Response(*Response);
+    const int32 PayloadSize = UTF8Response.Length();
+    TArray<uint8> Frame;
+    Frame.SetNumUninitialized(4 + PayloadSize);
+    Frame[0] = (uint8)((PayloadSize >> 24) & 0xFF);
+    Frame[1] = (uint8)((PayloadSize >> 16) & 0xFF);
+    Frame[2] = (uint8)((PayloadSize >> 8) & 0xFF);
+    Frame[3] = (uint8)(PayloadSize & 0xFF);
+    FMemory::Memcpy(Frame.GetData() + 4, UTF8Response.Get(), PayloadSize);
+
+    const uint8* DataToSend = Frame.GetData();
+    int32 TotalDataSize = Frame.Num();
+    int32 TotalBytesSent = 0;
+
+    // Send all data in a loop (TCP may not send everything at once)
+    while (TotalBytesSent < TotalDataSize)
+    {
+        int32 BytesSent = 0;
+        bool bSendResult = ClientSocket->Send(DataToSend + TotalBytesSent,
+                                              TotalDataSize - TotalBytesSent,
+                                              BytesSent);
+
+        if (!bSendResult)
+        {
+            int32 LastError = (int32)ISocketSubsystem::Get()->GetLastErrorCode();
+            UE_LOG(LogTemp, Error, TEXT("MCPServerRunnable: Failed to send response after %d/%d bytes - Error code: %d"),
+                   TotalBytesSent, TotalDataSize, LastError);
+            return false;
+        }
+
+        TotalBytesSent += BytesSent;
+        UE_LOG(LogTemp, Verbose, TEXT("MCPServerRunnable: Sent %d bytes (%d/%d total)"),
+               BytesSent, TotalBytesSent, TotalDataSize);
+    }
+
+    UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Response sent successfully (%d bytes)"),
+           TotalBytesSent);
+    return true;
+}
+
+bool FMCPServerRunnable::DecodeBinaryBatchSpawn(const uint8* Data, int32 Length, TSharedPtr<FJsonObject>& OutParams, FString& OutError)
+{
+    // Layout (little-endian): opcode u8, version u8, flags u8 (bit 0 = auto_unique_name),
+    // mesh count u16 then per mesh [len u16, UTF-8 path], actor count u32 then per actor
+    // [name len u16, UTF-8 name, location 3 x f64, scale 3 x f64, mesh id u16 (0xFFFF = none)].
+    // Version 2 frames are identical except that location and scale are f32.
+    int32 Offset = 0;
+    auto Read = [&](void* Destination, int32 Size) -> bool
+    {
+        if (Size > Length - Offset)
+        {
+            return false;
+        }
+        FMemory::Memcpy(Destination, Data + Offset, Size);
+        Offset += Size;
+        return true;
+    };
+    auto ReadString = [&](FString& OutString) -> bool
+    {
+        uint16 StringLength = 0;
+        if (!Read(&StringLength, sizeof(StringLength)) || StringLength > Length - Offset)
+        {
+            return false;
+        }
+        FUTF8ToTCHAR Converted((const ANSICHAR*)(Data + Offset), StringLength);
+        OutString = FString(Converted.Length(), Converted.Get());
+        Offset += StringLength;
+        return true;
+    };
+    auto MakeVector = [](const double* Values) -> TArray<TSharedPtr<FJsonValue>>
+    {
+        TArray<TSharedPtr<FJsonValue>> Vector;
+        Vector.Reserve(3);
+        for (int32 Axis = 0; Axis < 3; ++Axis)
+        {
+            Vector.Add(MakeShared<FJsonValueNumber>(Values[Axis]));
+        }
+        return Vector;
+    };
+
+    uint8 Header[3];
+    if (!Read(Header, sizeof(Header)))
+    {
+        OutError = TEXT("Truncated binary frame header");
+        return false;
+    }
+    const bool bFloat32Transforms = Header[1] == BinaryBatchSpawnFloat32Version;
+    if (Header[1] != BinaryBatchSpawnVersion && !bFloat32Transforms)
+    {
+        OutError = FString::Printf(TEXT("Unsupported binary batch_spawn version %d"), Header[1]);
+        return false;
+    }
+
+    uint16 MeshCount = 0;
+    if (!Read(&MeshCount, sizeof(MeshCount)))
+    {
+        OutError = TEXT("Truncated binary batch_spawn mesh table");
+        return false;
+    }
+    TArray<TSharedPtr<FJsonValue>> Meshes;
+    Meshes.Reserve(MeshCount);
+    for (uint16 Index = 0; Index < MeshCount; ++Index)
+    {
+        FString MeshPath;
+        if (!ReadString(MeshPath))
+        {
+            OutError = TEXT("Truncated binary batch_spawn mesh table");
+            return false;
+        }
+        Meshes.Add(MakeShared<FJsonValueString>(MeshPath));
+    }
+
+    // Smallest record: empty name length, six transform values and a mesh id
+    const int32 MinRecordSize = sizeof(uint16) + 6 * (bFloat32Transforms ? sizeof(float) : sizeof(double)) + sizeof(uint16);
+    uint32 ActorCount = 0;
+    if (!Read(&ActorCount, sizeof(ActorCount)) || ActorCount > (uint32)((Length - Offset) / MinRecordSize))
+    {
+        OutError = TEXT("Invalid binary batch_spawn actor count");
+        return false;
+    }
+
+    TArray<TSharedPtr<FJsonValue>> Actors;
+    Actors.Reserve(ActorCount);
+    for (uint32 Index = 0; Index < ActorCount; ++Index)
+    {
+        FString Name;
+        double Transform[6];
+        float Transform32[6];
+        uint16 MeshId = BinaryNoMesh;
+        if (!ReadString(Name)
+            || !(bFloat32Transforms ? Read(Transform32, sizeof(Transform32)) : Read(Transform, sizeof(Transform)))
+            || !Read(&MeshId, sizeof(MeshId)))
+        {
+            OutError = FString::Printf(TEXT("Truncated binary batch_spawn record %u"), Index);
+            return false;
+        }
+        if (bFloat32Transforms)
+        {
+            for (int32 Component = 0; Component < 6; ++Component)
+            {
+                Transform[Component] = Transform32[Component];
+            }
+        }
+
+        TSharedPtr<FJsonObject> Spec = MakeShared<FJsonObject>();
+        Spec->SetStringField(TEXT("name"), Name);
+        Spec->SetArrayField(TEXT("location"), MakeVector(Transform));
+        Spec->SetArrayField(TEXT("scale"), MakeVector(Transform + 3));
+        if (MeshId != BinaryNoMesh)
+        {
+            Spec->SetNumberField(TEXT("static_mesh_id"), MeshId);
+        }
+        Actors.Add(MakeShared<FJsonValueObject>(Spec));
+    }
+
+    if (Offset != Length)
+    {
+        OutError = TEXT("Unexpected trailing bytes in binary batch_spawn frame");
+        return false;
+    }
+
+    // Binary records are always static mesh actors
+    TSharedPtr<FJsonObject> Defaults = MakeShared<FJsonObject>();
+    Defaults->SetStringField(TEXT("type"), TEXT("StaticMeshActor"));
+
+    OutParams = MakeShared<FJsonObject>();
+    OutParams->SetArrayField(TEXT("actors"), Actors);
+    OutParams->SetArrayField(TEXT("meshes"), Meshes);
+    OutParams->SetObjectField(TEXT("defaults"), Defaults);
+    OutParams->SetBoolField(TEXT("auto_unique_name"), (Header[2] & 0x01) != 0);
+    return true;
+}
+
 void FMCPServerRunnable::Stop()
 {
     bRunning = false;
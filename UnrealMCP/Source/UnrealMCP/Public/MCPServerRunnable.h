@@ -6,6 +6,7 @@
 #include "Interfaces/IPv4/IPv4Address.h"
 
 class UEpicUnrealMCPBridge;
+class FJsonObject;
 
 /**
  * Runnable class for the MCP server thread
@@ -26,9 +27,25 @@ protected:
 	void HandleClientConnection(TSharedPtr<FSocket> ClientSocket);
 	void ProcessMessage(TSharedPtr<FSocket> Client, const FString& Message);
 
+	// Length-prefixed framing helpers for the accepted client socket
+	bool ReceiveExact(uint8* Destination, int32 NumBytes);
+	bool SendFramedResponse(const FString& Response);
+
+	// Decodes a binary batch_spawn frame into the params object HandleBatchSpawn expects
+	static bool DecodeBinaryBatchSpawn(const uint8* Data, int32 Length, TSharedPtr<FJsonObject>& OutParams, FString& OutError);
+
 private:
 	UEpicUnrealMCPBridge* Bridge;
 	TSharedPtr<FSocket> ListenerSocket;
 	TSharedPtr<FSocket> ClientSocket;
 	bool bRunning;
+
+	// Upper bound for a single framed message, guards against corrupt length headers
+	static constexpr int32 MaxMessageSize = 64 * 1024 * 1024;
+
+	// Binary frames start with this opcode instead of '{'; the version byte follows it
+	static constexpr uint8 BinaryBatchSpawnOpcode = 0x01;
+	static constexpr uint8 BinaryBatchSpawnVersion = 1;
+	static constexpr uint8 BinaryBatchSpawnFloat32Version = 2;
+	static constexpr uint16 BinaryNoMesh = 0xFFFF;
 }; 
\ No newline at end of file